@@ -8,6 +8,7 @@ Hive, and Impala with Kerberos authentication.
 
 import argparse
 import asyncio
+import functools
 import os
 import signal
 import sys
@@ -19,13 +20,8 @@ from .server import OpenDBServer, ServerOptions
 from .utils.logger import configure_root_logger, logger
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(
-        prog=SERVER_NAME,
-        description="Multi-database MCP server supporting PostgreSQL, MySQL, MariaDB, Hive, and Impala.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+# Help epilog, formatted once at import
+_EPILOG = f"""
 USAGE:
   {SERVER_NAME} [OPTIONS]
 
@@ -62,7 +58,17 @@ CLAUDE DESKTOP INTEGRATION:
   }}
 
 For more information, see: https://github.com/anthropics/opendb-mcp
-""",
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser (cached per process)."""
+    parser = argparse.ArgumentParser(
+        prog=SERVER_NAME,
+        description="Multi-database MCP server supporting PostgreSQL, MySQL, MariaDB, Hive, and Impala.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
@@ -79,6 +85,12 @@ For more information, see: https://github.com/anthropics/opendb-mcp
         help="Database DSN for single-database mode",
     )
 
+    parser.add_argument(
+        "--config-cache",
+        action="store_true",
+        help="Cache the parsed TOML file next to it (environment values are never cached)",
+    )
+
     parser.add_argument(
         "-v",
         "--version",
@@ -94,7 +106,12 @@ For more information, see: https://github.com/anthropics/opendb-mcp
         help="Path to TOML configuration file (alternative to --config)",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    return build_parser().parse_args()
 
 
 async def run_server(server: OpenDBServer) -> None:
@@ -114,20 +131,18 @@ async def run_server(server: OpenDBServer) -> None:
     try:
         # Start server in background task
         server_task = asyncio.create_task(server.start())
+        stop_task = asyncio.create_task(stop_event.wait())
 
         # Wait for either server to complete or stop signal
         done, pending = await asyncio.wait(
-            [server_task, asyncio.create_task(stop_event.wait())],
+            {server_task, stop_task},
             return_when=asyncio.FIRST_COMPLETED,
         )
 
-        # Cancel pending tasks
+        # Cancel whichever task is still pending
         for task in pending:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        await asyncio.gather(*pending, return_exceptions=True)
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
@@ -154,15 +169,15 @@ def main() -> None:
     try:
         # Load configuration
         if config_path:
-            logger.info(f"Loading configuration from {config_path}")
-            config = load_config(config_path)
+            logger.info("Loading configuration from %s", config_path)
+            config = load_config(config_path, use_cache=args.config_cache)
         elif dsn:
             logger.info("Using single-database mode with DSN")
             config = create_config_from_dsn(dsn)
         else:
             raise ValueError("No configuration provided")
 
-        logger.info(f"Configured {len(config.sources)} database source(s)")
+        logger.info("Configured %d database source(s)", len(config.sources))
 
         # Determine transport from environment
         transport_env = os.environ.get("TRANSPORT", "stdio").lower()
@@ -186,7 +201,7 @@ def main() -> None:
         sys.exit(0)
 
     except Exception as e:
-        logger.error("Failed to start server", e)
+        logger.error("Failed to start server", meta=e)
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
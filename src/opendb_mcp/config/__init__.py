@@ -2,7 +2,7 @@
 Configuration module for OpenDB MCP Server.
 """
 
-from .keytab import KeytabError, process_keytab_contents
+from .keytab import KeytabError, process_keytab_content, process_keytab_contents
 from .loader import create_config_from_dsn, load_config
 from .types import (
     AuthMechanism,
@@ -31,5 +31,6 @@ __all__ = [
     "OpenDBConfig",
     "ParsedConfig",
     "KeytabError",
+    "process_keytab_content",
     "process_keytab_contents",
 ]
@@ -5,6 +5,8 @@ Handles decoding base64-encoded keytab content and writing keytab files.
 """
 
 import base64
+import hashlib
+import os
 import stat
 from pathlib import Path
 
@@ -12,6 +14,10 @@ from ..utils.errors import ConfigurationError
 from ..utils.logger import logger
 
 
+# Keytab file permissions: 755 (owner read/write/execute, group and others read/execute)
+KEYTAB_FILE_MODE = stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH
+
+
 class KeytabError(ConfigurationError):
     """Error related to keytab processing."""
 
@@ -54,30 +60,104 @@ def write_keytab_file(keytab_bytes: bytes, keytab_dir: Path, source_id: str) ->
         KeytabError: If writing fails
     """
     try:
-        # Create keytab directory if it doesn't exist
-        keytab_dir.mkdir(parents=True, exist_ok=True)
-
         keytab_path = keytab_dir / f"{source_id}.keytab"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+        # Open with the final mode; the directory is only created when it's missing
+        try:
+            fd = os.open(keytab_path, flags, KEYTAB_FILE_MODE)
+        except FileNotFoundError:
+            keytab_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(keytab_path, flags, KEYTAB_FILE_MODE)
 
-        # Write the keytab file
-        keytab_path.write_bytes(keytab_bytes)
+        with os.fdopen(fd, "wb") as f:
+            f.write(keytab_bytes)
 
-        # Set permissions to 755 (owner read/write/execute, group and others read/execute)
-        keytab_path.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+            # The creation mode is masked by the umask and not applied to existing files
+            if os.chmod in os.supports_fd:
+                os.chmod(f.fileno(), KEYTAB_FILE_MODE)
+            else:
+                keytab_path.chmod(KEYTAB_FILE_MODE)
 
-        logger.info(f"Wrote keytab file for source '{source_id}': {keytab_path}")
+        logger.info("Wrote keytab file for source '%s': %s", source_id, keytab_path)
         return keytab_path
 
     except Exception as e:
         raise KeytabError(f"Failed to write keytab file for source '{source_id}': {e}")
 
 
+def keytab_fingerprint(keytab_content: str) -> str:
+    """Get the SHA-256 fingerprint of base64-encoded keytab content."""
+    return hashlib.sha256(keytab_content.encode("utf-8")).hexdigest()
+
+
+def is_keytab_current(keytab_path: Path, fingerprint_path: Path, fingerprint: str) -> bool:
+    """Check if a previously written keytab file matches the given fingerprint.
+
+    The fingerprint file records the content fingerprint and the SHA-256 of the
+    keytab bytes written for it. The keytab is hashed again here (it is tiny), so
+    a truncated or externally modified file is treated as stale.
+    """
+    try:
+        recorded = fingerprint_path.read_text().split()
+        keytab_bytes = keytab_path.read_bytes()
+    except OSError:
+        return False
+    return recorded == [fingerprint, hashlib.sha256(keytab_bytes).hexdigest()]
+
+
+def process_keytab_content(source: dict, keytab_dir: Path) -> None:
+    """
+    Process the keytab_content field of a single source configuration.
+
+    For Hive/Impala sources with keytab_content, decodes the base64 content,
+    writes it to a keytab file, and updates the source config in place with the
+    file path. SHA-256 fingerprints of the content and of the written file are
+    stored next to each keytab so unchanged keytabs are not decoded and rewritten
+    on every start.
+
+    Args:
+        source: Source configuration dictionary (updated in place)
+        keytab_dir: Directory the keytab file is written to
+
+    Raises:
+        KeytabError: If keytab processing fails
+    """
+    source_type = source.get("type")
+    keytab_content = source.get("keytab_content")
+
+    # Only process Hive/Impala sources with keytab_content
+    if source_type not in ("hive", "impala") or not keytab_content:
+        return
+
+    source_id = source.get("id", "unknown")
+    keytab_path = keytab_dir / f"{source_id}.keytab"
+    fingerprint_path = keytab_dir / f"{source_id}.keytab.sha256"
+    fingerprint = keytab_fingerprint(keytab_content)
+
+    if is_keytab_current(keytab_path, fingerprint_path, fingerprint):
+        logger.debug("Keytab file for source '%s' is up to date: %s", source_id, keytab_path)
+    else:
+        # Decode and write the keytab, then record its fingerprint
+        keytab_bytes = decode_keytab_content(keytab_content, source_id)
+        keytab_path = write_keytab_file(keytab_bytes, keytab_dir, source_id)
+        try:
+            fingerprint_path.write_text(
+                f"{fingerprint} {hashlib.sha256(keytab_bytes).hexdigest()}"
+            )
+        except OSError as e:
+            logger.warning("Failed to write keytab fingerprint for source '%s': %s", source_id, e)
+
+    # Update the source config with the file path
+    # keytab_content takes precedence over keytab
+    source["keytab"] = str(keytab_path)
+
+
 def process_keytab_contents(sources_data: list[dict], config_dir: Path) -> list[dict]:
     """
     Process keytab_content fields in source configurations.
 
-    For Hive/Impala sources with keytab_content, decodes the base64 content,
-    writes it to a keytab file, and updates the source config with the file path.
+    See process_keytab_content for the per-source behavior.
 
     Args:
         sources_data: List of source configuration dictionaries
@@ -92,19 +172,6 @@ def process_keytab_contents(sources_data: list[dict], config_dir: Path) -> list[
     keytab_dir = config_dir / "keytabs"
 
     for source in sources_data:
-        source_type = source.get("type")
-        keytab_content = source.get("keytab_content")
-
-        # Only process Hive/Impala sources with keytab_content
-        if source_type in ("hive", "impala") and keytab_content:
-            source_id = source.get("id", "unknown")
-
-            # Decode and write the keytab
-            keytab_bytes = decode_keytab_content(keytab_content, source_id)
-            keytab_path = write_keytab_file(keytab_bytes, keytab_dir, source_id)
-
-            # Update the source config with the file path
-            # keytab_content takes precedence over keytab
-            source["keytab"] = str(keytab_path)
+        process_keytab_content(source, keytab_dir)
 
     return sources_data
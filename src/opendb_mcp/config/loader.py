@@ -2,85 +2,144 @@
 TOML configuration loader with environment variable substitution.
 """
 
+import hashlib
+import json
 import os
 import stat
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-from ..constants import ENV_VAR_PATTERN
 from ..utils.logger import logger
-from .keytab import process_keytab_contents
+from .keytab import process_keytab_content
 from .types import ParsedConfig, Settings, parse_source_config
 
-# Use tomllib for Python 3.11+, tomli for earlier versions
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib
-    except ImportError as err:
-        raise ImportError(
-            "tomli is required for Python < 3.11. Install with: pip install tomli"
-        ) from err
+# Suffix of the parsed-config cache written next to the TOML file
+CONFIG_CACHE_SUFFIX = ".cache.json"
 
+# DSN scheme -> database type for single-database mode
+DSN_SCHEMES = {
+    "postgres": "postgres",
+    "postgresql": "postgres",
+    "mysql": "mysql",
+    "mariadb": "mariadb",
+}
 
-def substitute_env_vars(value: str) -> str:
+def _import_tomllib() -> Any:
     """
-    Substitute environment variables in a string.
+    Import the TOML parser on first use.
 
-    Format: ${VAR_NAME} or ${VAR_NAME:-default}
+    Deferred so that DSN-only startup never pays for loading the parser.
+    Uses tomllib for Python 3.11+, tomli for earlier versions.
     """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError as err:
+            raise ImportError(
+                "tomli is required for Python < 3.11. Install with: pip install tomli"
+            ) from err
 
-    def replacer(match: Any) -> str:
-        var_expression = match.group(1)
+    return tomllib
 
-        if ":-" in var_expression:
-            var_name, default_value = var_expression.split(":-", 1)
-        else:
-            var_name = var_expression
-            default_value = None
 
-        env_value = os.environ.get(var_name)
+def _resolve_env_var(var_expression: str, placeholder: str) -> str:
+    """Resolve a single VAR_NAME or VAR_NAME:-default expression."""
+    var_name, separator, default_value = var_expression.partition(":-")
 
-        if env_value is not None:
-            return env_value
+    env_value = os.environ.get(var_name)
 
-        if default_value is not None:
-            return default_value
+    if env_value is not None:
+        return env_value
 
-        logger.warning(f"Environment variable {var_name} is not set and has no default")
-        return match.group(0)  # Return original if no substitution
+    if separator:
+        return default_value
 
-    return ENV_VAR_PATTERN.sub(replacer, value)
+    logger.warning("Environment variable %s is not set and has no default", var_name)
+    return placeholder  # Return original if no substitution
+
+
+def substitute_env_vars(value: str) -> str:
+    """
+    Substitute environment variables in a string.
+
+    Format: ${VAR_NAME} or ${VAR_NAME:-default}
+    """
+    # Most config strings have no placeholder, skip the regex entirely for them
+    if "${" not in value:
+        return value
+
+    # Scan with str.find rather than ENV_VAR_PATTERN.sub to avoid per-match callbacks
+    parts: list[str] = []
+    pos = 0
+
+    while True:
+        start = value.find("${", pos)
+        if start < 0:
+            break
+
+        end = value.find("}", start + 2)
+        if end < 0:
+            break
+
+        if end == start + 2:
+            # "${}" is not a placeholder, keep it as-is
+            parts.append(value[pos : end + 1])
+        else:
+            parts.append(value[pos:start])
+            parts.append(_resolve_env_var(value[start + 2 : end], value[start : end + 1]))
+
+        pos = end + 1
+
+    parts.append(value[pos:])
+    return "".join(parts)
 
 
 def substitute_env_vars_in_object(obj: Any) -> Any:
-    """Recursively substitute environment variables in an object."""
+    """
+    Substitute environment variables in an object.
+
+    Dicts and lists are walked iteratively and updated in place.
+    """
     if isinstance(obj, str):
         return substitute_env_vars(obj)
 
-    if isinstance(obj, list):
-        return [substitute_env_vars_in_object(item) for item in obj]
+    stack: list[Any] = [obj]
+
+    while stack:
+        container = stack.pop()
 
-    if isinstance(obj, dict):
-        return {key: substitute_env_vars_in_object(value) for key, value in obj.items()}
+        if isinstance(container, dict):
+            items: Any = container.items()
+        elif isinstance(container, list):
+            items = enumerate(container)
+        else:
+            continue
+
+        for key, value in items:
+            if isinstance(value, str):
+                container[key] = substitute_env_vars(value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
 
     return obj
 
 
 def validate_keytab(keytab_path: str) -> None:
     """Validate keytab file exists and has appropriate permissions."""
-    resolved_path = Path(keytab_path).resolve()
-
-    if not resolved_path.exists():
-        raise FileNotFoundError(f"Keytab file not found: {resolved_path}")
+    # A single stat covers both the existence and the permission check
+    try:
+        mode = os.stat(keytab_path).st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Keytab file not found: {Path(keytab_path).resolve()}") from None
 
     # Check file permissions (should not be world-readable)
-    mode = resolved_path.stat().st_mode
     if mode & stat.S_IROTH:  # World-readable
         logger.warning(
-            f"Keytab file {resolved_path} is world-readable. Consider restricting permissions."
+            "Keytab file %s is world-readable. Consider restricting permissions.",
+            os.path.abspath(keytab_path),
         )
 
 
@@ -99,18 +158,89 @@ def validate_krb5_conf(krb5_conf_path: str, config_dir: Path) -> str:
     return str(resolved_path)
 
 
-def load_config(config_path: str) -> ParsedConfig:
-    """Load and parse a TOML configuration file."""
-    resolved_path = Path(config_path).resolve()
+def get_config_cache_path(config_path: Path) -> Path:
+    """Get the path of the parsed-config cache for a configuration file."""
+    return config_path.with_name(config_path.name + CONFIG_CACHE_SUFFIX)
 
-    if not resolved_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {resolved_path}")
 
-    with open(resolved_path, "rb") as f:
-        try:
-            parsed = tomllib.load(f)
-        except Exception as e:
-            raise ValueError(f"Failed to parse TOML: {e}") from e
+def _config_fingerprint(raw: bytes, file_stat: os.stat_result) -> str:
+    """Fingerprint a configuration file (contents, mtime and size) for cache validation."""
+    digest = hashlib.blake2b(raw)
+    digest.update(f"{file_stat.st_mtime_ns}:{file_stat.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _read_config_cache(cache_path: Path, fingerprint: str) -> Optional[dict[str, Any]]:
+    """Return the cached TOML data if it matches the fingerprint."""
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["fingerprint"] != fingerprint:
+            return None
+        data = cached["toml"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable config cache %s: %s", cache_path, e)
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def _write_config_cache(cache_path: Path, fingerprint: str, data: dict[str, Any]) -> None:
+    """Atomically write the parsed TOML cache (owner-only permissions)."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": fingerprint, "toml": data}, f)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+
+
+def _parse_toml(raw: bytes) -> dict[str, Any]:
+    """Parse TOML file contents."""
+    tomllib = _import_tomllib()
+    try:
+        parsed: dict[str, Any] = tomllib.loads(raw.decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"Failed to parse TOML: {e}") from e
+    return parsed
+
+
+def load_config(config_path: str, use_cache: bool = False) -> ParsedConfig:
+    """
+    Load and parse a TOML configuration file.
+
+    With use_cache, the parsed TOML is cached next to the file and reused while
+    the file is unchanged. Only the raw file data is cached: environment
+    variables are substituted and sources validated on every load, so secrets
+    from the environment never reach the cache.
+    """
+    # abspath normalizes without touching the filesystem; only a symlinked config
+    # file is resolved, so relative paths stay relative to the real file
+    resolved_path = Path(os.path.abspath(config_path))
+    if resolved_path.is_symlink():
+        resolved_path = resolved_path.resolve()
+
+    try:
+        with open(resolved_path, "rb") as f:
+            file_stat = os.fstat(f.fileno())
+            raw = f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {resolved_path}") from None
+
+    if use_cache:
+        cache_path = get_config_cache_path(resolved_path)
+        fingerprint = _config_fingerprint(raw, file_stat)
+        parsed = _read_config_cache(cache_path, fingerprint)
+        if parsed is None:
+            parsed = _parse_toml(raw)
+            _write_config_cache(cache_path, fingerprint, parsed)
+        else:
+            logger.debug("Using cached TOML data: %s", cache_path)
+    else:
+        parsed = _parse_toml(raw)
 
     # Substitute environment variables
     substituted = substitute_env_vars_in_object(parsed)
@@ -121,10 +251,8 @@ def load_config(config_path: str) -> ParsedConfig:
 
     # Parse sources
     sources_data = substituted.get("sources", [])
-
-    # Process keytab_content fields (decode base64 and write keytab files)
     config_dir = resolved_path.parent
-    sources_data = process_keytab_contents(sources_data, config_dir)
+    keytab_dir = config_dir / "keytabs"
     sources: dict[str, Any] = {}
 
     for source_data in sources_data:
@@ -138,6 +266,9 @@ def load_config(config_path: str) -> ParsedConfig:
         # Validate keytab and krb5_conf for Kerberos sources
         source_type = source_data.get("type")
         if source_type in ("hive", "impala"):
+            # Process keytab_content (decode base64 and write the keytab file)
+            process_keytab_content(source_data, keytab_dir)
+
             auth_mechanism = source_data.get("auth_mechanism")
             keytab = source_data.get("keytab")
             if auth_mechanism == "KERBEROS" and keytab:
@@ -157,16 +288,11 @@ def load_config(config_path: str) -> ParsedConfig:
 
 def create_config_from_dsn(dsn: str) -> ParsedConfig:
     """Create a configuration from a DSN string for single-database mode."""
-    # Determine database type from DSN prefix
-    dsn_lower = dsn.lower()
-
-    if dsn_lower.startswith(("postgres://", "postgresql://")):
-        db_type = "postgres"
-    elif dsn_lower.startswith("mysql://"):
-        db_type = "mysql"
-    elif dsn_lower.startswith("mariadb://"):
-        db_type = "mariadb"
-    else:
+    # Determine database type from the DSN scheme only (the body may be long and hold secrets)
+    scheme, separator, _ = dsn.partition("://")
+    db_type = DSN_SCHEMES.get(scheme.lower()) if separator else None
+
+    if db_type is None:
         raise ValueError(
             "Unsupported DSN format. Expected postgres://, postgresql://, mysql://, or mariadb://"
         )
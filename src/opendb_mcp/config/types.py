@@ -4,7 +4,7 @@ Pydantic models for configuration validation.
 
 from typing import Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 DatabaseType = Literal["postgres", "mysql", "mariadb", "hive", "impala"]
 AuthMechanism = Literal["NONE", "PLAIN", "KERBEROS"]
@@ -13,7 +13,9 @@ ObjectType = Literal["schema", "table", "column", "index", "procedure"]
 
 
 class BaseSourceConfig(BaseModel):
-    """Base configuration for all database sources."""
+    """Base configuration for all database sources (immutable once parsed)."""
+
+    model_config = ConfigDict(frozen=True)
 
     id: str = Field(..., description="Unique identifier for this source")
     type: DatabaseType = Field(..., description="Database type")
@@ -69,6 +71,26 @@ class Settings(BaseModel):
     connection_timeout: Optional[int] = Field(
         10, description="Connection timeout in seconds", ge=1
     )
+    pool_min: int = Field(1, description="Connections opened per pooled source at startup", ge=0)
+    pool_max: int = Field(5, description="Maximum connections per pooled source", ge=1)
+    pool_max_queries: int = Field(
+        50000, description="Queries before a PostgreSQL connection is replaced", ge=1
+    )
+    pool_max_inactive_lifetime: float = Field(
+        300.0, description="Idle seconds before a PostgreSQL connection closes", ge=0
+    )
+    statement_cache_size: int = Field(
+        1024, description="Prepared statements cached per PostgreSQL connection", ge=0
+    )
+    schema_cache_ttl: float = Field(
+        60.0, description="Seconds to reuse schema search results (0 disables)", ge=0
+    )
+    result_cache_ttl: float = Field(
+        0, description="Seconds to reuse identical read query results (0 disables)", ge=0
+    )
+    result_cache_size: int = Field(
+        256, description="Maximum read query results cached per source", ge=1
+    )
 
     @field_validator("max_rows")
     @classmethod
@@ -79,6 +101,12 @@ class Settings(BaseModel):
             return 100000
         return v
 
+    @model_validator(mode="after")
+    def validate_pool_bounds(self) -> "Settings":
+        if self.pool_min > self.pool_max:
+            raise ValueError("pool_min must not be greater than pool_max")
+        return self
+
 
 class OpenDBConfig(BaseModel):
     """Raw configuration as loaded from TOML."""
@@ -88,21 +116,23 @@ class OpenDBConfig(BaseModel):
 
 
 class ParsedConfig(BaseModel):
-    """Parsed and validated configuration."""
+    """Parsed and validated configuration (immutable once parsed)."""
 
-    model_config = {"arbitrary_types_allowed": True}
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     settings: Settings
     sources: dict[str, SourceConfig] = Field(default_factory=dict)
 
 
+# Fields whose presence marks a Hive/Impala source as a Kerberos config
+_KERBEROS_FIELDS = frozenset(("auth_mechanism", "keytab", "keytab_content", "principal"))
+
+
 def parse_source_config(data: dict) -> SourceConfig:
     """Parse a source configuration dictionary into the appropriate model."""
-    source_type = data.get("type")
-
-    if source_type in ("hive", "impala"):
+    if data.get("type") in ("hive", "impala"):
         # Check if it's a Kerberos config
-        if "auth_mechanism" in data or "keytab" in data or "keytab_content" in data or "principal" in data:
+        if not _KERBEROS_FIELDS.isdisjoint(data):
             return KerberosSourceConfig(**data)
         # Fall through to host-based if no Kerberos fields
         if "host" in data:
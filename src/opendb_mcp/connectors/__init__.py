@@ -2,16 +2,46 @@
 Database connectors module for OpenDB MCP Server.
 """
 
-from typing import Any
+import asyncio
+import dataclasses
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from ..config.types import ParsedConfig, SourceConfig
 from ..utils.formatters import SourceInfo
 from ..utils.logger import logger
-from .base import BaseConnector, ConnectorOptions, ExecuteOptions, SchemaSearchOptions
-from .hive import HiveConnector
-from .impala import ImpalaConnector
-from .mysql import MySqlConnector
-from .postgres import PostgresConnector
+from .base import (
+    BaseConnector,
+    BatchExecutor,
+    ConnectorOptions,
+    ExecuteOptions,
+    SchemaSearchOptions,
+)
+
+if TYPE_CHECKING:
+    from .hive import HiveConnector
+    from .impala import ImpalaConnector
+    from .mysql import MySqlConnector
+    from .postgres import PostgresConnector
+
+# Connector classes are imported on first use so unused database drivers are never loaded
+_LAZY_CONNECTORS = {
+    "PostgresConnector": ".postgres",
+    "MySqlConnector": ".mysql",
+    "HiveConnector": ".hive",
+    "ImpalaConnector": ".impala",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import connector classes on attribute access (PEP 562)."""
+    module_name = _LAZY_CONNECTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    connector_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = connector_class
+    return connector_class
 
 
 class ConnectorManager:
@@ -19,39 +49,66 @@ class ConnectorManager:
 
     def __init__(self, config: ParsedConfig):
         self._connectors: dict[str, BaseConnector] = {}
+        self._connect_locks: dict[str, asyncio.Lock] = {}
         self._global_options = ConnectorOptions(
             readonly=config.settings.readonly,
             max_rows=config.settings.max_rows,
             query_timeout=config.settings.query_timeout,
             connection_timeout=config.settings.connection_timeout,
+            pool_min=config.settings.pool_min,
+            pool_max=config.settings.pool_max,
+            pool_max_queries=config.settings.pool_max_queries,
+            pool_max_inactive_lifetime=config.settings.pool_max_inactive_lifetime,
+            statement_cache_size=config.settings.statement_cache_size,
+            schema_cache_ttl=config.settings.schema_cache_ttl,
+            result_cache_ttl=config.settings.result_cache_ttl,
+            result_cache_size=config.settings.result_cache_size,
         )
+        self._options_by_readonly: dict[bool, ConnectorOptions] = {
+            self._global_options.readonly: self._global_options
+        }
 
         # Create connectors for all sources
         for source_id, source_config in config.sources.items():
             connector = self._create_connector(source_config)
             self._connectors[source_id] = connector
 
+        # Sources are fixed after startup, so the default connector is resolved once
+        self._default_connector = self.get_default()
+
+    def _get_options(self, readonly: bool) -> ConnectorOptions:
+        """Get the shared connector options for a readonly mode."""
+        options = self._options_by_readonly.get(readonly)
+        if options is None:
+            options = dataclasses.replace(self._global_options, readonly=readonly)
+            self._options_by_readonly[readonly] = options
+        return options
+
     def _create_connector(self, config: SourceConfig) -> BaseConnector:
         """Factory method to create appropriate connector by type."""
         # Source-level readonly overrides global
         readonly = config.readonly if config.readonly is not None else self._global_options.readonly
 
-        options = ConnectorOptions(
-            readonly=readonly,
-            max_rows=self._global_options.max_rows,
-            query_timeout=self._global_options.query_timeout,
-            connection_timeout=self._global_options.connection_timeout,
-        )
+        # Only readonly can differ between sources, so connectors share options objects
+        options = self._get_options(readonly)
 
         source_type = config.type
 
         if source_type == "postgres":
+            from .postgres import PostgresConnector
+
             return PostgresConnector(config, options)
         elif source_type in ("mysql", "mariadb"):
+            from .mysql import MySqlConnector
+
             return MySqlConnector(config, options)
         elif source_type == "hive":
+            from .hive import HiveConnector
+
             return HiveConnector(config, options)
         elif source_type == "impala":
+            from .impala import ImpalaConnector
+
             return ImpalaConnector(config, options)
         else:
             raise ValueError(f"Unsupported database type: {source_type}")
@@ -75,7 +132,7 @@ class ConnectorManager:
                 raise ValueError(f"Unknown source: {source_id}. Available sources: {available}")
             return connector
 
-        default_connector = self.get_default()
+        default_connector = self._default_connector
         if not default_connector:
             available = ", ".join(self.list_source_ids())
             raise ValueError(
@@ -83,6 +140,20 @@ class ConnectorManager:
             )
         return default_connector
 
+    async def resolve_connected(self, source_id: str | None = None) -> BaseConnector:
+        """Resolve a connector like resolve(), connecting it first if needed.
+
+        Concurrent requests for a source that is not connected yet share a
+        single connect() instead of each opening their own pool.
+        """
+        connector = self.resolve(source_id)
+        if not connector.is_connected:
+            lock = self._connect_locks.setdefault(connector.source_id, asyncio.Lock())
+            async with lock:
+                if not connector.is_connected:
+                    await connector.connect()
+        return connector
+
     def list_source_ids(self) -> list[str]:
         """List all source IDs."""
         return list(self._connectors.keys())
@@ -107,27 +178,33 @@ class ConnectorManager:
         await connector.connect()
 
     async def connect_all(self) -> None:
-        """Connect to all sources."""
+        """Connect to all sources concurrently."""
         errors: list[tuple[str, Exception]] = []
 
-        for source_id, connector in self._connectors.items():
-            try:
-                await connector.connect()
-            except Exception as e:
-                errors.append((source_id, e))
-                logger.error(f"Failed to connect to {source_id}: {e}")
+        results = await asyncio.gather(
+            *(connector.connect() for connector in self._connectors.values()),
+            return_exceptions=True,
+        )
+
+        for source_id, result in zip(self._connectors, results):
+            if isinstance(result, Exception):
+                errors.append((source_id, result))
+                logger.error("Failed to connect to %s: %s", source_id, result)
 
         if errors and len(errors) == len(self._connectors):
             error_msgs = "; ".join(f"{sid}: {e}" for sid, e in errors)
             raise RuntimeError(f"Failed to connect to all sources: {error_msgs}")
 
     async def disconnect_all(self) -> None:
-        """Disconnect from all sources."""
-        for source_id, connector in self._connectors.items():
-            try:
-                await connector.disconnect()
-            except Exception as e:
-                logger.error(f"Failed to disconnect from {source_id}: {e}")
+        """Disconnect from all sources concurrently."""
+        results = await asyncio.gather(
+            *(connector.disconnect() for connector in self._connectors.values()),
+            return_exceptions=True,
+        )
+
+        for source_id, result in zip(self._connectors, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to disconnect from %s: %s", source_id, result)
 
     @property
     def size(self) -> int:
@@ -138,6 +215,7 @@ class ConnectorManager:
 __all__ = [
     "ConnectorManager",
     "BaseConnector",
+    "BatchExecutor",
     "ConnectorOptions",
     "ExecuteOptions",
     "SchemaSearchOptions",
@@ -2,25 +2,114 @@
 Abstract base connector class.
 """
 
+import asyncio
+import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 
 from ..config.types import SourceConfig
-from ..constants import DEFAULT_MAX_ROWS, DEFAULT_QUERY_TIMEOUT, WRITE_KEYWORDS
+from ..constants import (
+    DEFAULT_MAX_ROWS,
+    DEFAULT_POOL_MAX_INACTIVE_LIFETIME,
+    DEFAULT_POOL_MAX_QUERIES,
+    DEFAULT_POOL_MAX_SIZE,
+    DEFAULT_POOL_MIN_SIZE,
+    DEFAULT_QUERY_TIMEOUT,
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    RESULT_CACHE_MAX_ENTRIES,
+    SCHEMA_CACHE_MAX_ENTRIES,
+    SCHEMA_CACHE_TTL,
+    WRITE_KEYWORDS,
+)
+from ..utils.cache import QueryResultCache
 from ..utils.errors import QueryError
 from ..utils.formatters import QueryResult, SchemaObject
 from ..utils.logger import logger
 
+# Precompiled SQL classifiers, matched against the original SQL to avoid an uppercase copy.
+# Write keywords are matched as a prefix rather than a whitespace-split token, so
+# statements like "DELETE/**/FROM t" are still treated as writes.
+_WRITE_QUERY_RE = re.compile(
+    r"\s*(?:" + "|".join(sorted(WRITE_KEYWORDS)) + ")", re.IGNORECASE
+)
+_SELECT_QUERY_RE = re.compile(r"\s*SELECT", re.IGNORECASE)
+_ROW_LIMIT_RE = re.compile(r"\s(?:LIMIT|TOP|FETCH)\s", re.IGNORECASE)
+_READ_QUERY_RE = re.compile(r"\s*(?:SELECT|SHOW|DESCRIBE)\b", re.IGNORECASE)
 
-@dataclass
+
+def _classify(sql: str) -> tuple[bool, bool]:
+    """Classify a query as (is_write, is_select_without_limit)."""
+    is_write = _WRITE_QUERY_RE.match(sql) is not None
+    is_select_without_limit = (
+        _SELECT_QUERY_RE.match(sql) is not None and _ROW_LIMIT_RE.search(sql) is None
+    )
+    return is_write, is_select_without_limit
+
+
+def _is_select(sql: str) -> bool:
+    """Check if a query is a SELECT statement."""
+    return _SELECT_QUERY_RE.match(sql) is not None
+
+
+def _is_cacheable_read(sql: str) -> bool:
+    """Check if a query only reads data, so its result may be reused."""
+    return _READ_QUERY_RE.match(sql) is not None
+
+
+def _limit_query(sql: str, max_rows: int) -> str:
+    """Append a LIMIT clause to SELECT queries that don't already limit rows."""
+    if not _classify(sql)[1]:
+        return sql
+    return f"{sql.strip()} LIMIT {max_rows}"
+
+
+# Search text that can be inlined into a SHOW ... LIKE clause without escaping
+_SHOW_LIKE_SAFE_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _search_regex(pattern: str) -> Optional["re.Pattern[str]"]:
+    """Compile a %-style search pattern into a case-insensitive substring regex.
+
+    Returns None when the pattern matches every name.
+    """
+    needle = pattern.replace("%", "")
+    if not needle:
+        return None
+    return re.compile(re.escape(needle), re.IGNORECASE)
+
+
+def _show_like_clause(pattern: str) -> Optional[str]:
+    """Translate a %-style search pattern into a Hive/Impala SHOW ... LIKE clause.
+
+    Returns "" when there is nothing to filter, or None when the pattern
+    cannot be inlined safely and must be filtered client-side instead.
+    """
+    needle = pattern.replace("%", "")
+    if not needle:
+        return ""
+    if _SHOW_LIKE_SAFE_RE.fullmatch(needle):
+        return f" LIKE '*{needle}*'"
+    return None
+
+
+@dataclass(frozen=True)
 class ConnectorOptions:
-    """Options for database connectors."""
+    """Options for database connectors (immutable, shared between connectors)."""
 
     readonly: bool = False
     max_rows: int = DEFAULT_MAX_ROWS
     query_timeout: Optional[int] = DEFAULT_QUERY_TIMEOUT
     connection_timeout: Optional[int] = None
+    pool_min: int = DEFAULT_POOL_MIN_SIZE
+    pool_max: int = DEFAULT_POOL_MAX_SIZE
+    pool_max_queries: int = DEFAULT_POOL_MAX_QUERIES
+    pool_max_inactive_lifetime: float = DEFAULT_POOL_MAX_INACTIVE_LIFETIME
+    statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE
+    schema_cache_ttl: float = SCHEMA_CACHE_TTL
+    result_cache_ttl: float = 0
+    result_cache_size: int = RESULT_CACHE_MAX_ENTRIES
 
 
 @dataclass
@@ -49,6 +138,17 @@ class BaseConnector(ABC):
         self._config = config
         self._options = options or ConnectorOptions()
         self._is_connected = False
+        self._result_cache: Optional[QueryResultCache] = (
+            QueryResultCache(
+                self._options.result_cache_size, self._options.result_cache_ttl
+            )
+            if self._options.result_cache_ttl > 0
+            else None
+        )
+        self._search_cache: dict[tuple[Any, ...], tuple[float, list[SchemaObject]]] = {}
+        # Bumped by refresh_schema; a search only caches its result if no refresh
+        # happened while it ran
+        self._schema_generation = 0
 
     @property
     def source_id(self) -> str:
@@ -87,7 +187,7 @@ class BaseConnector(ABC):
             raise QueryError(self.source_id, sql, Exception("Not connected to database"))
 
         # Enforce read-only mode
-        if self._options.readonly and self._is_write_query(sql):
+        if self._options.readonly and _classify(sql)[0]:
             raise QueryError(
                 self.source_id,
                 sql,
@@ -98,9 +198,37 @@ class BaseConnector(ABC):
         max_rows = opts.max_rows or self._options.max_rows
         timeout = opts.timeout or self._options.query_timeout
 
-        logger.debug(f"Executing query on {self.source_id}", {"sql": sql[:200]})
+        cacheable_read = _is_cacheable_read(sql)
+        cache_key = None
+        if cacheable_read and self._result_cache is not None:
+            cache_key = (sql, tuple(opts.params or ()), max_rows)
+            try:
+                cached = self._result_cache.get(cache_key)
+            except TypeError:
+                # Unhashable parameters, skip the cache for this query
+                cache_key = None
+            else:
+                if cached is not None:
+                    logger.debug("Serving cached result on %s", self.source_id)
+                    return cached
+
+        if logger.is_enabled_for("debug"):
+            logger.debug("Executing query on %s", self.source_id, meta={"sql": sql[:200]})
 
-        return await self._execute_query(sql, opts.params, max_rows, timeout)
+        try:
+            result = await self._execute_query(sql, opts.params, max_rows, timeout)
+        finally:
+            if not cacheable_read:
+                # Anything but a plain read (DDL included) may change the schema or what
+                # cached reads return. refresh_schema also bumps the schema generation,
+                # so a search that overlapped the statement does not cache its result
+                self.refresh_schema()
+                if self._result_cache is not None:
+                    self._result_cache.clear()
+
+        if cache_key is not None and not result.truncated:
+            self._result_cache.set(cache_key, result)  # type: ignore[union-attr]
+        return result
 
     @abstractmethod
     async def _execute_query(
@@ -113,13 +241,48 @@ class BaseConnector(ABC):
         """Execute a query (implementation)."""
         pass
 
-    @abstractmethod
     async def search_objects(
         self, options: Optional[SchemaSearchOptions] = None
     ) -> list[SchemaObject]:
-        """Search for database objects."""
+        """Search for database objects, reusing results younger than schema_cache_ttl."""
+        opts = options or SchemaSearchOptions()
+        ttl = self._options.schema_cache_ttl
+        if ttl <= 0:
+            return await self._search_objects(opts)
+
+        key = (opts.object_type, opts.schema, opts.table, opts.pattern)
+        now = time.monotonic()
+        cached = self._search_cache.get(key)
+        if cached and now - cached[0] < ttl:
+            return list(cached[1])
+
+        generation = self._schema_generation
+        objects = await self._search_objects(opts)
+        if generation != self._schema_generation:
+            # The schema may have changed mid-search, so this result could be stale
+            return objects
+        if len(self._search_cache) >= SCHEMA_CACHE_MAX_ENTRIES:
+            # Evict the oldest search
+            del self._search_cache[next(iter(self._search_cache))]
+        self._search_cache[key] = (now, objects)
+        return list(objects)
+
+    @abstractmethod
+    async def _search_objects(
+        self, options: Optional[SchemaSearchOptions] = None
+    ) -> list[SchemaObject]:
+        """Search for database objects (implementation)."""
         pass
 
+    def refresh_schema(self) -> None:
+        """Drop cached schema search results so the next search hits the database."""
+        self._schema_generation += 1
+        self._search_cache.clear()
+
+    def batch(self) -> "BatchExecutor":
+        """Create a batch that runs several queries on this connector concurrently."""
+        return BatchExecutor(self)
+
     async def test_connection(self) -> bool:
         """Test the database connection."""
         try:
@@ -130,25 +293,11 @@ class BaseConnector(ABC):
 
     def _is_write_query(self, sql: str) -> bool:
         """Check if a query is a write operation."""
-        normalized = sql.strip().upper()
-        for keyword in WRITE_KEYWORDS:
-            if normalized.startswith(keyword):
-                return True
-        return False
+        return _classify(sql)[0]
 
     def _wrap_with_limit(self, sql: str, max_rows: int) -> str:
         """Wrap a query with row limiting."""
-        normalized = sql.strip().upper()
-
-        # Don't wrap if already has LIMIT/TOP/FETCH
-        if " LIMIT " in normalized or " TOP " in normalized or " FETCH " in normalized:
-            return sql
-
-        # Don't wrap non-SELECT statements
-        if not normalized.startswith("SELECT"):
-            return sql
-
-        return f"{sql.strip()} LIMIT {max_rows}"
+        return _limit_query(sql, max_rows)
 
     def _format_rows(
         self, rows: list[dict[str, Any]], max_rows: int
@@ -157,3 +306,50 @@ class BaseConnector(ABC):
         truncated = len(rows) > max_rows
         limited_rows = rows[:max_rows] if truncated else rows
         return limited_rows, truncated
+
+
+class BatchExecutor:
+    """Collects queries for one connector and runs them concurrently."""
+
+    def __init__(self, connector: BaseConnector):
+        self._connector = connector
+        self._queries: list[tuple[str, Optional[ExecuteOptions], asyncio.Future[QueryResult]]] = []
+
+    def add(
+        self, sql: str, options: Optional[ExecuteOptions] = None
+    ) -> "asyncio.Future[QueryResult]":
+        """Queue a query, returning a future resolved when the batch runs."""
+        future: asyncio.Future[QueryResult] = asyncio.get_running_loop().create_future()
+        self._queries.append((sql, options, future))
+        return future
+
+    async def execute(self, max_workers: Optional[int] = None) -> list[QueryResult]:
+        """Run the queued queries concurrently and return their results in order.
+
+        At most max_workers queries (default: the connector's pool_max) run at once.
+        If any query fails, the first error is raised after every query has finished.
+        """
+        queries, self._queries = self._queries, []
+        semaphore = asyncio.Semaphore(max_workers or self._connector.options.pool_max)
+
+        async def run(sql: str, options: Optional[ExecuteOptions]) -> QueryResult:
+            async with semaphore:
+                return await self._connector.execute(sql, options)
+
+        results = await asyncio.gather(
+            *(run(sql, options) for sql, options, _ in queries), return_exceptions=True
+        )
+
+        first_error: Optional[BaseException] = None
+        for (_, _, future), result in zip(queries, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+                # The error is re-raised below, so don't warn about unawaited futures
+                future.exception()
+                first_error = first_error or result
+            else:
+                future.set_result(result)
+
+        if first_error is not None:
+            raise first_error
+        return results  # type: ignore[return-value]
@@ -3,7 +3,10 @@ Apache Hive connector using pyhive with Kerberos support.
 """
 
 import asyncio
-from typing import Any, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Optional, TypeVar
 
 from ..config.types import KerberosSourceConfig, SourceConfig
 from ..constants import DEFAULT_PORTS
@@ -11,9 +14,15 @@ from ..services.kerberos import KerberosAuth, KerberosConfig
 from ..utils.errors import ConnectionError, QueryError
 from ..utils.formatters import QueryResult, SchemaObject
 from ..utils.logger import logger
-from .base import BaseConnector, ConnectorOptions, SchemaSearchOptions
-
-# pyhive is synchronous, we'll wrap with asyncio.to_thread
+from .base import (
+    BaseConnector,
+    ConnectorOptions,
+    SchemaSearchOptions,
+    _search_regex,
+    _show_like_clause,
+)
+
+# pyhive is synchronous, we'll run it on a per-connector worker thread
 try:
     from pyhive import hive
     from thrift.transport.TTransport import TTransportException
@@ -21,6 +30,8 @@ except ImportError:
     hive = None  # type: ignore
     TTransportException = Exception  # type: ignore
 
+_T = TypeVar("_T")
+
 
 class HiveConnector(BaseConnector):
     """Apache Hive database connector using pyhive."""
@@ -30,6 +41,8 @@ class HiveConnector(BaseConnector):
         self._connection: Any = None
         self._kerberos_auth: Optional[KerberosAuth] = None
         self._execute_lock = asyncio.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cursor: Any = None
 
     @property
     def db_type(self) -> str:
@@ -68,18 +81,31 @@ class HiveConnector(BaseConnector):
                     await self._kerberos_auth.initialize()
 
             # Connect in a thread pool since pyhive is synchronous
-            self._connection = await asyncio.to_thread(self._create_connection)
+            self._connection = await self._run_sync(self._create_connection)
 
             self._is_connected = True
-            logger.info(f"Connected to Hive: {self.source_id}")
+            logger.info("Connected to Hive: %s", self.source_id)
 
         except Exception as e:
             if self._kerberos_auth:
                 await self._kerberos_auth.destroy()
             raise ConnectionError(self.source_id, e) from e
 
+    async def _run_sync(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking pyhive call on this connector's dedicated worker thread.
+
+        A single worker keeps the non-thread-safe connection on one thread and
+        stops slow Thrift calls from starving the shared default executor.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"hive-{self.source_id}"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
     def _create_connection(self) -> Any:
-        """Create Hive connection (synchronous, called via to_thread)."""
+        """Create Hive connection (synchronous, called via _run_sync)."""
         config = self._config
 
         host = getattr(config, "host", "localhost")
@@ -112,16 +138,21 @@ class HiveConnector(BaseConnector):
     async def disconnect(self) -> None:
         try:
             if self._connection:
-                await asyncio.to_thread(self._connection.close)
+                await self._run_sync(self._close_cursor)
+                await self._run_sync(self._connection.close)
             if self._kerberos_auth:
                 await self._kerberos_auth.destroy()
         except Exception as e:
-            logger.warning(f"Error during Hive disconnect: {e}")
+            logger.warning("Error during Hive disconnect: %s", e)
         finally:
             self._connection = None
             self._kerberos_auth = None
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self.refresh_schema()
             self._is_connected = False
-            logger.info(f"Disconnected from Hive: {self.source_id}")
+            logger.info("Disconnected from Hive: %s", self.source_id)
 
     async def _execute_query(
         self,
@@ -138,7 +169,7 @@ class HiveConnector(BaseConnector):
 
         try:
             async with self._execute_lock:
-                result = await asyncio.to_thread(
+                result = await self._run_sync(
                     self._execute_sync, sql, params, max_rows
                 )
                 return result
@@ -149,8 +180,11 @@ class HiveConnector(BaseConnector):
     def _execute_sync(
         self, sql: str, params: Optional[list[Any]], max_rows: int
     ) -> QueryResult:
-        """Execute query synchronously (called via to_thread)."""
-        cursor = self._connection.cursor()
+        """Execute query synchronously (called via _run_sync)."""
+        # One cursor is reused per connection; _execute_lock serializes its use
+        if self._cursor is None:
+            self._cursor = self._connection.cursor()
+        cursor = self._cursor
         try:
             if params:
                 cursor.execute(sql, params)
@@ -159,16 +193,12 @@ class HiveConnector(BaseConnector):
 
             # Fetch results
             if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-
-                # Fetch max_rows + 1 to detect truncation
-                rows = []
-                for i, row in enumerate(cursor):
-                    if i > max_rows:
-                        break
-                    rows.append(dict(zip(columns, row)))
+                columns = [sys.intern(desc[0]) for desc in cursor.description]
 
-                formatted_rows, truncated = self._format_rows_sync(rows, max_rows)
+                # Fetch max_rows + 1 to detect truncation, then convert only the rows returned
+                rows = cursor.fetchmany(max_rows + 1)
+                limited_rows, truncated = self._format_rows_sync(rows, max_rows)
+                formatted_rows = [dict(zip(columns, row)) for row in limited_rows]
 
                 return QueryResult(
                     columns=columns,
@@ -183,8 +213,19 @@ class HiveConnector(BaseConnector):
                     row_count=0,
                     truncated=False,
                 )
-        finally:
-            cursor.close()
+        except Exception:
+            # Don't reuse a cursor left in an unknown state
+            self._close_cursor()
+            raise
+
+    def _close_cursor(self) -> None:
+        """Close the reused cursor, if any (synchronous)."""
+        cursor, self._cursor = self._cursor, None
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.debug("Error closing Hive cursor: %s", e)
 
     def _format_rows_sync(
         self, rows: list[dict[str, Any]], max_rows: int
@@ -194,60 +235,92 @@ class HiveConnector(BaseConnector):
         limited_rows = rows[:max_rows] if truncated else rows
         return limited_rows, truncated
 
-    async def search_objects(
+    async def _fetch_schema_rows(self, sql: str) -> list[dict[str, Any]]:
+        """Run a schema listing query (BaseConnector.search_objects caches the results)."""
+        result = await self.execute(sql)
+        return result.rows
+
+    async def _search_objects(
         self, options: Optional[SchemaSearchOptions] = None
     ) -> list[SchemaObject]:
         opts = options or SchemaSearchOptions()
         objects: list[SchemaObject] = []
         pattern = opts.pattern or "%"
 
+        # Listings run one after another: every statement goes through
+        # _execute_lock and the single-worker executor anyway.
+
         # Search schemas (databases in Hive)
         if not opts.object_type or opts.object_type == "schema":
-            result = await self.execute("SHOW DATABASES")
-            for row in result.rows:
-                db_name = list(row.values())[0]
-                if isinstance(db_name, str):
-                    if pattern == "%" or pattern.lower().replace("%", "") in db_name.lower():
-                        objects.append(SchemaObject(type="schema", name=db_name))
+            objects.extend(await self._search_schemas(pattern))
 
         # Search tables
         if not opts.object_type or opts.object_type == "table":
-            database = opts.schema or "default"
-            result = await self.execute(f"SHOW TABLES IN {database}")
-
-            for row in result.rows:
-                table_name = list(row.values())[0]
-                if isinstance(table_name, str):
-                    if pattern == "%" or pattern.lower().replace("%", "") in table_name.lower():
-                        objects.append(
-                            SchemaObject(type="table", name=table_name, schema=database)
-                        )
+            objects.extend(await self._search_tables(opts.schema or "default", pattern))
 
         # Search columns
         if opts.object_type == "column" and opts.table:
-            database = opts.schema or "default"
-            result = await self.execute(f"DESCRIBE {database}.{opts.table}")
-
-            for row in result.rows:
-                col_name = row.get("col_name") or row.get("column_name") or list(row.values())[0]
-                data_type = row.get("data_type") or (list(row.values())[1] if len(row) > 1 else None)
-
-                if col_name and isinstance(col_name, str) and not col_name.startswith("#"):
-                    if pattern == "%" or pattern.lower().replace("%", "") in col_name.lower():
-                        objects.append(
-                            SchemaObject(
-                                type="column",
-                                name=col_name,
-                                schema=database,
-                                table=opts.table,
-                                data_type=str(data_type) if data_type else None,
-                                nullable=True,
-                                primary_key=False,
-                            )
-                        )
+            objects.extend(
+                await self._search_columns(opts.schema or "default", opts.table, pattern)
+            )
 
         return objects
 
+    async def _search_schemas(self, pattern: str) -> list[SchemaObject]:
+        """Search databases matching a pattern."""
+        objects: list[SchemaObject] = []
+        like = _show_like_clause(pattern)
+        # Hive already filtered the listing when the pattern could be inlined
+        needle_re = None if like is not None else _search_regex(pattern)
+        rows = await self._fetch_schema_rows(f"SHOW DATABASES{like or ''}")
+        for row in rows:
+            db_name = next(iter(row.values()))
+            if isinstance(db_name, str):
+                if needle_re is None or needle_re.search(db_name):
+                    objects.append(SchemaObject(type="schema", name=db_name))
+        return objects
+
+    async def _search_tables(self, database: str, pattern: str) -> list[SchemaObject]:
+        """Search tables in a database matching a pattern."""
+        objects: list[SchemaObject] = []
+        like = _show_like_clause(pattern)
+        needle_re = None if like is not None else _search_regex(pattern)
+        rows = await self._fetch_schema_rows(f"SHOW TABLES IN {database}{like or ''}")
+        for row in rows:
+            table_name = next(iter(row.values()))
+            if isinstance(table_name, str):
+                if needle_re is None or needle_re.search(table_name):
+                    objects.append(
+                        SchemaObject(type="table", name=table_name, schema=database)
+                    )
+        return objects
+
+    async def _search_columns(
+        self, database: str, table: str, pattern: str
+    ) -> list[SchemaObject]:
+        """Search columns of a table matching a pattern."""
+        objects: list[SchemaObject] = []
+        needle_re = _search_regex(pattern)
+        rows = await self._fetch_schema_rows(f"DESCRIBE {database}.{table}")
+        for row in rows:
+            col_name = row.get("col_name") or row.get("column_name") or next(iter(row.values()))
+            data_type = row.get("data_type") or next(islice(row.values(), 1, None), None)
+
+            if col_name and isinstance(col_name, str) and not col_name.startswith("#"):
+                if needle_re is None or needle_re.search(col_name):
+                    objects.append(
+                        SchemaObject(
+                            type="column",
+                            name=col_name,
+                            schema=database,
+                            table=table,
+                            data_type=str(data_type) if data_type else None,
+                            nullable=True,
+                            primary_key=False,
+                        )
+                    )
+        return objects
+
     async def test_connection(self) -> bool:
         """Test the database connection."""
         try:
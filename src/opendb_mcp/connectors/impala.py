@@ -4,6 +4,7 @@ Impala uses HiveServer2 protocol.
 """
 
 import asyncio
+import sys
 from typing import Any, Optional
 
 from ..config.types import KerberosSourceConfig, SourceConfig
@@ -12,7 +13,13 @@ from ..services.kerberos import KerberosAuth, KerberosConfig
 from ..utils.errors import ConnectionError, QueryError
 from ..utils.formatters import QueryResult, SchemaObject
 from ..utils.logger import logger
-from .base import BaseConnector, ConnectorOptions, SchemaSearchOptions
+from .base import (
+    BaseConnector,
+    ConnectorOptions,
+    SchemaSearchOptions,
+    _search_regex,
+    _show_like_clause,
+)
 
 # pyhive is synchronous, we'll wrap with asyncio.to_thread
 try:
@@ -71,7 +78,7 @@ class ImpalaConnector(BaseConnector):
             self._connection = await asyncio.to_thread(self._create_connection)
 
             self._is_connected = True
-            logger.info(f"Connected to Impala: {self.source_id}")
+            logger.info("Connected to Impala: %s", self.source_id)
 
         except Exception as e:
             if self._kerberos_auth:
@@ -118,12 +125,13 @@ class ImpalaConnector(BaseConnector):
             if self._kerberos_auth:
                 await self._kerberos_auth.destroy()
         except Exception as e:
-            logger.warning(f"Error during Impala disconnect: {e}")
+            logger.warning("Error during Impala disconnect: %s", e)
         finally:
             self._connection = None
             self._kerberos_auth = None
+            self.refresh_schema()
             self._is_connected = False
-            logger.info(f"Disconnected from Impala: {self.source_id}")
+            logger.info("Disconnected from Impala: %s", self.source_id)
 
     async def _execute_query(
         self,
@@ -161,16 +169,12 @@ class ImpalaConnector(BaseConnector):
 
             # Fetch results
             if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
+                columns = [sys.intern(desc[0]) for desc in cursor.description]
 
-                # Fetch max_rows + 1 to detect truncation
-                rows = []
-                for i, row in enumerate(cursor):
-                    if i > max_rows:
-                        break
-                    rows.append(dict(zip(columns, row)))
-
-                formatted_rows, truncated = self._format_rows_sync(rows, max_rows)
+                # Fetch max_rows + 1 to detect truncation, then convert only the rows returned
+                rows = cursor.fetchmany(max_rows + 1)
+                limited_rows, truncated = self._format_rows_sync(rows, max_rows)
+                formatted_rows = [dict(zip(columns, row)) for row in limited_rows]
 
                 return QueryResult(
                     columns=columns,
@@ -196,7 +200,7 @@ class ImpalaConnector(BaseConnector):
         limited_rows = rows[:max_rows] if truncated else rows
         return limited_rows, truncated
 
-    async def search_objects(
+    async def _search_objects(
         self, options: Optional[SchemaSearchOptions] = None
     ) -> list[SchemaObject]:
         opts = options or SchemaSearchOptions()
@@ -205,22 +209,27 @@ class ImpalaConnector(BaseConnector):
 
         # Search schemas (databases in Impala)
         if not opts.object_type or opts.object_type == "schema":
-            result = await self.execute("SHOW DATABASES")
+            like = _show_like_clause(pattern)
+            # Impala already filtered the listing when the pattern could be inlined
+            needle_re = None if like is not None else _search_regex(pattern)
+            result = await self.execute(f"SHOW DATABASES{like or ''}")
             for row in result.rows:
-                db_name = list(row.values())[0]
+                db_name = next(iter(row.values()))
                 if isinstance(db_name, str):
-                    if pattern == "%" or pattern.lower().replace("%", "") in db_name.lower():
+                    if needle_re is None or needle_re.search(db_name):
                         objects.append(SchemaObject(type="schema", name=db_name))
 
         # Search tables
         if not opts.object_type or opts.object_type == "table":
             database = opts.schema or "default"
-            result = await self.execute(f"SHOW TABLES IN {database}")
+            like = _show_like_clause(pattern)
+            needle_re = None if like is not None else _search_regex(pattern)
+            result = await self.execute(f"SHOW TABLES IN {database}{like or ''}")
 
             for row in result.rows:
-                table_name = list(row.values())[0]
+                table_name = next(iter(row.values()))
                 if isinstance(table_name, str):
-                    if pattern == "%" or pattern.lower().replace("%", "") in table_name.lower():
+                    if needle_re is None or needle_re.search(table_name):
                         objects.append(
                             SchemaObject(type="table", name=table_name, schema=database)
                         )
@@ -228,6 +237,7 @@ class ImpalaConnector(BaseConnector):
         # Search columns
         if opts.object_type == "column" and opts.table:
             database = opts.schema or "default"
+            needle_re = _search_regex(pattern)
             result = await self.execute(f"DESCRIBE {database}.{opts.table}")
 
             for row in result.rows:
@@ -235,7 +245,7 @@ class ImpalaConnector(BaseConnector):
                 data_type = row.get("type") or (list(row.values())[1] if len(row) > 1 else None)
 
                 if col_name and isinstance(col_name, str) and not col_name.startswith("#"):
-                    if pattern == "%" or pattern.lower().replace("%", "") in col_name.lower():
+                    if needle_re is None or needle_re.search(col_name):
                         objects.append(
                             SchemaObject(
                                 type="column",
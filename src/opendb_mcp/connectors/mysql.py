@@ -5,8 +5,8 @@ MySQL/MariaDB connector using aiomysql.
 from typing import Any, Optional
 from urllib.parse import urlparse
 
-from ..config.types import SourceConfig
-from ..constants import DEFAULT_PORTS
+from ..config.types import DsnSourceConfig, HostBasedSourceConfig, SourceConfig
+from ..constants import DEFAULT_PORTS, POOL_RECYCLE_SECONDS
 from ..utils.errors import ConnectionError, QueryError
 from ..utils.formatters import QueryResult, SchemaObject
 from ..utils.logger import logger
@@ -17,6 +17,85 @@ try:
 except ImportError:
     aiomysql = None  # type: ignore
 
+_SYSTEM_SCHEMAS = "('mysql', 'information_schema', 'performance_schema', 'sys')"
+
+# information_schema queries, prebuilt for each combination of optional filters
+_SCHEMAS_AND_TABLES = f"""
+    (SELECT 'schema' AS kind, SCHEMA_NAME AS name, NULL AS schema_name
+    FROM information_schema.SCHEMATA
+    WHERE SCHEMA_NAME NOT IN {_SYSTEM_SCHEMAS}
+    AND SCHEMA_NAME LIKE %s)
+    UNION ALL
+    (SELECT 'table' AS kind, TABLE_NAME AS name, TABLE_SCHEMA AS schema_name
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA NOT IN {_SYSTEM_SCHEMAS}
+    AND TABLE_TYPE = 'BASE TABLE'
+    AND TABLE_NAME LIKE %s
+"""
+_SCHEMAS_AND_TABLES_ORDER = (
+    " ORDER BY TABLE_SCHEMA, TABLE_NAME LIMIT 100) ORDER BY kind, schema_name, name"
+)
+_Q_SCHEMAS_AND_TABLES_ALL = _SCHEMAS_AND_TABLES + _SCHEMAS_AND_TABLES_ORDER
+_Q_SCHEMAS_AND_TABLES_BY_SCHEMA = (
+    _SCHEMAS_AND_TABLES + " AND TABLE_SCHEMA = %s" + _SCHEMAS_AND_TABLES_ORDER
+)
+
+_Q_SCHEMAS = f"""
+    SELECT SCHEMA_NAME
+    FROM information_schema.SCHEMATA
+    WHERE SCHEMA_NAME NOT IN {_SYSTEM_SCHEMAS}
+    AND SCHEMA_NAME LIKE %s
+    ORDER BY SCHEMA_NAME
+"""
+
+_TABLES = f"""
+    SELECT TABLE_SCHEMA, TABLE_NAME
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA NOT IN {_SYSTEM_SCHEMAS}
+    AND TABLE_TYPE = 'BASE TABLE'
+    AND TABLE_NAME LIKE %s
+"""
+_TABLES_ORDER = " ORDER BY TABLE_SCHEMA, TABLE_NAME LIMIT 100"
+_Q_TABLES_ALL = _TABLES + _TABLES_ORDER
+_Q_TABLES_BY_SCHEMA = _TABLES + " AND TABLE_SCHEMA = %s" + _TABLES_ORDER
+
+_COLUMNS = """
+    SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY
+    FROM information_schema.COLUMNS
+    WHERE TABLE_NAME = %s
+    AND COLUMN_NAME LIKE %s
+"""
+_COLUMNS_ORDER = " ORDER BY ORDINAL_POSITION"
+_Q_COLUMNS = _COLUMNS + _COLUMNS_ORDER
+_Q_COLUMNS_BY_SCHEMA = _COLUMNS + " AND TABLE_SCHEMA = %s" + _COLUMNS_ORDER
+
+_INDEXES = f"""
+    SELECT TABLE_SCHEMA, TABLE_NAME, INDEX_NAME
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA NOT IN {_SYSTEM_SCHEMAS}
+    AND INDEX_NAME LIKE %s
+"""
+_INDEXES_ORDER = (
+    " GROUP BY TABLE_SCHEMA, TABLE_NAME, INDEX_NAME"
+    " ORDER BY TABLE_SCHEMA, TABLE_NAME, INDEX_NAME LIMIT 100"
+)
+_Q_INDEXES = {
+    (False, False): _INDEXES + _INDEXES_ORDER,
+    (True, False): _INDEXES + " AND TABLE_SCHEMA = %s" + _INDEXES_ORDER,
+    (False, True): _INDEXES + " AND TABLE_NAME = %s" + _INDEXES_ORDER,
+    (True, True): _INDEXES + " AND TABLE_SCHEMA = %s AND TABLE_NAME = %s" + _INDEXES_ORDER,
+}
+
+_PROCEDURES = f"""
+    SELECT ROUTINE_SCHEMA, ROUTINE_NAME
+    FROM information_schema.ROUTINES
+    WHERE ROUTINE_SCHEMA NOT IN {_SYSTEM_SCHEMAS}
+    AND ROUTINE_NAME LIKE %s
+"""
+_PROCEDURES_ORDER = " ORDER BY ROUTINE_SCHEMA, ROUTINE_NAME LIMIT 100"
+_Q_PROCEDURES_ALL = _PROCEDURES + _PROCEDURES_ORDER
+_Q_PROCEDURES_BY_SCHEMA = _PROCEDURES + " AND ROUTINE_SCHEMA = %s" + _PROCEDURES_ORDER
+
 
 class MySqlConnector(BaseConnector):
     """MySQL/MariaDB database connector using aiomysql."""
@@ -41,21 +120,25 @@ class MySqlConnector(BaseConnector):
 
         try:
             connection_kwargs = self._get_connection_kwargs()
+            if self._options.readonly:
+                # Let the server reject writes too, not just the keyword check
+                connection_kwargs["init_command"] = "SET SESSION TRANSACTION READ ONLY"
             self._pool = await aiomysql.create_pool(
                 **connection_kwargs,
-                minsize=1,
-                maxsize=5,
+                minsize=self._options.pool_min,
+                maxsize=self._options.pool_max,
+                pool_recycle=POOL_RECYCLE_SECONDS,
                 connect_timeout=self._options.connection_timeout or 10,
                 autocommit=True,
             )
 
-            # Test the connection
-            async with self._pool.acquire() as conn:
-                async with conn.cursor() as cur:
-                    await cur.execute("SELECT 1")
+            # create_pool has already opened (and so verified) minsize connections
+            if self._options.pool_min == 0:
+                async with self._pool.acquire():
+                    pass
 
             self._is_connected = True
-            logger.info(f"Connected to {self.db_type}: {self.source_id}")
+            logger.info("Connected to %s: %s", self.db_type, self.source_id)
 
         except Exception as e:
             raise ConnectionError(self.source_id, e) from e
@@ -65,8 +148,16 @@ class MySqlConnector(BaseConnector):
             self._pool.close()
             await self._pool.wait_closed()
             self._pool = None
+            self.refresh_schema()
             self._is_connected = False
-            logger.info(f"Disconnected from {self.db_type}: {self.source_id}")
+            logger.info("Disconnected from %s: %s", self.db_type, self.source_id)
+
+    def _require_pool(self, sql: str) -> "aiomysql.Pool":
+        """Get the connection pool, raising a QueryError if not connected."""
+        pool = self._pool
+        if pool is None:
+            raise QueryError(self.source_id, sql, Exception("Not connected"))
+        return pool
 
     async def _execute_query(
         self,
@@ -75,14 +166,14 @@ class MySqlConnector(BaseConnector):
         max_rows: int,
         timeout: Optional[int],
     ) -> QueryResult:
-        if not self._pool:
-            raise QueryError(self.source_id, sql, Exception("Not connected"))
+        pool = self._require_pool(sql)
 
         try:
             wrapped_sql = self._wrap_with_limit(sql, max_rows + 1)
 
-            async with self._pool.acquire() as conn:
-                async with conn.cursor(aiomysql.DictCursor) as cur:
+            async with pool.acquire() as conn:
+                # Unbuffered cursor: rows are streamed instead of buffered in full
+                async with conn.cursor(aiomysql.SSDictCursor) as cur:
                     if params:
                         await cur.execute(wrapped_sql, params)
                     else:
@@ -90,11 +181,11 @@ class MySqlConnector(BaseConnector):
 
                     # Check if it's a SELECT query
                     if cur.description:
-                        rows = await cur.fetchall()
+                        # Fetch max_rows + 1 to detect truncation
+                        rows = await cur.fetchmany(max_rows + 1)
                         columns = [desc[0] for desc in cur.description]
 
-                        row_dicts = [dict(row) for row in rows]
-                        formatted_rows, truncated = self._format_rows(row_dicts, max_rows)
+                        formatted_rows, truncated = self._format_rows(rows, max_rows)
 
                         return QueryResult(
                             columns=columns,
@@ -114,7 +205,7 @@ class MySqlConnector(BaseConnector):
         except Exception as e:
             raise QueryError(self.source_id, sql, e) from e
 
-    async def search_objects(
+    async def _search_objects(
         self, options: Optional[SchemaSearchOptions] = None
     ) -> list[SchemaObject]:
         if not self._pool:
@@ -126,40 +217,40 @@ class MySqlConnector(BaseConnector):
 
         async with self._pool.acquire() as conn:
             async with conn.cursor(aiomysql.DictCursor) as cur:
+                # Search schemas and tables together in a single round-trip
+                if not opts.object_type:
+                    if opts.schema:
+                        await cur.execute(
+                            _Q_SCHEMAS_AND_TABLES_BY_SCHEMA, (pattern, pattern, opts.schema)
+                        )
+                    else:
+                        await cur.execute(_Q_SCHEMAS_AND_TABLES_ALL, (pattern, pattern))
+                    rows = await cur.fetchall()
+                    for row in rows:
+                        if row["kind"] == "schema":
+                            objects.append(SchemaObject(type="schema", name=row["name"]))
+                        else:
+                            objects.append(
+                                SchemaObject(
+                                    type="table",
+                                    name=row["name"],
+                                    schema=row["schema_name"],
+                                )
+                            )
+
                 # Search schemas (databases in MySQL)
-                if not opts.object_type or opts.object_type == "schema":
-                    await cur.execute(
-                        """
-                        SELECT SCHEMA_NAME
-                        FROM information_schema.SCHEMATA
-                        WHERE SCHEMA_NAME NOT IN ('mysql', 'information_schema', 'performance_schema', 'sys')
-                        AND SCHEMA_NAME LIKE %s
-                        ORDER BY SCHEMA_NAME
-                        """,
-                        (pattern,),
-                    )
+                if opts.object_type == "schema":
+                    await cur.execute(_Q_SCHEMAS, (pattern,))
                     rows = await cur.fetchall()
                     for row in rows:
                         objects.append(SchemaObject(type="schema", name=row["SCHEMA_NAME"]))
 
                 # Search tables
-                if not opts.object_type or opts.object_type == "table":
-                    query = """
-                        SELECT TABLE_SCHEMA, TABLE_NAME
-                        FROM information_schema.TABLES
-                        WHERE TABLE_SCHEMA NOT IN ('mysql', 'information_schema', 'performance_schema', 'sys')
-                        AND TABLE_TYPE = 'BASE TABLE'
-                        AND TABLE_NAME LIKE %s
-                    """
-                    params: list[Any] = [pattern]
-
+                if opts.object_type == "table":
                     if opts.schema:
-                        query += " AND TABLE_SCHEMA = %s"
-                        params.append(opts.schema)
-
-                    query += " ORDER BY TABLE_SCHEMA, TABLE_NAME LIMIT 100"
-
-                    await cur.execute(query, params)
+                        await cur.execute(_Q_TABLES_BY_SCHEMA, (pattern, opts.schema))
+                    else:
+                        await cur.execute(_Q_TABLES_ALL, (pattern,))
                     rows = await cur.fetchall()
                     for row in rows:
                         objects.append(
@@ -172,21 +263,12 @@ class MySqlConnector(BaseConnector):
 
                 # Search columns
                 if opts.object_type == "column" and opts.table:
-                    query = """
-                        SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_KEY
-                        FROM information_schema.COLUMNS
-                        WHERE TABLE_NAME = %s
-                        AND COLUMN_NAME LIKE %s
-                    """
-                    params = [opts.table, pattern]
-
                     if opts.schema:
-                        query += " AND TABLE_SCHEMA = %s"
-                        params.append(opts.schema)
-
-                    query += " ORDER BY ORDINAL_POSITION"
-
-                    await cur.execute(query, params)
+                        await cur.execute(
+                            _Q_COLUMNS_BY_SCHEMA, (opts.table, pattern, opts.schema)
+                        )
+                    else:
+                        await cur.execute(_Q_COLUMNS, (opts.table, pattern))
                     rows = await cur.fetchall()
                     for row in rows:
                         objects.append(
@@ -203,26 +285,13 @@ class MySqlConnector(BaseConnector):
 
                 # Search indexes
                 if opts.object_type == "index":
-                    query = """
-                        SELECT TABLE_SCHEMA, TABLE_NAME, INDEX_NAME
-                        FROM information_schema.STATISTICS
-                        WHERE TABLE_SCHEMA NOT IN ('mysql', 'information_schema', 'performance_schema', 'sys')
-                        AND INDEX_NAME LIKE %s
-                    """
-                    params = [pattern]
-
+                    params: list[Any] = [pattern]
                     if opts.schema:
-                        query += " AND TABLE_SCHEMA = %s"
                         params.append(opts.schema)
-
                     if opts.table:
-                        query += " AND TABLE_NAME = %s"
                         params.append(opts.table)
 
-                    query += " GROUP BY TABLE_SCHEMA, TABLE_NAME, INDEX_NAME"
-                    query += " ORDER BY TABLE_SCHEMA, TABLE_NAME, INDEX_NAME LIMIT 100"
-
-                    await cur.execute(query, params)
+                    await cur.execute(_Q_INDEXES[bool(opts.schema), bool(opts.table)], params)
                     rows = await cur.fetchall()
                     for row in rows:
                         objects.append(
@@ -236,21 +305,10 @@ class MySqlConnector(BaseConnector):
 
                 # Search procedures
                 if opts.object_type == "procedure":
-                    query = """
-                        SELECT ROUTINE_SCHEMA, ROUTINE_NAME
-                        FROM information_schema.ROUTINES
-                        WHERE ROUTINE_SCHEMA NOT IN ('mysql', 'information_schema', 'performance_schema', 'sys')
-                        AND ROUTINE_NAME LIKE %s
-                    """
-                    params = [pattern]
-
                     if opts.schema:
-                        query += " AND ROUTINE_SCHEMA = %s"
-                        params.append(opts.schema)
-
-                    query += " ORDER BY ROUTINE_SCHEMA, ROUTINE_NAME LIMIT 100"
-
-                    await cur.execute(query, params)
+                        await cur.execute(_Q_PROCEDURES_BY_SCHEMA, (pattern, opts.schema))
+                    else:
+                        await cur.execute(_Q_PROCEDURES_ALL, (pattern,))
                     rows = await cur.fetchall()
                     for row in rows:
                         objects.append(
@@ -267,10 +325,8 @@ class MySqlConnector(BaseConnector):
         """Get connection kwargs from config."""
         config = self._config
 
-        if hasattr(config, "dsn") and config.dsn:  # type: ignore
-            # Parse DSN
-            dsn = config.dsn  # type: ignore
-            parsed = urlparse(dsn)
+        if isinstance(config, DsnSourceConfig):
+            parsed = urlparse(config.dsn)
 
             kwargs: dict[str, Any] = {
                 "host": parsed.hostname or "localhost",
@@ -284,18 +340,17 @@ class MySqlConnector(BaseConnector):
                 kwargs["db"] = parsed.path.lstrip("/")
             return kwargs
 
-        if hasattr(config, "host"):
-            host_config = config  # type: ignore
+        if isinstance(config, HostBasedSourceConfig):
             kwargs = {
-                "host": host_config.host,
-                "port": host_config.port or DEFAULT_PORTS["mysql"],
+                "host": config.host,
+                "port": config.port or DEFAULT_PORTS["mysql"],
             }
-            if hasattr(host_config, "database") and host_config.database:
-                kwargs["db"] = host_config.database
-            if hasattr(host_config, "user") and host_config.user:
-                kwargs["user"] = host_config.user
-            if hasattr(host_config, "password") and host_config.password:
-                kwargs["password"] = host_config.password
+            if config.database:
+                kwargs["db"] = config.database
+            if config.user:
+                kwargs["user"] = config.user
+            if config.password:
+                kwargs["password"] = config.password
             # aiomysql doesn't support ssl in the same way, would need ssl context
             return kwargs
 
@@ -2,6 +2,7 @@
 PostgreSQL connector using asyncpg.
 """
 
+import asyncio
 from typing import Any, Optional
 
 from ..config.types import DsnSourceConfig, HostBasedSourceConfig, SourceConfig
@@ -9,13 +10,141 @@ from ..constants import DEFAULT_PORTS
 from ..utils.errors import ConnectionError, QueryError
 from ..utils.formatters import QueryResult, SchemaObject
 from ..utils.logger import logger
-from .base import BaseConnector, ConnectorOptions, SchemaSearchOptions
+from .base import BaseConnector, ConnectorOptions, SchemaSearchOptions, _classify, _is_select
 
 try:
     import asyncpg
 except ImportError:
     asyncpg = None  # type: ignore
 
+_SYSTEM_SCHEMAS = "('pg_catalog', 'information_schema', 'pg_toast')"
+
+# Catalog queries, prebuilt for each combination of optional filters so the SQL
+# text is stable and asyncpg's per-connection statement cache keeps them prepared.
+# The name pattern is bound as NULL when absent, so no LIKE runs for a bare "%".
+_SCHEMAS_AND_TABLES = f"""
+    (SELECT 'schema' AS kind, schema_name::text AS name, NULL::text AS schema_name
+    FROM information_schema.schemata
+    WHERE schema_name NOT IN {_SYSTEM_SCHEMAS}
+    AND ($1::text IS NULL OR schema_name LIKE $1))
+    UNION ALL
+    (SELECT 'table' AS kind, table_name::text AS name, table_schema::text AS schema_name
+    FROM information_schema.tables
+    WHERE table_schema NOT IN {_SYSTEM_SCHEMAS}
+    AND table_type = 'BASE TABLE'
+    AND ($1::text IS NULL OR table_name LIKE $1)
+"""
+_SCHEMAS_AND_TABLES_ORDER = (
+    " ORDER BY table_schema, table_name LIMIT 100) ORDER BY kind, schema_name, name"
+)
+_Q_SCHEMAS_AND_TABLES_ALL = _SCHEMAS_AND_TABLES + _SCHEMAS_AND_TABLES_ORDER
+_Q_SCHEMAS_AND_TABLES_BY_SCHEMA = (
+    _SCHEMAS_AND_TABLES + " AND table_schema = $2" + _SCHEMAS_AND_TABLES_ORDER
+)
+
+_Q_SCHEMAS = f"""
+    SELECT schema_name
+    FROM information_schema.schemata
+    WHERE schema_name NOT IN {_SYSTEM_SCHEMAS}
+    AND ($1::text IS NULL OR schema_name LIKE $1)
+    ORDER BY schema_name
+"""
+
+_TABLES = f"""
+    SELECT table_schema, table_name
+    FROM information_schema.tables
+    WHERE table_schema NOT IN {_SYSTEM_SCHEMAS}
+    AND table_type = 'BASE TABLE'
+    AND ($1::text IS NULL OR table_name LIKE $1)
+"""
+_TABLES_ORDER = " ORDER BY table_schema, table_name LIMIT 100"
+_Q_TABLES_ALL = _TABLES + _TABLES_ORDER
+_Q_TABLES_BY_SCHEMA = _TABLES + " AND table_schema = $2" + _TABLES_ORDER
+
+# Read pg_catalog directly: the table filter reaches pg_attribute through pg_class,
+# and the primary key check probes pg_index for that table only. data_type,
+# is_nullable, the relation kinds and the privilege check mirror the definition
+# of information_schema.columns, so results match what that view shows.
+_COLUMNS = """
+    SELECT a.attname AS column_name,
+           CASE
+               WHEN t.typtype = 'd' THEN
+                   CASE
+                       WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                       WHEN nbt.nspname = 'pg_catalog' THEN format_type(t.typbasetype, NULL)
+                       ELSE 'USER-DEFINED'
+                   END
+               ELSE
+                   CASE
+                       WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                       WHEN nt.nspname = 'pg_catalog' THEN format_type(a.atttypid, NULL)
+                       ELSE 'USER-DEFINED'
+                   END
+           END AS data_type,
+           NOT (a.attnotnull OR (t.typtype = 'd' AND t.typnotnull)) AS is_nullable,
+           EXISTS (
+               SELECT 1 FROM pg_index i
+               WHERE i.indrelid = a.attrelid
+               AND i.indisprimary
+               AND a.attnum = ANY(i.indkey)
+           ) AS is_primary_key
+    FROM pg_attribute a
+    JOIN pg_class c ON c.oid = a.attrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_type t ON t.oid = a.atttypid
+    JOIN pg_namespace nt ON nt.oid = t.typnamespace
+    LEFT JOIN (pg_type bt JOIN pg_namespace nbt ON nbt.oid = bt.typnamespace)
+        ON t.typtype = 'd' AND t.typbasetype = bt.oid
+    WHERE c.relname = $1
+    AND c.relkind IN ('r', 'p', 'v', 'f')
+    AND a.attnum > 0
+    AND NOT a.attisdropped
+    AND (
+        pg_has_role(c.relowner, 'USAGE')
+        OR has_column_privilege(c.oid, a.attnum, 'SELECT, INSERT, UPDATE, REFERENCES')
+    )
+    AND ($2::text IS NULL OR a.attname LIKE $2)
+"""
+_COLUMNS_ORDER = " ORDER BY a.attnum"
+_Q_COLUMNS = _COLUMNS + _COLUMNS_ORDER
+_Q_COLUMNS_BY_SCHEMA = _COLUMNS + " AND n.nspname = $3" + _COLUMNS_ORDER
+
+_INDEXES = """
+    SELECT schemaname, tablename, indexname
+    FROM pg_indexes
+    WHERE schemaname NOT IN ('pg_catalog', 'information_schema')
+    AND ($1::text IS NULL OR indexname LIKE $1)
+"""
+_INDEXES_ORDER = " ORDER BY schemaname, tablename, indexname LIMIT 100"
+_Q_INDEXES = {
+    (False, False): _INDEXES + _INDEXES_ORDER,
+    (True, False): _INDEXES + " AND schemaname = $2" + _INDEXES_ORDER,
+    (False, True): _INDEXES + " AND tablename = $2" + _INDEXES_ORDER,
+    (True, True): _INDEXES + " AND schemaname = $2 AND tablename = $3" + _INDEXES_ORDER,
+}
+
+_PROCEDURES = """
+    SELECT n.nspname as schema_name, p.proname as proc_name
+    FROM pg_proc p
+    JOIN pg_namespace n ON p.pronamespace = n.oid
+    WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
+    AND ($1::text IS NULL OR p.proname LIKE $1)
+"""
+_PROCEDURES_ORDER = " ORDER BY n.nspname, p.proname LIMIT 100"
+_Q_PROCEDURES_ALL = _PROCEDURES + _PROCEDURES_ORDER
+_Q_PROCEDURES_BY_SCHEMA = _PROCEDURES + " AND n.nspname = $2" + _PROCEDURES_ORDER
+
+
+def _limit_with_param(sql: str, param_index: int) -> Optional[str]:
+    """Append a parameterized LIMIT ($N) to a SELECT without a row limit.
+
+    Returns None when the query should be sent unchanged. Keeping the limit out
+    of the SQL text lets asyncpg reuse one prepared statement for any max_rows.
+    """
+    if not _classify(sql)[1]:
+        return None
+    return f"{sql.strip()} LIMIT ${param_index}"
+
 
 class PostgresConnector(BaseConnector):
     """PostgreSQL database connector using asyncpg."""
@@ -37,19 +166,27 @@ class PostgresConnector(BaseConnector):
 
         try:
             connection_kwargs = self._get_connection_kwargs()
+            options = self._options
+            if options.readonly:
+                # Let the server reject writes too, not just the keyword check
+                connection_kwargs["server_settings"] = {"default_transaction_read_only": "on"}
             self._pool = await asyncpg.create_pool(
                 **connection_kwargs,
-                min_size=1,
-                max_size=5,
-                timeout=self._options.connection_timeout,
+                min_size=options.pool_min,
+                max_size=options.pool_max,
+                max_queries=options.pool_max_queries,
+                max_inactive_connection_lifetime=options.pool_max_inactive_lifetime,
+                statement_cache_size=options.statement_cache_size,
+                timeout=options.connection_timeout,
             )
 
-            # Test the connection
-            async with self._pool.acquire() as conn:
-                await conn.execute("SELECT 1")
+            # create_pool has already opened (and so verified) min_size connections
+            if options.pool_min == 0:
+                async with self._pool.acquire():
+                    pass
 
             self._is_connected = True
-            logger.info(f"Connected to PostgreSQL: {self.source_id}")
+            logger.info("Connected to PostgreSQL: %s", self.source_id)
 
         except Exception as e:
             raise ConnectionError(self.source_id, e) from e
@@ -58,8 +195,16 @@ class PostgresConnector(BaseConnector):
         if self._pool:
             await self._pool.close()
             self._pool = None
+            self.refresh_schema()
             self._is_connected = False
-            logger.info(f"Disconnected from PostgreSQL: {self.source_id}")
+            logger.info("Disconnected from PostgreSQL: %s", self.source_id)
+
+    def _require_pool(self, sql: str) -> "asyncpg.Pool":
+        """Get the connection pool, raising a QueryError if not connected."""
+        pool = self._pool
+        if pool is None:
+            raise QueryError(self.source_id, sql, Exception("Not connected"))
+        return pool
 
     async def _execute_query(
         self,
@@ -68,18 +213,22 @@ class PostgresConnector(BaseConnector):
         max_rows: int,
         timeout: Optional[int],
     ) -> QueryResult:
-        if not self._pool:
-            raise QueryError(self.source_id, sql, Exception("Not connected"))
+        pool = self._require_pool(sql)
 
         try:
-            wrapped_sql = self._wrap_with_limit(sql, max_rows + 1)
-
-            async with self._pool.acquire() as conn:
-                # asyncpg uses $1, $2, etc. for parameters
-                if params:
-                    rows = await conn.fetch(wrapped_sql, *params, timeout=timeout)
+            # asyncpg uses $1, $2, etc. for parameters; the row limit is bound as one more
+            args = list(params) if params else []
+            wrapped_sql = _limit_with_param(sql, len(args) + 1)
+
+            async with pool.acquire() as conn:
+                if wrapped_sql is not None:
+                    args.append(max_rows + 1)
+                    rows = await conn.fetch(wrapped_sql, *args, timeout=timeout)
+                elif _is_select(sql):
+                    # The SELECT sets its own row limit, which may exceed max_rows
+                    rows = await self._fetch_through_cursor(conn, sql, args, max_rows, timeout)
                 else:
-                    rows = await conn.fetch(wrapped_sql, timeout=timeout)
+                    rows = await conn.fetch(sql, *args, timeout=timeout)
 
             if not rows:
                 return QueryResult(columns=[], rows=[], row_count=0, truncated=False)
@@ -87,9 +236,10 @@ class PostgresConnector(BaseConnector):
             # Get column names from first row
             columns = list(rows[0].keys())
 
-            # Convert rows to dicts
-            row_dicts = [dict(row) for row in rows]
-            formatted_rows, truncated = self._format_rows(row_dicts, max_rows)
+            # Trim before converting, then build dicts from each record's values in
+            # one pass (dict(record) would look every value up again by name)
+            limited_rows, truncated = self._format_rows(rows, max_rows)
+            formatted_rows = [dict(zip(columns, row)) for row in limited_rows]
 
             return QueryResult(
                 columns=columns,
@@ -101,181 +251,181 @@ class PostgresConnector(BaseConnector):
         except Exception as e:
             raise QueryError(self.source_id, sql, e) from e
 
-    async def search_objects(
+    async def _fetch_through_cursor(
+        self,
+        conn: "asyncpg.Connection",
+        sql: str,
+        args: list[Any],
+        max_rows: int,
+        timeout: Optional[int],
+    ) -> list[Any]:
+        """Read at most max_rows + 1 rows of a SELECT through a server-side cursor.
+
+        Statements that cannot be opened as a cursor (e.g. SELECT ... INTO) fall
+        back to a plain fetch. Opening only prepares and binds the statement, so
+        nothing has run yet when that happens.
+        """
+        opened = False
+        try:
+            async with conn.transaction():
+                cursor = await conn.cursor(sql, *args, timeout=timeout)
+                opened = True
+                return await cursor.fetch(max_rows + 1, timeout=timeout)
+        except Exception as e:
+            if opened or isinstance(e, asyncio.TimeoutError):
+                raise
+            logger.debug("Cannot read %s through a cursor, fetching instead: %s", sql, e)
+        return await conn.fetch(sql, *args, timeout=timeout)
+
+    async def _search_objects(
         self, options: Optional[SchemaSearchOptions] = None
     ) -> list[SchemaObject]:
-        if not self._pool:
+        pool = self._pool
+        if not pool:
             raise Exception("Not connected")
 
         opts = options or SchemaSearchOptions()
-        objects: list[SchemaObject] = []
-        pattern = f"%{opts.pattern}%" if opts.pattern else "%"
-
-        async with self._pool.acquire() as conn:
-            # Search schemas
-            if not opts.object_type or opts.object_type == "schema":
-                rows = await conn.fetch(
-                    """
-                    SELECT schema_name
-                    FROM information_schema.schemata
-                    WHERE schema_name NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
-                    AND schema_name LIKE $1
-                    ORDER BY schema_name
-                    """,
-                    pattern,
-                )
-                for row in rows:
-                    objects.append(SchemaObject(type="schema", name=row["schema_name"]))
-
-            # Search tables
-            if not opts.object_type or opts.object_type == "table":
-                query = """
-                    SELECT table_schema, table_name
-                    FROM information_schema.tables
-                    WHERE table_schema NOT IN ('pg_catalog', 'information_schema', 'pg_toast')
-                    AND table_type = 'BASE TABLE'
-                    AND table_name LIKE $1
-                """
-                params: list[Any] = [pattern]
-
-                if opts.schema:
-                    query += " AND table_schema = $2"
-                    params.append(opts.schema)
-
-                query += " ORDER BY table_schema, table_name LIMIT 100"
-
-                rows = await conn.fetch(query, *params)
-                for row in rows:
-                    objects.append(
-                        SchemaObject(
-                            type="table",
-                            name=row["table_name"],
-                            schema=row["table_schema"],
-                        )
-                    )
-
-            # Search columns
-            if opts.object_type == "column" and opts.table:
-                query = """
-                    SELECT c.column_name, c.data_type, c.is_nullable,
-                           CASE WHEN pk.column_name IS NOT NULL THEN true ELSE false END as is_primary_key
-                    FROM information_schema.columns c
-                    LEFT JOIN (
-                        SELECT kcu.column_name, kcu.table_name, kcu.table_schema
-                        FROM information_schema.table_constraints tc
-                        JOIN information_schema.key_column_usage kcu
-                            ON tc.constraint_name = kcu.constraint_name
-                            AND tc.table_schema = kcu.table_schema
-                        WHERE tc.constraint_type = 'PRIMARY KEY'
-                    ) pk ON c.column_name = pk.column_name
-                        AND c.table_name = pk.table_name
-                        AND c.table_schema = pk.table_schema
-                    WHERE c.table_name = $1
-                    AND c.column_name LIKE $2
-                """
-                params = [opts.table, pattern]
-
-                if opts.schema:
-                    query += " AND c.table_schema = $3"
-                    params.append(opts.schema)
-
-                query += " ORDER BY c.ordinal_position"
-
-                rows = await conn.fetch(query, *params)
-                for row in rows:
-                    objects.append(
-                        SchemaObject(
-                            type="column",
-                            name=row["column_name"],
-                            schema=opts.schema,
-                            table=opts.table,
-                            data_type=row["data_type"],
-                            nullable=row["is_nullable"] == "YES",
-                            primary_key=row["is_primary_key"],
-                        )
-                    )
-
-            # Search indexes
-            if opts.object_type == "index":
-                query = """
-                    SELECT schemaname, tablename, indexname
-                    FROM pg_indexes
-                    WHERE schemaname NOT IN ('pg_catalog', 'information_schema')
-                    AND indexname LIKE $1
-                """
-                params = [pattern]
-
-                if opts.schema:
-                    query += " AND schemaname = $2"
-                    params.append(opts.schema)
-
-                if opts.table:
-                    param_num = len(params) + 1
-                    query += f" AND tablename = ${param_num}"
-                    params.append(opts.table)
-
-                query += " ORDER BY schemaname, tablename, indexname LIMIT 100"
-
-                rows = await conn.fetch(query, *params)
-                for row in rows:
-                    objects.append(
-                        SchemaObject(
-                            type="index",
-                            name=row["indexname"],
-                            schema=row["schemaname"],
-                            table=row["tablename"],
-                        )
-                    )
-
-            # Search procedures/functions
-            if opts.object_type == "procedure":
-                query = """
-                    SELECT n.nspname as schema_name, p.proname as proc_name
-                    FROM pg_proc p
-                    JOIN pg_namespace n ON p.pronamespace = n.oid
-                    WHERE n.nspname NOT IN ('pg_catalog', 'information_schema')
-                    AND p.proname LIKE $1
-                """
-                params = [pattern]
-
-                if opts.schema:
-                    query += " AND n.nspname = $2"
-                    params.append(opts.schema)
-
-                query += " ORDER BY n.nspname, p.proname LIMIT 100"
-
-                rows = await conn.fetch(query, *params)
-                for row in rows:
-                    objects.append(
-                        SchemaObject(
-                            type="procedure",
-                            name=row["proc_name"],
-                            schema=row["schema_name"],
-                        )
-                    )
-
-        return objects
+        pattern = f"%{opts.pattern}%" if opts.pattern else None
+
+        # The object types are mutually exclusive, so exactly one search runs
+        if not opts.object_type:
+            # Search schemas and tables together in a single round-trip
+            return await self._search_schemas_and_tables(pool, opts, pattern)
+        if opts.object_type == "schema":
+            return await self._search_schemas(pool, pattern)
+        if opts.object_type == "table":
+            return await self._search_tables(pool, opts, pattern)
+        if opts.object_type == "column" and opts.table:
+            return await self._search_columns(pool, opts, pattern)
+        if opts.object_type == "index":
+            return await self._search_indexes(pool, opts, pattern)
+        if opts.object_type == "procedure":
+            return await self._search_procedures(pool, opts, pattern)
+        return []
+
+    async def _search_schemas_and_tables(
+        self, pool: "asyncpg.Pool", opts: SchemaSearchOptions, pattern: Optional[str]
+    ) -> list[SchemaObject]:
+        """Search schemas and tables matching a pattern with one UNION ALL query."""
+        async with pool.acquire() as conn:
+            if opts.schema:
+                rows = await conn.fetch(_Q_SCHEMAS_AND_TABLES_BY_SCHEMA, pattern, opts.schema)
+            else:
+                rows = await conn.fetch(_Q_SCHEMAS_AND_TABLES_ALL, pattern)
+        return [
+            SchemaObject(type="schema", name=row["name"])
+            if row["kind"] == "schema"
+            else SchemaObject(type="table", name=row["name"], schema=row["schema_name"])
+            for row in rows
+        ]
+
+    async def _search_schemas(
+        self, pool: "asyncpg.Pool", pattern: Optional[str]
+    ) -> list[SchemaObject]:
+        """Search schemas matching a pattern."""
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(_Q_SCHEMAS, pattern)
+        return [SchemaObject(type="schema", name=row["schema_name"]) for row in rows]
+
+    async def _search_tables(
+        self, pool: "asyncpg.Pool", opts: SchemaSearchOptions, pattern: Optional[str]
+    ) -> list[SchemaObject]:
+        """Search tables matching a pattern, optionally within one schema."""
+        async with pool.acquire() as conn:
+            if opts.schema:
+                rows = await conn.fetch(_Q_TABLES_BY_SCHEMA, pattern, opts.schema)
+            else:
+                rows = await conn.fetch(_Q_TABLES_ALL, pattern)
+        return [
+            SchemaObject(
+                type="table",
+                name=row["table_name"],
+                schema=row["table_schema"],
+            )
+            for row in rows
+        ]
+
+    async def _search_columns(
+        self, pool: "asyncpg.Pool", opts: SchemaSearchOptions, pattern: Optional[str]
+    ) -> list[SchemaObject]:
+        """Search columns of a table matching a pattern."""
+        async with pool.acquire() as conn:
+            if opts.schema:
+                rows = await conn.fetch(_Q_COLUMNS_BY_SCHEMA, opts.table, pattern, opts.schema)
+            else:
+                rows = await conn.fetch(_Q_COLUMNS, opts.table, pattern)
+        return [
+            SchemaObject(
+                type="column",
+                name=row["column_name"],
+                schema=opts.schema,
+                table=opts.table,
+                data_type=row["data_type"],
+                nullable=row["is_nullable"],
+                primary_key=row["is_primary_key"],
+            )
+            for row in rows
+        ]
+
+    async def _search_indexes(
+        self, pool: "asyncpg.Pool", opts: SchemaSearchOptions, pattern: Optional[str]
+    ) -> list[SchemaObject]:
+        """Search indexes matching a pattern, optionally within a schema and table."""
+        params: list[Any] = [pattern]
+        if opts.schema:
+            params.append(opts.schema)
+        if opts.table:
+            params.append(opts.table)
+
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(_Q_INDEXES[bool(opts.schema), bool(opts.table)], *params)
+        return [
+            SchemaObject(
+                type="index",
+                name=row["indexname"],
+                schema=row["schemaname"],
+                table=row["tablename"],
+            )
+            for row in rows
+        ]
+
+    async def _search_procedures(
+        self, pool: "asyncpg.Pool", opts: SchemaSearchOptions, pattern: Optional[str]
+    ) -> list[SchemaObject]:
+        """Search procedures/functions matching a pattern, optionally within one schema."""
+        async with pool.acquire() as conn:
+            if opts.schema:
+                rows = await conn.fetch(_Q_PROCEDURES_BY_SCHEMA, pattern, opts.schema)
+            else:
+                rows = await conn.fetch(_Q_PROCEDURES_ALL, pattern)
+        return [
+            SchemaObject(
+                type="procedure",
+                name=row["proc_name"],
+                schema=row["schema_name"],
+            )
+            for row in rows
+        ]
 
     def _get_connection_kwargs(self) -> dict[str, Any]:
         """Get connection kwargs from config."""
         config = self._config
 
-        if hasattr(config, "dsn") and config.dsn:  # type: ignore
-            return {"dsn": config.dsn}  # type: ignore
+        if isinstance(config, DsnSourceConfig):
+            return {"dsn": config.dsn}
 
-        if hasattr(config, "host"):
-            host_config = config  # type: ignore
+        if isinstance(config, HostBasedSourceConfig):
             kwargs: dict[str, Any] = {
-                "host": host_config.host,
-                "port": host_config.port or DEFAULT_PORTS["postgres"],
+                "host": config.host,
+                "port": config.port or DEFAULT_PORTS["postgres"],
             }
-            if hasattr(host_config, "database") and host_config.database:
-                kwargs["database"] = host_config.database
-            if hasattr(host_config, "user") and host_config.user:
-                kwargs["user"] = host_config.user
-            if hasattr(host_config, "password") and host_config.password:
-                kwargs["password"] = host_config.password
-            if hasattr(host_config, "ssl") and host_config.ssl:
+            if config.database:
+                kwargs["database"] = config.database
+            if config.user:
+                kwargs["user"] = config.user
+            if config.password:
+                kwargs["password"] = config.password
+            if config.ssl:
                 kwargs["ssl"] = "require"
             return kwargs
 
@@ -3,6 +3,8 @@ Shared constants for the OpenDB MCP Server.
 """
 
 import re
+from collections.abc import Mapping
+from types import MappingProxyType
 
 # Maximum characters in response to prevent memory issues
 CHARACTER_LIMIT = 100_000
@@ -16,6 +18,27 @@ DEFAULT_QUERY_TIMEOUT = 30
 # Default connection timeout in seconds
 DEFAULT_CONNECTION_TIMEOUT = 10
 
+# Default connection pool bounds per source
+DEFAULT_POOL_MIN_SIZE = 1
+DEFAULT_POOL_MAX_SIZE = 5
+
+# Seconds after which pooled connections are recycled
+POOL_RECYCLE_SECONDS = 3600
+
+# asyncpg pool lifecycle defaults
+DEFAULT_POOL_MAX_QUERIES = 50000
+DEFAULT_POOL_MAX_INACTIVE_LIFETIME = 300.0
+DEFAULT_STATEMENT_CACHE_SIZE = 1024
+
+# Maximum query results cached per source when result caching is enabled
+RESULT_CACHE_MAX_ENTRIES = 256
+
+# Seconds that schema search results (and Hive SHOW/DESCRIBE listings) are reused
+SCHEMA_CACHE_TTL = 60.0
+
+# Maximum distinct schema searches cached per source
+SCHEMA_CACHE_MAX_ENTRIES = 256
+
 # Server name and version
 SERVER_NAME = "opendb-mcp"
 SERVER_VERSION = "1.0.0"
@@ -24,14 +47,14 @@ SERVER_VERSION = "1.0.0"
 # Format: ${VAR_NAME} or ${VAR_NAME:-default}
 ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
 
-# Default ports for various databases
-DEFAULT_PORTS: dict[str, int] = {
+# Default ports for various databases (read-only view, shared by every connector)
+DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({
     "postgres": 5432,
     "mysql": 3306,
     "mariadb": 3306,
     "hive": 10000,
     "impala": 21050,
-}
+})
 
 # Database types supported
 DATABASE_TYPES = ("postgres", "mysql", "mariadb", "hive", "impala")
@@ -46,7 +69,7 @@ OBJECT_TYPES = ("schema", "table", "column", "index", "procedure")
 RESPONSE_FORMATS = ("markdown", "json")
 
 # Write operation keywords for read-only enforcement
-WRITE_KEYWORDS = (
+WRITE_KEYWORDS = frozenset({
     "INSERT",
     "UPDATE",
     "DELETE",
@@ -59,4 +82,4 @@ WRITE_KEYWORDS = (
     "MERGE",
     "UPSERT",
     "REPLACE",
-)
+})
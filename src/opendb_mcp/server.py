@@ -4,8 +4,10 @@ MCP Server setup and transport handling.
 Supports both stdio and streamable HTTP transports.
 """
 
+import asyncio
 from dataclasses import dataclass
-from typing import Any, Literal, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Literal, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -25,6 +27,128 @@ from .tools import (
 from .utils.logger import logger
 
 
+# Tool definitions never change, so they are built once rather than per list_tools request
+_TOOLS: list[Tool] = [
+    Tool(
+        name="execute_sql",
+        description="Execute SQL queries against configured database sources. Supports prepared statements with parameterized queries.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_id": {
+                    "type": "string",
+                    "description": "Database source ID (optional if single db configured)",
+                },
+                "sql": {
+                    "type": "string",
+                    "description": "SQL query to execute",
+                },
+                "params": {
+                    "type": "array",
+                    "items": {},
+                    "description": "Prepared statement parameters",
+                },
+                "response_format": {
+                    "type": "string",
+                    "enum": ["markdown", "json"],
+                    "default": "markdown",
+                    "description": "Output format",
+                },
+            },
+            "required": ["sql"],
+        },
+    ),
+    Tool(
+        name="search_objects",
+        description="Explore database schemas with progressive disclosure. Search for schemas, tables, columns, indexes, and stored procedures.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_id": {
+                    "type": "string",
+                    "description": "Database source ID (optional if single db configured)",
+                },
+                "object_type": {
+                    "type": "string",
+                    "enum": ["schema", "table", "column", "index", "procedure"],
+                    "description": "Type of database object",
+                },
+                "schema": {
+                    "type": "string",
+                    "description": "Schema/database name to search within",
+                },
+                "table": {
+                    "type": "string",
+                    "description": "Table name (required when searching columns)",
+                },
+                "pattern": {
+                    "type": "string",
+                    "description": "Search pattern (supports % wildcard)",
+                },
+                "response_format": {
+                    "type": "string",
+                    "enum": ["markdown", "json"],
+                    "default": "markdown",
+                    "description": "Output format",
+                },
+            },
+        },
+    ),
+    Tool(
+        name="list_sources",
+        description="List all configured database connections with their types and status.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "response_format": {
+                    "type": "string",
+                    "enum": ["markdown", "json"],
+                    "default": "markdown",
+                    "description": "Output format",
+                },
+            },
+        },
+    ),
+]
+
+
+class MCPHandler:
+    """ASGI app serving MCP requests over streamable HTTP in stateless mode.
+
+    Starlette requires a class for raw ASGI handlers (plain async functions
+    get wrapped differently).
+    """
+
+    def __init__(
+        self, mcp_server: Server, init_options: Any, transport_factory: Callable[[], Any]
+    ):
+        self.mcp_server = mcp_server
+        self.init_options = init_options
+        self.transport_factory = transport_factory
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        """Handle MCP requests - creates new transport per request for stateless mode."""
+        transport = self.transport_factory()
+
+        async with transport.connect() as (read_stream, write_stream):
+            server_task = asyncio.create_task(
+                self.mcp_server.run(
+                    read_stream,
+                    write_stream,
+                    self.init_options,
+                    stateless=True,  # Allow initialization from any node
+                )
+            )
+            try:
+                await transport.handle_request(scope, receive, send)
+            finally:
+                server_task.cancel()
+                try:
+                    await server_task
+                except asyncio.CancelledError:
+                    pass
+
+
 @dataclass
 class ServerOptions:
     """Options for the MCP server."""
@@ -51,143 +175,65 @@ class OpenDBServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """Return list of available tools."""
-            return [
-                Tool(
-                    name="execute_sql",
-                    description="Execute SQL queries against configured database sources. Supports prepared statements with parameterized queries.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "source_id": {
-                                "type": "string",
-                                "description": "Database source ID (optional if single db configured)",
-                            },
-                            "sql": {
-                                "type": "string",
-                                "description": "SQL query to execute",
-                            },
-                            "params": {
-                                "type": "array",
-                                "items": {},
-                                "description": "Prepared statement parameters",
-                            },
-                            "response_format": {
-                                "type": "string",
-                                "enum": ["markdown", "json"],
-                                "default": "markdown",
-                                "description": "Output format",
-                            },
-                        },
-                        "required": ["sql"],
-                    },
-                ),
-                Tool(
-                    name="search_objects",
-                    description="Explore database schemas with progressive disclosure. Search for schemas, tables, columns, indexes, and stored procedures.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "source_id": {
-                                "type": "string",
-                                "description": "Database source ID (optional if single db configured)",
-                            },
-                            "object_type": {
-                                "type": "string",
-                                "enum": ["schema", "table", "column", "index", "procedure"],
-                                "description": "Type of database object",
-                            },
-                            "schema": {
-                                "type": "string",
-                                "description": "Schema/database name to search within",
-                            },
-                            "table": {
-                                "type": "string",
-                                "description": "Table name (required when searching columns)",
-                            },
-                            "pattern": {
-                                "type": "string",
-                                "description": "Search pattern (supports % wildcard)",
-                            },
-                            "response_format": {
-                                "type": "string",
-                                "enum": ["markdown", "json"],
-                                "default": "markdown",
-                                "description": "Output format",
-                            },
-                        },
-                    },
-                ),
-                Tool(
-                    name="list_sources",
-                    description="List all configured database connections with their types and status.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "response_format": {
-                                "type": "string",
-                                "enum": ["markdown", "json"],
-                                "default": "markdown",
-                                "description": "Output format",
-                            },
-                        },
-                    },
-                ),
-            ]
+            return _TOOLS
+
+        # Tool name -> handler, built once so each call is a single dict lookup
+        tool_handlers: dict[str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]] = {
+            "execute_sql": self._handle_execute_sql,
+            "search_objects": self._handle_search_objects,
+            "list_sources": self._handle_list_sources,
+        }
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Handle tool calls."""
-            logger.debug(f"Tool called: {name}", arguments)
-
-            if name == "execute_sql":
-                input_data = ExecuteSqlInput(
-                    sql=arguments.get("sql", ""),
-                    source_id=arguments.get("source_id"),
-                    params=arguments.get("params"),
-                    response_format=arguments.get("response_format", "markdown"),
-                )
-                result = await execute_sql(self.connector_manager, input_data)
-                return [
-                    TextContent(type="text", text=item["text"])
-                    for item in result.content
-                ]
-
-            elif name == "search_objects":
-                input_data = SearchObjectsInput(
-                    source_id=arguments.get("source_id"),
-                    object_type=arguments.get("object_type"),
-                    schema=arguments.get("schema"),
-                    table=arguments.get("table"),
-                    pattern=arguments.get("pattern"),
-                    response_format=arguments.get("response_format", "markdown"),
-                )
-                result = await search_objects(self.connector_manager, input_data)
-                return [
-                    TextContent(type="text", text=item["text"])
-                    for item in result.content
-                ]
-
-            elif name == "list_sources":
-                input_data = ListSourcesInput(
-                    response_format=arguments.get("response_format", "markdown"),
-                )
-                result = await list_sources(self.connector_manager, input_data)
-                return [
-                    TextContent(type="text", text=item["text"])
-                    for item in result.content
-                ]
+            logger.debug("Tool called: %s", name, meta=arguments)
 
-            else:
+            handler = tool_handlers.get(name)
+            if handler is None:
                 return [TextContent(type="text", text=f"Unknown tool: {name}")]
+            return await handler(arguments)
 
         logger.info("Registered MCP tools: execute_sql, search_objects, list_sources")
 
+    async def _handle_execute_sql(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Run the execute_sql tool."""
+        input_data = ExecuteSqlInput(
+            sql=arguments.get("sql", ""),
+            source_id=arguments.get("source_id"),
+            params=arguments.get("params"),
+            response_format=arguments.get("response_format", "markdown"),
+        )
+        result = await execute_sql(self.connector_manager, input_data)
+        return result.content
+
+    async def _handle_search_objects(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Run the search_objects tool."""
+        input_data = SearchObjectsInput(
+            source_id=arguments.get("source_id"),
+            object_type=arguments.get("object_type"),
+            schema=arguments.get("schema"),
+            table=arguments.get("table"),
+            pattern=arguments.get("pattern"),
+            response_format=arguments.get("response_format", "markdown"),
+        )
+        result = await search_objects(self.connector_manager, input_data)
+        return result.content
+
+    async def _handle_list_sources(self, arguments: dict[str, Any]) -> list[TextContent]:
+        """Run the list_sources tool."""
+        input_data = ListSourcesInput(
+            response_format=arguments.get("response_format", "markdown"),
+        )
+        result = await list_sources(self.connector_manager, input_data)
+        return result.content
+
     async def _connect_databases(self) -> None:
         """Try to connect to all configured databases."""
         try:
             await self.connector_manager.connect_all()
         except Exception as e:
-            logger.warning(f"Some database connections failed: {e}")
+            logger.warning("Some database connections failed: %s", e)
 
     async def _start_stdio(self) -> None:
         """Start the server with stdio transport."""
@@ -208,7 +254,6 @@ class OpenDBServer:
             from starlette.routing import Route
             from mcp.server.streamable_http import StreamableHTTPServerTransport
             import uvicorn
-            import asyncio
         except ImportError as e:
             raise ImportError(
                 "HTTP transport requires additional dependencies. "
@@ -217,38 +262,17 @@ class OpenDBServer:
 
         port = self.options.port
 
-        # Create ASGI app class for MCP handling - Starlette requires this pattern
-        # for raw ASGI handlers (plain async functions get wrapped differently)
-        class MCPHandler:
-            def __init__(self, mcp_server: Server):
-                self.mcp_server = mcp_server
-
-            async def __call__(self, scope, receive, send):
-                """Handle MCP requests - creates new transport per request for stateless mode."""
-                transport = StreamableHTTPServerTransport(
-                    mcp_session_id=None,  # stateless
-                    is_json_response_enabled=True,
-                )
-
-                async with transport.connect() as (read_stream, write_stream):
-                    server_task = asyncio.create_task(
-                        self.mcp_server.run(
-                            read_stream,
-                            write_stream,
-                            self.mcp_server.create_initialization_options(),
-                            stateless=True,  # Allow initialization from any node
-                        )
-                    )
-                    try:
-                        await transport.handle_request(scope, receive, send)
-                    finally:
-                        server_task.cancel()
-                        try:
-                            await server_task
-                        except asyncio.CancelledError:
-                            pass
-
-        mcp_handler = MCPHandler(self.server)
+        # Initialization options and transport arguments are the same for every
+        # request, so they are built once
+        mcp_handler = MCPHandler(
+            self.server,
+            self.server.create_initialization_options(),
+            partial(
+                StreamableHTTPServerTransport,
+                mcp_session_id=None,  # stateless
+                is_json_response_enabled=True,
+            ),
+        )
 
         async def health_check(request: Any) -> JSONResponse:
             """Health check endpoint."""
@@ -280,9 +304,9 @@ class OpenDBServer:
         )
         self._http_server = uvicorn.Server(config)
 
-        logger.info(f"MCP server starting with HTTP transport on port {port}")
-        logger.info(f"MCP endpoint: http://0.0.0.0:{port}/mcp")
-        logger.info(f"Health check: http://0.0.0.0:{port}/health")
+        logger.info("MCP server starting with HTTP transport on port %s", port)
+        logger.info("MCP endpoint: http://0.0.0.0:%s/mcp", port)
+        logger.info("Health check: http://0.0.0.0:%s/health", port)
 
         await self._http_server.serve()
 
@@ -309,6 +333,6 @@ class OpenDBServer:
         logger.info("MCP server stopped")
 
 
-async def create_server(options: ServerOptions) -> OpenDBServer:
+def create_server(options: ServerOptions) -> OpenDBServer:
     """Create and return an OpenDB MCP server instance."""
     return OpenDBServer(options)
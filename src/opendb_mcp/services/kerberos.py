@@ -6,14 +6,27 @@ import asyncio
 import os
 import re
 import stat
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from ..utils.errors import KerberosError
 from ..utils.logger import logger
 
+# klist date formats vary by OS; each pattern is paired with its parser
+_KLIST_EXPIRY_PATTERNS: tuple[tuple["re.Pattern[str]", Callable[[str], datetime]], ...] = (
+    (  # MM/DD/YYYY HH:MM:SS
+        re.compile(r"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2})"),
+        lambda date_str: datetime.strptime(date_str, "%m/%d/%Y %H:%M:%S"),
+    ),
+    (  # ISO format
+        re.compile(r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})"),
+        datetime.fromisoformat,
+    ),
+)
+
 
 @dataclass
 class KerberosConfig:
@@ -31,8 +44,25 @@ class KerberosAuth:
 
     def __init__(self, config: KerberosConfig):
         self.config = config
+        # Kept unresolved: stat() and kinit follow symlinks each time, so a rotated
+        # keytab link (e.g. a re-mounted secret) is picked up on the next refresh
+        self._keytab_path = Path(config.keytab)
+        # Subprocess environment for kinit/klist/kdestroy, copied once (None inherits ours)
+        self._subprocess_env: Optional[dict[str, str]] = (
+            {**os.environ, "KRB5_CONFIG": config.krb5_conf} if config.krb5_conf else None
+        )
         self._initialized = False
         self._ticket_expiry: Optional[datetime] = None
+        # Validity checks run before every query, so the refresh point is kept as a
+        # monotonic deadline and compared without building a datetime each time
+        self._refresh_deadline: Optional[float] = None
+
+    def _refresh_deadline_for(self, expiry: datetime) -> float:
+        """Convert a ticket expiry into the time.monotonic() value to refresh at."""
+        return (
+            time.monotonic()
+            + (expiry - self.TICKET_EXPIRY_BUFFER - datetime.now()).total_seconds()
+        )
 
     @property
     def is_initialized(self) -> bool:
@@ -41,7 +71,7 @@ class KerberosAuth:
 
     async def initialize(self) -> None:
         """Initialize Kerberos authentication using keytab."""
-        keytab_path = Path(self.config.keytab).resolve()
+        keytab_path = self._keytab_path
 
         # Validate keytab file exists
         if not keytab_path.exists():
@@ -51,13 +81,13 @@ class KerberosAuth:
         mode = keytab_path.stat().st_mode
         if mode & stat.S_IROTH:  # World-readable
             logger.warning(
-                f"Keytab file {keytab_path} is world-readable. This is a security risk."
+                "Keytab file %s is world-readable. This is a security risk.", keytab_path
             )
 
         try:
             await self._kinit(str(keytab_path), self.config.principal)
             self._initialized = True
-            logger.info(f"Kerberos authentication initialized for {self.config.principal}")
+            logger.info("Kerberos authentication initialized for %s", self.config.principal)
         except Exception as e:
             raise KerberosError(f"Failed to initialize Kerberos: {e}", e) from e
 
@@ -67,9 +97,10 @@ class KerberosAuth:
             await self._kdestroy()
             self._initialized = False
             self._ticket_expiry = None
+            self._refresh_deadline = None
             logger.info("Kerberos credentials destroyed")
         except Exception as e:
-            logger.warning(f"Failed to destroy Kerberos credentials: {e}")
+            logger.warning("Failed to destroy Kerberos credentials: %s", e)
 
     def is_valid(self) -> bool:
         """Check if authentication is initialized and valid."""
@@ -79,31 +110,28 @@ class KerberosAuth:
         """Check if the current ticket is valid with expiry buffer."""
         if not self._initialized:
             return False
-        if self._ticket_expiry is None:
+        if self._refresh_deadline is None:
             return False
-        return datetime.now() < (self._ticket_expiry - self.TICKET_EXPIRY_BUFFER)
+        return time.monotonic() < self._refresh_deadline
 
     async def ensure_valid(self) -> None:
         """Ensure a valid Kerberos ticket exists, running kinit if needed."""
         if self._is_ticket_valid():
             return
 
-        keytab_path = Path(self.config.keytab).resolve()
+        keytab_path = self._keytab_path
         try:
             await self._kinit(str(keytab_path), self.config.principal)
             self._initialized = True
-            logger.info(f"Kerberos ticket refreshed for {self.config.principal}")
+            logger.info("Kerberos ticket refreshed for %s", self.config.principal)
         except Exception as e:
             raise KerberosError(f"Failed to refresh Kerberos ticket: {e}", e) from e
 
     def _get_env_with_krb5_config(self) -> Optional[dict[str, str]]:
         """Get environment with KRB5_CONFIG set if krb5_conf is configured."""
-        if self.config.krb5_conf:
-            env = os.environ.copy()
-            env["KRB5_CONFIG"] = self.config.krb5_conf
-            logger.debug(f"Using custom krb5.conf: {self.config.krb5_conf}")
-            return env
-        return None
+        if self._subprocess_env is not None:
+            logger.debug("Using custom krb5.conf: %s", self.config.krb5_conf)
+        return self._subprocess_env
 
     async def _kinit(self, keytab_path: str, principal: str) -> None:
         """Run kinit to obtain Kerberos ticket."""
@@ -115,7 +143,7 @@ class KerberosAuth:
             "-t",
             keytab_path,
             principal,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
             env=env,
         )
@@ -126,7 +154,9 @@ class KerberosAuth:
             raise KerberosError(f"kinit failed with code {process.returncode}: {stderr.decode()}")
 
         # Get ticket expiry time
-        self._ticket_expiry = await self._get_ticket_expiry()
+        expiry = await self._get_ticket_expiry()
+        self._ticket_expiry = expiry
+        self._refresh_deadline = None if expiry is None else self._refresh_deadline_for(expiry)
 
     async def _kdestroy(self) -> None:
         """Run kdestroy to destroy Kerberos credentials."""
@@ -134,15 +164,16 @@ class KerberosAuth:
 
         process = await asyncio.create_subprocess_exec(
             "kdestroy",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
             env=env,
         )
 
-        await process.communicate()
+        # Output is never used, so no pipes are set up to drain
+        returncode = await process.wait()
 
-        if process.returncode != 0:
-            raise KerberosError(f"kdestroy failed with code {process.returncode}")
+        if returncode != 0:
+            raise KerberosError(f"kdestroy failed with code {returncode}")
 
     async def _get_ticket_expiry(self) -> Optional[datetime]:
         """Get ticket expiry time from klist."""
@@ -162,22 +193,11 @@ class KerberosAuth:
             if process.returncode == 0:
                 output = stdout.decode()
                 # Try to parse expiry time from klist output
-                # Format varies by OS, try common patterns
-                patterns = [
-                    r"(\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2})",  # MM/DD/YYYY HH:MM:SS
-                    r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})",  # ISO format
-                ]
-
-                for pattern in patterns:
-                    match = re.search(pattern, output)
+                for pattern, parse in _KLIST_EXPIRY_PATTERNS:
+                    match = pattern.search(output)
                     if match:
                         try:
-                            # Try to parse the date
-                            date_str = match.group(1)
-                            if "/" in date_str:
-                                return datetime.strptime(date_str, "%m/%d/%Y %H:%M:%S")
-                            else:
-                                return datetime.fromisoformat(date_str)
+                            return parse(match.group(1))
                         except ValueError:
                             continue
 
@@ -5,13 +5,15 @@ execute_sql tool implementation.
 from dataclasses import dataclass, field
 from typing import Any, Literal, Optional
 
+from mcp.types import TextContent
+
 from ..connectors import ConnectorManager, ExecuteOptions
 from ..utils.errors import format_error_for_response
 from ..utils.formatters import format_query_results
 from ..utils.logger import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecuteSqlInput:
     """Input parameters for execute_sql tool."""
 
@@ -21,11 +23,11 @@ class ExecuteSqlInput:
     response_format: Literal["markdown", "json"] = "markdown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecuteSqlResult:
     """Result from execute_sql tool."""
 
-    content: list[dict[str, str]]
+    content: list[TextContent]
     is_error: bool = False
 
 
@@ -41,19 +43,16 @@ async def execute_sql(
 
     if not sql or not sql.strip():
         return ExecuteSqlResult(
-            content=[{"type": "text", "text": "Error: SQL query is required"}],
+            content=[TextContent(type="text", text="Error: SQL query is required")],
             is_error=True,
         )
 
     try:
-        # Resolve connector
-        connector = connector_manager.resolve(source_id)
-
-        # Ensure connected
-        if not connector.is_connected:
-            await connector.connect()
+        # Resolve connector, connecting on first use
+        connector = await connector_manager.resolve_connected(source_id)
 
-        logger.debug(f"Executing SQL on {connector.source_id}", {"sql": sql[:100]})
+        if logger.is_enabled_for("debug"):
+            logger.debug("Executing SQL on %s", connector.source_id, meta={"sql": sql[:100]})
 
         # Execute query
         result = await connector.execute(sql, ExecuteOptions(params=params))
@@ -62,13 +61,13 @@ async def execute_sql(
         formatted = format_query_results(result, response_format)
 
         return ExecuteSqlResult(
-            content=[{"type": "text", "text": formatted}],
+            content=[TextContent(type="text", text=formatted)],
             is_error=False,
         )
 
     except Exception as e:
-        logger.error("SQL execution failed", e)
+        logger.error("SQL execution failed", meta=e)
         return ExecuteSqlResult(
-            content=[{"type": "text", "text": format_error_for_response(e)}],
+            content=[TextContent(type="text", text=format_error_for_response(e))],
             is_error=True,
         )
@@ -5,24 +5,26 @@ list_sources tool implementation.
 from dataclasses import dataclass
 from typing import Literal
 
+from mcp.types import TextContent
+
 from ..connectors import ConnectorManager
 from ..utils.errors import format_error_for_response
 from ..utils.formatters import format_sources_list
 from ..utils.logger import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ListSourcesInput:
     """Input parameters for list_sources tool."""
 
     response_format: Literal["markdown", "json"] = "markdown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ListSourcesResult:
     """Result from list_sources tool."""
 
-    content: list[dict[str, str]]
+    content: list[TextContent]
     is_error: bool = False
 
 
@@ -43,13 +45,13 @@ async def list_sources(
         formatted = format_sources_list(sources, response_format)
 
         return ListSourcesResult(
-            content=[{"type": "text", "text": formatted}],
+            content=[TextContent(type="text", text=formatted)],
             is_error=False,
         )
 
     except Exception as e:
-        logger.error("Failed to list sources", e)
+        logger.error("Failed to list sources", meta=e)
         return ListSourcesResult(
-            content=[{"type": "text", "text": format_error_for_response(e)}],
+            content=[TextContent(type="text", text=format_error_for_response(e))],
             is_error=True,
         )
@@ -5,13 +5,15 @@ search_objects tool implementation.
 from dataclasses import dataclass
 from typing import Literal, Optional
 
+from mcp.types import TextContent
+
 from ..connectors import ConnectorManager, SchemaSearchOptions
 from ..utils.errors import format_error_for_response
 from ..utils.formatters import format_schema_objects
 from ..utils.logger import logger
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchObjectsInput:
     """Input parameters for search_objects tool."""
 
@@ -23,11 +25,11 @@ class SearchObjectsInput:
     response_format: Literal["markdown", "json"] = "markdown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchObjectsResult:
     """Result from search_objects tool."""
 
-    content: list[dict[str, str]]
+    content: list[TextContent]
     is_error: bool = False
 
 
@@ -47,28 +49,28 @@ async def search_objects(
     if object_type == "column" and not table:
         return SearchObjectsResult(
             content=[
-                {"type": "text", "text": "Error: Table name is required when searching for columns"}
+                TextContent(
+                    type="text", text="Error: Table name is required when searching for columns"
+                )
             ],
             is_error=True,
         )
 
     try:
-        # Resolve connector
-        connector = connector_manager.resolve(source_id)
-
-        # Ensure connected
-        if not connector.is_connected:
-            await connector.connect()
-
-        logger.debug(
-            f"Searching objects on {connector.source_id}",
-            {
-                "object_type": object_type,
-                "schema": schema,
-                "table": table,
-                "pattern": pattern,
-            },
-        )
+        # Resolve connector, connecting on first use
+        connector = await connector_manager.resolve_connected(source_id)
+
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "Searching objects on %s",
+                connector.source_id,
+                meta={
+                    "object_type": object_type,
+                    "schema": schema,
+                    "table": table,
+                    "pattern": pattern,
+                },
+            )
 
         # Search objects
         objects = await connector.search_objects(
@@ -84,13 +86,13 @@ async def search_objects(
         formatted = format_schema_objects(objects, response_format)
 
         return SearchObjectsResult(
-            content=[{"type": "text", "text": formatted}],
+            content=[TextContent(type="text", text=formatted)],
             is_error=False,
         )
 
     except Exception as e:
-        logger.error("Object search failed", e)
+        logger.error("Object search failed", meta=e)
         return SearchObjectsResult(
-            content=[{"type": "text", "text": format_error_for_response(e)}],
+            content=[TextContent(type="text", text=format_error_for_response(e))],
             is_error=True,
         )
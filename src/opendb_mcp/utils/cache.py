@@ -0,0 +1,47 @@
+"""
+Bounded LRU cache with per-entry expiry for query results.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Optional
+
+from .formatters import QueryResult
+
+
+class QueryResultCache:
+    """LRU cache of query results that expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, QueryResult]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[QueryResult]:
+        """Get a cached result, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: Hashable, result: QueryResult) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self._ttl, result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
@@ -2,16 +2,22 @@
 Result formatters for Markdown and JSON output.
 """
 
+import io
 import json
+from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Literal, Optional
 
 from ..constants import CHARACTER_LIMIT
 
 ResponseFormat = Literal["markdown", "json"]
 
+# Escapes applied to every Markdown table cell
+_MD_ESCAPE = str.maketrans({"|": "\\|", "\n": " "})
 
-@dataclass
+
+@dataclass(slots=True)
 class QueryResult:
     """Result from a database query."""
 
@@ -21,9 +27,9 @@ class QueryResult:
     truncated: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchemaObject:
-    """Database schema object."""
+    """Database schema object (immutable, slotted: built once per listed row)."""
 
     type: Literal["schema", "table", "column", "index", "procedure"]
     name: str
@@ -39,38 +45,58 @@ def _format_value(value: Any) -> str:
     """Format a single value for display."""
     if value is None:
         return "_null_"
+    # Exact-type fast paths for the common scalars; ints and floats never need escaping
+    cls = type(value)
+    if cls is str:
+        return value.translate(_MD_ESCAPE)
+    if cls is int or cls is float:
+        return str(value)
     if isinstance(value, (dict, list)):
         return json.dumps(value)
-    return str(value).replace("|", "\\|").replace("\n", " ")
+    return str(value).translate(_MD_ESCAPE)
+
+
+@lru_cache(maxsize=64)
+def _md_separator(column_count: int) -> str:
+    """Markdown header separator row for a table with column_count columns."""
+    return "| " + " | ".join(["---"] * column_count) + " |"
 
 
-def _format_results_as_markdown(result: QueryResult) -> str:
-    """Format query results as a Markdown table."""
+def _format_results_as_markdown(result: QueryResult, char_limit: int = CHARACTER_LIMIT) -> str:
+    """Format query results as a Markdown table.
+
+    Rows stop being formatted once the table passes char_limit, since the
+    caller truncates the output at that point anyway.
+    """
     if not result.rows:
         return "_No results returned_"
 
     columns = result.columns
     rows = result.rows
 
+    # Written straight into one buffer rather than collected as lines to join
+    buf = io.StringIO()
+    write = buf.write
+
     # Build header
-    lines = [
-        "| " + " | ".join(columns) + " |",
-        "| " + " | ".join("---" for _ in columns) + " |",
-    ]
+    write("| " + " | ".join(columns) + " |\n")
+    write(_md_separator(len(columns)) + "\n")
 
-    # Build rows
+    # Build rows; a column missing from a row renders as null
     for row in rows:
-        values = [_format_value(row.get(col)) for col in columns]
-        lines.append("| " + " | ".join(values) + " |")
+        write("| ")
+        write(" | ".join(_format_value(row.get(col)) for col in columns))
+        write(" |\n")
+        if buf.tell() > char_limit:
+            break
 
     # Add summary
-    lines.append("")
     summary = f"_Showing {len(rows)} of {result.row_count} rows_"
     if result.truncated:
         summary += " _(results truncated)_"
-    lines.append(summary)
+    write("\n" + summary)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def _format_results_as_json(result: QueryResult) -> str:
@@ -111,10 +137,8 @@ def _format_schema_as_markdown(objects: list[SchemaObject]) -> str:
         return "_No objects found_"
 
     # Group by type
-    grouped: dict[str, list[SchemaObject]] = {}
+    grouped: defaultdict[str, list[SchemaObject]] = defaultdict(list)
     for obj in objects:
-        if obj.type not in grouped:
-            grouped[obj.type] = []
         grouped[obj.type].append(obj)
 
     lines = []
@@ -144,23 +168,28 @@ def _format_schema_as_markdown(objects: list[SchemaObject]) -> str:
     return "\n".join(lines).strip()
 
 
+def _schema_object_to_json(obj: Any) -> dict[str, Any]:
+    """json.dumps default hook: shape one SchemaObject as it is serialized."""
+    if isinstance(obj, SchemaObject):
+        return {
+            "type": obj.type,
+            "name": obj.name,
+            "schema": obj.schema,
+            "table": obj.table,
+            "dataType": obj.data_type,
+            "nullable": obj.nullable,
+            "primaryKey": obj.primary_key,
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _format_schema_as_json(objects: list[SchemaObject]) -> str:
-    """Format schema objects as JSON."""
-    return json.dumps(
-        [
-            {
-                "type": obj.type,
-                "name": obj.name,
-                "schema": obj.schema,
-                "table": obj.table,
-                "dataType": obj.data_type,
-                "nullable": obj.nullable,
-                "primaryKey": obj.primary_key,
-            }
-            for obj in objects
-        ],
-        indent=2,
-    )
+    """Format schema objects as JSON.
+
+    Objects are converted by the default hook one at a time while encoding, so
+    a list of intermediate dicts is never built.
+    """
+    return json.dumps(objects, indent=2, default=_schema_object_to_json)
 
 
 def format_schema_objects(objects: list[SchemaObject], fmt: ResponseFormat = "markdown") -> str:
@@ -181,7 +210,7 @@ def format_schema_objects(objects: list[SchemaObject], fmt: ResponseFormat = "ma
     return formatted
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceInfo:
     """Information about a database source."""
 
@@ -191,21 +220,22 @@ class SourceInfo:
     connected: bool = False
 
 
+def _source_info_to_json(source: Any) -> dict[str, Any]:
+    """json.dumps default hook: shape one SourceInfo as it is serialized."""
+    if isinstance(source, SourceInfo):
+        return {
+            "id": source.id,
+            "type": source.type,
+            "readonly": source.readonly,
+            "connected": source.connected,
+        }
+    raise TypeError(f"Object of type {type(source).__name__} is not JSON serializable")
+
+
 def format_sources_list(sources: list[SourceInfo], fmt: ResponseFormat = "markdown") -> str:
     """Format a list of database sources."""
     if fmt == "json":
-        return json.dumps(
-            [
-                {
-                    "id": s.id,
-                    "type": s.type,
-                    "readonly": s.readonly,
-                    "connected": s.connected,
-                }
-                for s in sources
-            ],
-            indent=2,
-        )
+        return json.dumps(sources, indent=2, default=_source_info_to_json)
 
     if not sources:
         return "_No database sources configured_"
@@ -2,19 +2,24 @@
 Logger utility that writes to stderr (not stdout) for stdio transport compatibility.
 """
 
+import json
 import logging
 import os
 import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Optional
 
-# Log level mapping
-LOG_LEVELS = {
-    "debug": logging.DEBUG,
-    "info": logging.INFO,
-    "warn": logging.WARNING,
-    "warning": logging.WARNING,
-    "error": logging.ERROR,
-}
+# Log level mapping (read-only)
+LOG_LEVELS: Mapping[str, int] = MappingProxyType(
+    {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warn": logging.WARNING,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+    }
+)
 
 
 class MCPNotificationFilter(logging.Filter):
@@ -39,17 +44,26 @@ def configure_root_logger() -> None:
 
 
 class StderrHandler(logging.Handler):
-    """Custom handler that always writes to stderr."""
+    """Custom handler that always writes to the current sys.stderr.
+
+    No explicit flush: since Python 3.9 stderr is line-buffered even when
+    redirected, so each newline-terminated record is already written out.
+    """
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
-            sys.stderr.write(msg + "\n")
-            sys.stderr.flush()
+            sys.stderr.write(self.format(record) + "\n")
         except Exception:
             self.handleError(record)
 
 
+# One handler and formatter shared by every Logger instance
+_STDERR_HANDLER = StderrHandler()
+_STDERR_HANDLER.setFormatter(
+    logging.Formatter("[%(asctime)s] %(levelname)-5s %(message)s", datefmt="%Y-%m-%dT%H:%M:%S")
+)
+
+
 class Logger:
     """Logger class that writes to stderr for stdio transport compatibility."""
 
@@ -57,42 +71,34 @@ class Logger:
         self._logger = logging.getLogger(name)
 
         # Set level from environment or default
-        env_level = os.environ.get("LOG_LEVEL", level).lower()
+        env_level = os.environ.get("LOG_LEVEL", level).casefold()
         log_level = LOG_LEVELS.get(env_level, logging.INFO)
         self._logger.setLevel(log_level)
 
         # Remove any existing handlers
         self._logger.handlers.clear()
 
-        # Add stderr handler
-        handler = StderrHandler()
-        formatter = logging.Formatter(
-            "[%(asctime)s] %(levelname)-5s %(message)s", datefmt="%Y-%m-%dT%H:%M:%S"
-        )
-        handler.setFormatter(formatter)
-        self._logger.addHandler(handler)
+        # Add the shared stderr handler
+        self._logger.addHandler(_STDERR_HANDLER)
 
         # Prevent propagation to root logger
         self._logger.propagate = False
 
     def set_level(self, level: str) -> None:
         """Set the log level."""
-        log_level = LOG_LEVELS.get(level.lower(), logging.INFO)
+        log_level = LOG_LEVELS.get(level.casefold(), logging.INFO)
         self._logger.setLevel(log_level)
 
+    def is_enabled_for(self, level: str) -> bool:
+        """Check if messages at a level would be emitted, to skip building them."""
+        return self._logger.isEnabledFor(LOG_LEVELS.get(level.casefold(), logging.INFO))
+
     def _format_meta(self, meta: Optional[Any]) -> str:
         """Format metadata for logging."""
         if meta is None:
             return ""
 
-        if isinstance(meta, Exception):
-            import traceback
-
-            return "\n" + "".join(traceback.format_exception(type(meta), meta, meta.__traceback__))
-
         if isinstance(meta, dict):
-            import json
-
             try:
                 return " " + json.dumps(meta)
             except (TypeError, ValueError):
@@ -100,25 +106,43 @@ class Logger:
 
         return " " + str(meta)
 
-    def debug(self, message: str, meta: Optional[Any] = None) -> None:
-        """Log a debug message."""
-        self._logger.debug(message + self._format_meta(meta))
+    def _log(self, level: int, message: str, args: tuple[Any, ...], meta: Optional[Any]) -> None:
+        """Emit a message if the level is enabled, leaving %-formatting to logging."""
+        if not self._logger.isEnabledFor(level):
+            return
 
-    def info(self, message: str, meta: Optional[Any] = None) -> None:
-        """Log an info message."""
-        self._logger.info(message + self._format_meta(meta))
-
-    def warning(self, message: str, meta: Optional[Any] = None) -> None:
-        """Log a warning message."""
-        self._logger.warning(message + self._format_meta(meta))
-
-    def warn(self, message: str, meta: Optional[Any] = None) -> None:
+        if isinstance(meta, Exception):
+            # Let the handler's Formatter render the traceback (cached on the record)
+            self._logger.log(
+                level, message, *args, exc_info=(type(meta), meta, meta.__traceback__)
+            )
+            return
+
+        meta_str = self._format_meta(meta)
+        if args:
+            # The metadata becomes part of the format string, so escape its % signs
+            meta_str = meta_str.replace("%", "%%")
+        self._logger.log(level, message + meta_str, *args)
+
+    def debug(self, message: str, *args: Any, meta: Optional[Any] = None) -> None:
+        """Log a debug message (%-style args are formatted only if enabled)."""
+        self._log(logging.DEBUG, message, args, meta)
+
+    def info(self, message: str, *args: Any, meta: Optional[Any] = None) -> None:
+        """Log an info message (%-style args are formatted only if enabled)."""
+        self._log(logging.INFO, message, args, meta)
+
+    def warning(self, message: str, *args: Any, meta: Optional[Any] = None) -> None:
+        """Log a warning message (%-style args are formatted only if enabled)."""
+        self._log(logging.WARNING, message, args, meta)
+
+    def warn(self, message: str, *args: Any, meta: Optional[Any] = None) -> None:
         """Alias for warning."""
-        self.warning(message, meta)
+        self.warning(message, *args, meta=meta)
 
-    def error(self, message: str, meta: Optional[Any] = None) -> None:
-        """Log an error message."""
-        self._logger.error(message + self._format_meta(meta))
+    def error(self, message: str, *args: Any, meta: Optional[Any] = None) -> None:
+        """Log an error message (%-style args are formatted only if enabled)."""
+        self._log(logging.ERROR, message, args, meta)
 
 
 # Global logger instance
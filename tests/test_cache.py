@@ -0,0 +1,52 @@
+"""Tests for the query result cache."""
+
+from unittest.mock import patch
+
+from opendb_mcp.utils.cache import QueryResultCache
+from opendb_mcp.utils.formatters import QueryResult
+
+
+def _result(value: int) -> QueryResult:
+    return QueryResult(columns=["v"], rows=[{"v": value}], row_count=1)
+
+
+class TestQueryResultCache:
+    """Tests for QueryResultCache."""
+
+    def test_get_returns_stored_result(self):
+        cache = QueryResultCache(maxsize=4, ttl=30)
+        result = _result(1)
+        cache.set("a", result)
+
+        assert cache.get("a") is result
+        assert cache.get("b") is None
+
+    def test_entries_expire_after_ttl(self):
+        cache = QueryResultCache(maxsize=4, ttl=30)
+
+        with patch("opendb_mcp.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("a", _result(1))
+        with patch("opendb_mcp.utils.cache.time.monotonic", return_value=129.0):
+            assert cache.get("a") is not None
+        with patch("opendb_mcp.utils.cache.time.monotonic", return_value=130.0):
+            assert cache.get("a") is None
+
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = QueryResultCache(maxsize=2, ttl=30)
+        cache.set("a", _result(1))
+        cache.set("b", _result(2))
+        cache.get("a")
+        cache.set("c", _result(3))
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_clear(self):
+        cache = QueryResultCache(maxsize=2, ttl=30)
+        cache.set("a", _result(1))
+        cache.clear()
+
+        assert len(cache) == 0
@@ -1,36 +1,131 @@
 """Tests for database connectors."""
 
+import asyncio
+import threading
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import opendb_mcp.connectors as connectors
 import pytest
-from opendb_mcp.connectors.base import BaseConnector, ConnectorOptions
-from opendb_mcp.config.types import parse_source_config
+from opendb_mcp.config import create_config_from_dsn
+from opendb_mcp.config.types import ParsedConfig, Settings, parse_source_config
+from opendb_mcp.connectors import ConnectorManager, mysql, postgres
+from opendb_mcp.connectors.base import (
+    BaseConnector,
+    ConnectorOptions,
+    ExecuteOptions,
+    SchemaSearchOptions,
+    _classify,
+    _limit_query,
+    _search_regex,
+)
+from opendb_mcp.connectors.hive import HiveConnector
+from opendb_mcp.connectors.impala import ImpalaConnector
+from opendb_mcp.connectors.mysql import MySqlConnector
+from opendb_mcp.connectors.postgres import PostgresConnector
+from opendb_mcp.constants import SCHEMA_CACHE_TTL
+from opendb_mcp.utils.errors import QueryError
+from opendb_mcp.utils.formatters import QueryResult, SchemaObject
 
 
-class TestBaseConnector:
-    """Tests for base connector functionality."""
+def source_config(db_type="postgres", source_id="test"):
+    """Build a minimal host-based source config."""
+    return parse_source_config({"id": source_id, "type": db_type, "host": "localhost"})
 
-    def test_write_query_detection(self):
-        """Test detection of write queries."""
-        config = parse_source_config({"id": "test", "type": "postgres", "host": "localhost"})
 
-        # Create a minimal concrete implementation for testing
-        class TestConnector(BaseConnector):
-            @property
-            def db_type(self):
-                return "test"
+class StubConnector(BaseConnector):
+    """Minimal concrete connector that records the queries and searches it receives."""
+
+    def __init__(self, options=None, truncated=False):
+        super().__init__(source_config(), options)
+        self.truncated = truncated
+        self.queries: list[str] = []
+        self.searches: list[SchemaSearchOptions] = []
+
+    @property
+    def db_type(self):
+        return "test"
+
+    async def connect(self):
+        self._is_connected = True
+
+    async def disconnect(self):
+        self._is_connected = False
+
+    async def _execute_query(self, sql, params, max_rows, timeout):
+        self.queries.append(sql)
+        return QueryResult(
+            columns=["sql"], rows=[{"sql": sql}], row_count=1, truncated=self.truncated
+        )
+
+    async def _search_objects(self, options=None):
+        self.searches.append(options)
+        return [SchemaObject(type="schema", name="public")]
+
+
+def make_pool(conn):
+    """Build a pool mock whose acquire() context manager yields conn."""
+    pool = MagicMock()
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    return pool
+
+
+@pytest.fixture
+def pg_conn():
+    """asyncpg connection mock; fetch and cursor reads return no rows by default."""
+    cursor = MagicMock()
+    cursor.fetch = AsyncMock(return_value=[])
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=[])
+    conn.cursor = AsyncMock(return_value=cursor)
+    conn.transaction.return_value.__aenter__ = AsyncMock()
+    conn.transaction.return_value.__aexit__ = AsyncMock(return_value=False)
+    return conn
+
 
-            async def connect(self):
-                pass
+@pytest.fixture
+def pg_connector(pg_conn):
+    """PostgresConnector whose pool hands out pg_conn."""
+    connector = PostgresConnector(source_config(source_id="pg"))
+    connector._pool = make_pool(pg_conn)
+    return connector
 
-            async def disconnect(self):
-                pass
 
-            async def _execute_query(self, sql, params, max_rows, timeout):
-                pass
+@pytest.fixture
+def mysql_cursor():
+    """aiomysql cursor mock usable as an async context manager."""
+    cursor = MagicMock()
+    cursor.execute = AsyncMock()
+    cursor.fetchmany = AsyncMock(return_value=[])
+    cursor.fetchall = AsyncMock(return_value=[])
+    cursor.__aenter__ = AsyncMock(return_value=cursor)
+    cursor.__aexit__ = AsyncMock(return_value=False)
+    return cursor
 
-            async def search_objects(self, options=None):
-                return []
 
-        connector = TestConnector(config, ConnectorOptions(readonly=True))
+@pytest.fixture
+def mysql_conn(mysql_cursor):
+    """aiomysql connection mock that opens mysql_cursor."""
+    conn = MagicMock()
+    conn.cursor.return_value = mysql_cursor
+    return conn
+
+
+@pytest.fixture
+def mysql_connector(mysql_conn):
+    """MySqlConnector whose pool hands out mysql_conn."""
+    connector = MySqlConnector(source_config("mysql", "mysql"))
+    connector._pool = make_pool(mysql_conn)
+    return connector
+
+
+class TestBaseConnector:
+    """Tests for base connector functionality."""
+
+    def test_write_query_detection(self):
+        """Test detection of write queries."""
+        connector = StubConnector(ConnectorOptions(readonly=True))
 
         # Test various query types
         assert connector._is_write_query("SELECT * FROM users") is False
@@ -48,29 +143,15 @@ class TestBaseConnector:
 
         # With leading whitespace
         assert connector._is_write_query("  SELECT * FROM users") is False
+        assert connector._is_write_query("\n\t delete from users") is True
+
+        # Keyword glued to a comment or parenthesis
+        assert connector._is_write_query("DELETE/**/FROM users") is True
+        assert connector._is_write_query("REPLACE(INTO) users") is True
 
     def test_limit_wrapping(self):
         """Test LIMIT clause wrapping."""
-        config = parse_source_config({"id": "test", "type": "postgres", "host": "localhost"})
-
-        class TestConnector(BaseConnector):
-            @property
-            def db_type(self):
-                return "test"
-
-            async def connect(self):
-                pass
-
-            async def disconnect(self):
-                pass
-
-            async def _execute_query(self, sql, params, max_rows, timeout):
-                pass
-
-            async def search_objects(self, options=None):
-                return []
-
-        connector = TestConnector(config)
+        connector = StubConnector()
 
         # Should add LIMIT
         result = connector._wrap_with_limit("SELECT * FROM users", 100)
@@ -88,4 +169,908 @@ class TestBaseConnector:
         result = connector._wrap_with_limit("SELECT * FROM users ORDER BY id", 100)
         assert result == "SELECT * FROM users ORDER BY id LIMIT 100"
 
+        # Should detect an existing LIMIT on its own line
+        sql = "SELECT *\nFROM users\nLIMIT 10"
+        assert connector._wrap_with_limit(sql, 100) == sql
+
+        # Should not mistake identifiers for row-limit keywords
+        result = connector._wrap_with_limit("select fetch_date from top_users", 100)
+        assert result == "select fetch_date from top_users LIMIT 100"
+
+    def test_classify_and_limit_query(self):
+        """Test the module-level classifier used by execute and _wrap_with_limit."""
+        sql = "SELECT id FROM users"
+
+        assert _classify(sql) == (False, True)
+        assert _classify("DELETE/**/FROM users") == (True, False)
+        assert _limit_query(sql, 50) == "SELECT id FROM users LIMIT 50"
+
+
+class TestConnectorExports:
+    """Tests for lazily imported connector classes."""
+
+    def test_lazy_connector_attribute(self):
+        """Test that connector classes resolve on attribute access."""
+        assert connectors.HiveConnector is HiveConnector
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            connectors.SqliteConnector
+
+
+class FakeConnector:
+    """Minimal connector stand-in for ConnectorManager tests."""
+
+    source_id = "fake"
+
+    def __init__(self, barrier=None, error=None):
+        self.barrier = barrier
+        self.error = error
+        self.connected = False
+        self.connect_calls = 0
+
+    @property
+    def is_connected(self):
+        return self.connected
+
+    async def connect(self):
+        self.connect_calls += 1
+        if self.barrier:
+            await self.barrier()
+        if self.error:
+            raise self.error
+        self.connected = True
+
+    async def disconnect(self):
+        if self.error:
+            raise self.error
+        self.connected = False
+
+
+@pytest.mark.asyncio
+class TestConnectorManagerConnectAll:
+    """Tests for concurrent connect/disconnect in ConnectorManager."""
+
+    def _manager(self, sources):
+        manager = ConnectorManager(create_config_from_dsn("postgres://localhost/test"))
+        manager._connectors = sources
+        return manager
+
+    async def test_connects_sources_concurrently(self):
+        """Test that every connect starts before any of them finishes."""
+        started = asyncio.Event()
+        pending = {"count": 2}
+
+        async def barrier():
+            pending["count"] -= 1
+            if pending["count"] == 0:
+                started.set()
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+        a, b = FakeConnector(barrier), FakeConnector(barrier)
+        await self._manager({"a": a, "b": b}).connect_all()
+
+        assert a.connected and b.connected
+
+    async def test_partial_failure_does_not_raise(self):
+        """Test that one failing source does not fail the whole startup."""
+        good = FakeConnector()
+        manager = self._manager({"good": good, "bad": FakeConnector(error=OSError("down"))})
+
+        await manager.connect_all()
+
+        assert good.connected
+
+    async def test_all_failures_raise(self):
+        """Test that failing every source raises with all error messages."""
+        manager = self._manager({
+            "a": FakeConnector(error=OSError("a down")),
+            "b": FakeConnector(error=OSError("b down")),
+        })
+
+        with pytest.raises(RuntimeError) as exc_info:
+            await manager.connect_all()
+
+        assert "a: a down" in str(exc_info.value)
+        assert "b: b down" in str(exc_info.value)
+
+    async def test_disconnect_errors_are_logged_not_raised(self):
+        """Test that disconnect failures do not stop other sources from disconnecting."""
+        good = FakeConnector()
+        good.connected = True
+        manager = self._manager({"bad": FakeConnector(error=OSError("boom")), "good": good})
+
+        await manager.disconnect_all()
+
+        assert good.connected is False
+
+    async def test_concurrent_first_use_connects_once(self):
+        """Test that concurrent requests for a cold source share one connect."""
+        gate = asyncio.Event()
+        connector = FakeConnector(barrier=gate.wait)
+        manager = self._manager({"a": connector})
+
+        waiters = [asyncio.create_task(manager.resolve_connected("a")) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        resolved = await asyncio.gather(*waiters)
+
+        assert resolved == [connector] * 3
+        assert connector.connect_calls == 1
+
+
+class TestConnectorManagerOptions:
+    """Tests for connector options sharing in ConnectorManager."""
+
+    def test_sources_share_options_by_readonly_mode(self):
+        """Test that sources with the same readonly mode share one options object."""
+        sources = {
+            source_id: parse_source_config({"id": source_id, "type": "postgres", **extra})
+            for source_id, extra in (
+                ("a", {"host": "a"}),
+                ("b", {"host": "b"}),
+                ("ro", {"host": "c", "readonly": True}),
+            )
+        }
+        manager = ConnectorManager(
+            ParsedConfig(settings=Settings(max_rows=42, pool_max=7), sources=sources)
+        )
+
+        a, b, ro = (manager.get(source_id).options for source_id in ("a", "b", "ro"))
+        assert a is b
+        assert a.readonly is False
+        assert ro.readonly is True
+        assert ro.max_rows == a.max_rows == 42
+        assert ro.pool_max == a.pool_max == 7
+
+    def test_resolve_uses_default_connector(self):
+        """Test that resolve() without a source ID returns the single source or fails."""
+        single = ConnectorManager(create_config_from_dsn("postgres://localhost/test"))
+        assert single.resolve() is single.resolve(single.list_source_ids()[0])
+
+        sources = {
+            source_id: parse_source_config({"id": source_id, "type": "postgres", "host": "h"})
+            for source_id in ("a", "b")
+        }
+        multiple = ConnectorManager(ParsedConfig(settings=Settings(), sources=sources))
+        with pytest.raises(ValueError, match="specify source_id"):
+            multiple.resolve()
+
+
+@pytest.mark.asyncio
+class TestHiveSchemaCache:
+    """Tests for Hive schema listings and their caching via BaseConnector.search_objects."""
+
+    def _connector(self):
+        connector = HiveConnector(source_config("hive", "hive"))
+        calls: list[str] = []
+
+        async def execute(sql, options=None):
+            calls.append(sql)
+            rows = [{"database_name": "sales"}, {"database_name": "hr"}]
+            if " LIKE '*" in sql:
+                needle = sql.split("'*")[1].split("*'")[0]
+                rows = [row for row in rows if needle in row["database_name"]]
+            return QueryResult(columns=["database_name"], rows=rows, row_count=len(rows))
+
+        connector.execute = execute  # type: ignore[method-assign]
+        return connector, calls
+
+    async def test_repeated_listing_is_served_from_cache(self):
+        """Test that repeated searches reuse one SHOW DATABASES."""
+        connector, calls = self._connector()
+
+        first = await connector.search_objects(SchemaSearchOptions(object_type="schema"))
+        second = await connector.search_objects(SchemaSearchOptions(object_type="schema"))
+
+        assert [obj.name for obj in first] == [obj.name for obj in second] == ["sales", "hr"]
+        assert calls == ["SHOW DATABASES"]
+
+    async def test_pattern_is_pushed_into_show_like(self):
+        """Test that simple patterns are filtered by Hive via SHOW ... LIKE."""
+        connector, calls = self._connector()
+
+        objects = await connector.search_objects(
+            SchemaSearchOptions(object_type="schema", pattern="sal")
+        )
+
+        assert [obj.name for obj in objects] == ["sales"]
+        assert calls == ["SHOW DATABASES LIKE '*sal*'"]
+
+    async def test_unsafe_pattern_is_filtered_client_side(self):
+        """Test that patterns needing escaping are not inlined into SQL."""
+        connector, calls = self._connector()
+
+        objects = await connector.search_objects(
+            SchemaSearchOptions(object_type="schema", pattern="h'r")
+        )
+
+        assert objects == []
+        assert calls == ["SHOW DATABASES"]
+
+        objects = await connector.search_objects(
+            SchemaSearchOptions(object_type="schema", pattern="%SA.%")
+        )
+        assert objects == []
+
+    async def test_expired_entries_are_refetched(self):
+        """Test that listings older than the TTL are queried again."""
+        connector, calls = self._connector()
+        options = SchemaSearchOptions(object_type="schema")
+
+        with patch("opendb_mcp.connectors.base.time.monotonic", return_value=100.0):
+            await connector.search_objects(options)
+        with patch(
+            "opendb_mcp.connectors.base.time.monotonic",
+            return_value=100.0 + SCHEMA_CACHE_TTL,
+        ):
+            await connector.search_objects(options)
+
+        assert calls == ["SHOW DATABASES", "SHOW DATABASES"]
+
+    async def test_unfiltered_search_runs_listings_in_order(self):
+        """Test that schema and table listings both run, schemas first."""
+        connector, calls = self._connector()
+
+        objects = await connector.search_objects()
+
+        assert calls == ["SHOW DATABASES", "SHOW TABLES IN default"]
+        assert [obj.type for obj in objects] == ["schema", "schema", "table", "table"]
+        assert objects[2].schema == "default"
+
+    async def test_disconnect_clears_cache(self):
+        """Test that disconnecting drops cached listings."""
+        connector, calls = self._connector()
+        options = SchemaSearchOptions(object_type="schema")
+
+        await connector.search_objects(options)
+        await connector.disconnect()
+        await connector.search_objects(options)
+
+        assert calls == ["SHOW DATABASES", "SHOW DATABASES"]
+
+
+class FakeCursor:
+    """Minimal DB-API cursor over a fixed result set."""
+
+    def __init__(self, columns, rows):
+        self.description = [(name, None) for name in columns] if columns else None
+        self._rows = rows
+        self.fetch_sizes: list[int] = []
+        self.error: Optional[Exception] = None
+        self.closed = False
+
+    def execute(self, sql, params=None):
+        if self.error:
+            raise self.error
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        return self._rows[:size]
+
+    def close(self):
+        self.closed = True
+
+
+class TestHiveExecuteSync:
+    """Tests for Hive synchronous result fetching."""
+
+    def _connector(self, cursor):
+        connector = HiveConnector(source_config("hive", "hive"))
+        connector._connection = MagicMock()
+        connector._connection.cursor.return_value = cursor
+        return connector
+
+    def test_fetches_one_batch_and_truncates(self):
+        """Test that rows are fetched in one max_rows + 1 batch."""
+        cursor = FakeCursor(["id", "name"], [(i, f"user{i}") for i in range(5)])
+
+        result = self._connector(cursor)._execute_sync("SELECT * FROM users", None, 3)
+
+        assert cursor.fetch_sizes == [4]
+        assert result.columns == ["id", "name"]
+        assert result.rows == [{"id": i, "name": f"user{i}"} for i in range(3)]
+        assert result.truncated is True
+
+    def test_statement_without_results(self):
+        """Test that statements without a result set return an empty result."""
+        cursor = FakeCursor(None, [])
+
+        result = self._connector(cursor)._execute_sync("SET x=1", None, 3)
+
+        assert cursor.fetch_sizes == []
+        assert result.rows == []
+        assert result.truncated is False
+
+    def test_cursor_is_reused_between_queries(self):
+        """Test that one cursor serves consecutive queries on a connection."""
+        cursor = FakeCursor(["id"], [(1,)])
+        connector = self._connector(cursor)
+
+        connector._execute_sync("SELECT 1", None, 10)
+        connector._execute_sync("SELECT 1", None, 10)
+
+        connector._connection.cursor.assert_called_once()
+        assert cursor.closed is False
+
+    def test_failed_query_discards_cursor(self):
+        """Test that a failing query closes the cursor so the next one gets a fresh one."""
+        cursor = FakeCursor(["id"], [(1,)])
+        cursor.error = RuntimeError("lost session")
+        connector = self._connector(cursor)
+
+        with pytest.raises(RuntimeError):
+            connector._execute_sync("SELECT 1", None, 10)
+
+        assert cursor.closed is True
+        assert connector._cursor is None
+
+
+class TestImpalaExecuteSync:
+    """Tests for Impala synchronous result fetching."""
+
+    def test_fetches_one_batch_and_truncates(self):
+        """Test that rows are fetched in one max_rows + 1 batch and the cursor is closed."""
+        cursor = FakeCursor(["id", "name"], [(i, f"user{i}") for i in range(5)])
+        connector = ImpalaConnector(source_config("impala", "impala"))
+        connector._connection = MagicMock()
+        connector._connection.cursor.return_value = cursor
+
+        result = connector._execute_sync("SELECT * FROM users", None, 3)
+
+        assert cursor.fetch_sizes == [4]
+        assert result.rows == [{"id": i, "name": f"user{i}"} for i in range(3)]
+        assert result.truncated is True
+        assert cursor.closed is True
+
+
+@pytest.mark.asyncio
+class TestImpalaSearchObjects:
+    """Tests for Impala schema search."""
+
+    async def test_pattern_is_pushed_into_show(self):
+        """Test that simple patterns filter on the server and others client-side."""
+        connector = ImpalaConnector(source_config("impala", "impala"))
+        connector._is_connected = True
+        connector._execute_query = AsyncMock(
+            return_value=QueryResult(
+                columns=["name"],
+                rows=[{"name": "sales"}, {"name": "sales-eu"}],
+                row_count=2,
+                truncated=False,
+            )
+        )
+
+        await connector.search_objects(SchemaSearchOptions(object_type="schema", pattern="sal"))
+        objects = await connector.search_objects(
+            SchemaSearchOptions(object_type="schema", pattern="s-e")
+        )
+
+        sqls = [c.args[0] for c in connector._execute_query.await_args_list]
+        assert sqls == ["SHOW DATABASES LIKE '*sal*'", "SHOW DATABASES"]
+        assert [obj.name for obj in objects] == ["sales-eu"]
+
+
+@pytest.mark.asyncio
+class TestHiveWorkerThread:
+    """Tests for the Hive connector's dedicated worker thread."""
+
+    async def test_calls_run_on_one_named_thread(self):
+        """Test that blocking calls share a single per-connector thread."""
+        connector = HiveConnector(source_config("hive", "warehouse"))
+
+        first = await connector._run_sync(threading.current_thread)
+        second = await connector._run_sync(threading.current_thread)
+
+        assert first is second
+        assert first.name.startswith("hive-warehouse")
+
+    async def test_disconnect_shuts_down_executor(self):
+        """Test that disconnecting releases the worker thread."""
+        connector = HiveConnector(source_config("hive", "hive"))
+        await connector._run_sync(int)
+        executor = connector._executor
+
+        await connector.disconnect()
+
+        assert connector._executor is None
+        assert executor is not None and executor._shutdown
+
+
+@pytest.mark.asyncio
+class TestMySqlConnect:
+    """Tests for MySQL connection setup."""
+
+    async def test_connect_skips_probe_query(self):
+        """Test that connect relies on the pool's own connections instead of SELECT 1."""
+        pool = MagicMock()
+        connector = MySqlConnector(source_config("mysql", "mysql"))
+
+        with patch("opendb_mcp.connectors.mysql.aiomysql") as aiomysql:
+            aiomysql.create_pool = AsyncMock(return_value=pool)
+            await connector.connect()
+
+        pool.acquire.assert_not_called()
+        assert connector.is_connected
+
+    async def test_connection_kwargs_by_config_type(self):
+        """Test that DSN and host-based configs map to aiomysql arguments."""
+        dsn = MySqlConnector(
+            parse_source_config(
+                {"id": "a", "type": "mysql", "dsn": "mysql://root:pw@db:3307/shop"}
+            )
+        )
+        host = MySqlConnector(
+            parse_source_config({"id": "b", "type": "mysql", "host": "db", "database": "shop"})
+        )
+
+        assert dsn._get_connection_kwargs() == {
+            "host": "db",
+            "port": 3307,
+            "user": "root",
+            "password": "pw",
+            "db": "shop",
+        }
+        assert host._get_connection_kwargs() == {"host": "db", "port": 3306, "db": "shop"}
+
+
+@pytest.mark.asyncio
+class TestMySqlExecuteQuery:
+    """Tests for MySQL result fetching."""
+
+    async def test_streams_at_most_max_rows_plus_one(
+        self, mysql_connector, mysql_conn, mysql_cursor
+    ):
+        """Test that rows come from one bounded fetch on an unbuffered dict cursor."""
+        cursor = mysql_cursor
+        cursor.description = [("id",), ("name",)]
+        cursor.fetchmany.return_value = [{"id": i, "name": f"user{i}"} for i in range(4)]
+
+        with patch("opendb_mcp.connectors.mysql.aiomysql") as aiomysql:
+            result = await mysql_connector._execute_query("SELECT * FROM users", None, 3, None)
+
+        mysql_conn.cursor.assert_called_once_with(aiomysql.SSDictCursor)
+        cursor.execute.assert_awaited_once_with("SELECT * FROM users LIMIT 4")
+        cursor.fetchmany.assert_awaited_once_with(4)
+        assert result.columns == ["id", "name"]
+        assert len(result.rows) == 3
+        assert result.truncated is True
+
+    async def test_without_pool_raises_query_error(self):
+        """Test that querying before connect fails with a QueryError."""
+        connector = MySqlConnector(source_config("mysql", "mysql"))
+
+        with pytest.raises(QueryError, match="Not connected"):
+            await connector._execute_query("SELECT 1", None, 10, None)
+
+
+@pytest.mark.asyncio
+class TestMySqlSearchObjects:
+    """Tests for MySQL schema search."""
+
+    async def test_schemas_and_tables_use_one_query(self, mysql_connector, mysql_cursor):
+        """Test that an untyped search fetches schemas and tables in one round-trip."""
+        cursor = mysql_cursor
+        cursor.fetchall.return_value = [
+            {"kind": "schema", "name": "shop", "schema_name": None},
+            {"kind": "table", "name": "orders", "schema_name": "shop"},
+        ]
+
+        with patch("opendb_mcp.connectors.mysql.aiomysql"):
+            objects = await mysql_connector.search_objects()
+
+        cursor.execute.assert_awaited_once()
+        query, params = cursor.execute.await_args.args
+        assert "UNION ALL" in query
+        assert params == ("%", "%")
+        assert [(obj.type, obj.name, obj.schema) for obj in objects] == [
+            ("schema", "shop", None),
+            ("table", "orders", "shop"),
+        ]
+
+    async def test_queries_are_prebuilt_per_filter(self):
+        """Test that each filter combination maps to one prebuilt query string."""
+        assert mysql._Q_TABLES_BY_SCHEMA.count("%s") == 2
+        assert mysql._Q_TABLES_BY_SCHEMA.index("TABLE_SCHEMA = %s") < (
+            mysql._Q_TABLES_BY_SCHEMA.index("ORDER BY")
+        )
+        for (by_schema, by_table), query in mysql._Q_INDEXES.items():
+            assert query.count("%s") == 1 + by_schema + by_table
+            assert query.rstrip().endswith("LIMIT 100")
+
+
+@pytest.mark.asyncio
+class TestHiveColumnSearch:
+    """Tests for Hive column search over DESCRIBE output."""
+
+    async def test_reads_named_and_positional_columns(self):
+        """Test that DESCRIBE rows are read by key name with a positional fallback."""
+        connector = HiveConnector(source_config("hive", "hive"))
+
+        async def fetch_schema_rows(sql):
+            return [
+                {"col_name": "id", "data_type": "bigint", "comment": None},
+                {"field": "name", "type": "string"},
+                {"col_name": "# Partition Information", "data_type": ""},
+            ]
+
+        connector._fetch_schema_rows = fetch_schema_rows  # type: ignore[method-assign]
+
+        objects = await connector.search_objects(
+            SchemaSearchOptions(object_type="column", schema="db", table="users")
+        )
+
+        assert [(obj.name, obj.data_type) for obj in objects] == [
+            ("id", "bigint"),
+            ("name", "string"),
+        ]
+
+
+@pytest.mark.asyncio
+class TestBaseConnectorResultCache:
+    """Tests for query result caching in BaseConnector.execute."""
+
+    def _connector(self, ttl=30.0, truncated=False, size=256):
+        connector = StubConnector(
+            ConnectorOptions(result_cache_ttl=ttl, result_cache_size=size), truncated=truncated
+        )
+        connector._is_connected = True
+        return connector, connector.queries
+
+    async def test_repeated_reads_are_cached(self):
+        """Test that identical reads hit the database once."""
+        connector, calls = self._connector()
+
+        first = await connector.execute("SELECT 1")
+        second = await connector.execute("SELECT 1")
+        await connector.execute("SELECT 1", ExecuteOptions(params=[1]))
+
+        assert second is first
+        assert calls == ["SELECT 1", "SELECT 1"]
+
+    async def test_writes_invalidate_cache(self):
+        """Test that a non-read statement drops cached results."""
+        connector, calls = self._connector()
+
+        await connector.execute("SELECT 1")
+        await connector.execute("UPDATE t SET x = 1")
+        await connector.execute("SELECT 1")
+
+        assert calls == ["SELECT 1", "UPDATE t SET x = 1", "SELECT 1"]
+
+    async def test_disabled_and_truncated_results_are_not_cached(self):
+        """Test that ttl=0 disables caching and truncated results are never stored."""
+        disabled, disabled_calls = self._connector(ttl=0)
+        truncated, truncated_calls = self._connector(truncated=True)
+
+        for connector in (disabled, truncated):
+            await connector.execute("SELECT 1")
+            await connector.execute("SELECT 1")
+
+        assert disabled._result_cache is None
+        assert disabled_calls == truncated_calls == ["SELECT 1", "SELECT 1"]
+
+    async def test_cache_size_bounds_entries(self):
+        """Test that result_cache_size caps how many results are kept."""
+        connector, calls = self._connector(size=2)
+
+        for sql in ("SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1"):
+            await connector.execute(sql)
+
+        assert len(connector._result_cache) == 2
+        assert calls == ["SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1"]
+
+    async def test_unhashable_params_skip_cache(self):
+        """Test that unhashable parameters bypass the cache instead of failing."""
+        connector, calls = self._connector()
+        options = ExecuteOptions(params=[{"a": 1}])
+
+        await connector.execute("SELECT %s", options)
+        await connector.execute("SELECT %s", options)
+
+        assert calls == ["SELECT %s", "SELECT %s"]
+
+
+class TestHiveSearchRegex:
+    """Tests for Hive client-side pattern matching."""
+
+    def test_search_regex(self):
+        """Test that client-side patterns match literal, case-insensitive substrings."""
+        assert _search_regex("%") is None
+        needle_re = _search_regex("%Sa.l%")
+        assert needle_re is not None
+        assert needle_re.search("my_sa.les")
+        assert not needle_re.search("sales")
+
+
+@pytest.mark.asyncio
+class TestBatchExecutor:
+    """Tests for running queued queries through BatchExecutor."""
+
+    def _connector(self, pool_max=10):
+        connector = StubConnector(ConnectorOptions(pool_max=pool_max))
+        connector._is_connected = True
+        state = {"running": 0, "peak": 0}
+
+        async def slow_query(sql, params, max_rows, timeout):
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+            if sql == "FAIL":
+                raise RuntimeError("boom")
+            return QueryResult(columns=["sql"], rows=[{"sql": sql}], row_count=1)
+
+        connector._execute_query = slow_query  # type: ignore[method-assign]
+        return connector, state
+
+    async def test_results_in_order_with_bounded_concurrency(self):
+        """Test that queries run concurrently up to pool_max and keep their order."""
+        connector, state = self._connector(pool_max=2)
+        batch = connector.batch()
+        futures = [batch.add(f"SELECT {i}") for i in range(5)]
+
+        results = await batch.execute()
+
+        assert [r.rows[0]["sql"] for r in results] == [f"SELECT {i}" for i in range(5)]
+        assert [f.result() for f in futures] == results
+        assert state["peak"] == 2
+
+    async def test_failure_raises_after_all_queries_finish(self):
+        """Test that one failing query does not cancel the rest of the batch."""
+        connector, _ = self._connector()
+        batch = connector.batch()
+        ok = batch.add("SELECT 1")
+        failed = batch.add("FAIL")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await batch.execute(max_workers=1)
+
+        assert ok.result().rows == [{"sql": "SELECT 1"}]
+        assert isinstance(failed.exception(), RuntimeError)
+
+
+@pytest.mark.asyncio
+class TestPostgresConnector:
+    """Tests for the PostgreSQL connector."""
+
+    async def test_pool_uses_connector_options(self):
+        """Test that pool sizing and lifecycle come from ConnectorOptions."""
+        pool = MagicMock()
+        connector = PostgresConnector(
+            source_config(source_id="pg"),
+            ConnectorOptions(pool_min=3, pool_max=8, statement_cache_size=512),
+        )
+
+        with patch("opendb_mcp.connectors.postgres.asyncpg") as asyncpg:
+            asyncpg.create_pool = AsyncMock(return_value=pool)
+            await connector.connect()
+
+        kwargs = asyncpg.create_pool.await_args.kwargs
+        assert (kwargs["min_size"], kwargs["max_size"]) == (3, 8)
+        assert kwargs["statement_cache_size"] == 512
+        assert kwargs["max_queries"] == 50000
+        assert kwargs["max_inactive_connection_lifetime"] == 300.0
+        pool.acquire.assert_not_called()
+        assert connector.is_connected
+
+    async def test_readonly_sessions_are_read_only(self):
+        """Test that readonly sources also open read-only sessions on the server."""
+        config = source_config(source_id="pg")
+        readonly = PostgresConnector(config, ConnectorOptions(readonly=True))
+        writable = PostgresConnector(config)
+
+        with patch("opendb_mcp.connectors.postgres.asyncpg") as asyncpg:
+            asyncpg.create_pool = AsyncMock(return_value=MagicMock())
+            await readonly.connect()
+            await writable.connect()
+
+        readonly_kwargs, writable_kwargs = (
+            c.kwargs for c in asyncpg.create_pool.await_args_list
+        )
+        assert readonly_kwargs["server_settings"] == {"default_transaction_read_only": "on"}
+        assert "server_settings" not in writable_kwargs
+
+    async def test_row_limit_is_bound_as_parameter(self, pg_connector, pg_conn):
+        """Test that the LIMIT is a bind parameter, so the SQL text ignores max_rows."""
+        connector, conn = pg_connector, pg_conn
+        await connector._execute_query("SELECT * FROM t WHERE id = $1", [7], 10, None)
+        await connector._execute_query("SELECT * FROM t WHERE id = $1", [7], 50, None)
+        await connector._execute_query("UPDATE t SET x = 1", None, 10, None)
+
+        calls = [c.args for c in conn.fetch.await_args_list]
+        assert calls == [
+            ("SELECT * FROM t WHERE id = $1 LIMIT $2", 7, 11),
+            ("SELECT * FROM t WHERE id = $1 LIMIT $2", 7, 51),
+            ("UPDATE t SET x = 1",),
+        ]
+
+    async def test_untyped_search_uses_one_union_query(self, pg_connector, pg_conn):
+        """Test that an untyped search fetches schemas and tables in one round-trip."""
+        connector, conn = pg_connector, pg_conn
+        conn.fetch.return_value = [
+            {"kind": "schema", "name": "public", "schema_name": None},
+            {"kind": "table", "name": "users", "schema_name": "public"},
+        ]
+        objects = await connector.search_objects()
+        await connector.search_objects(SchemaSearchOptions(pattern="use"))
+
+        # Without a pattern the LIKE filters are skipped by binding NULL
+        assert [c.args for c in conn.fetch.await_args_list] == [
+            (postgres._Q_SCHEMAS_AND_TABLES_ALL, None),
+            (postgres._Q_SCHEMAS_AND_TABLES_ALL, "%use%"),
+        ]
+        assert [(obj.type, obj.name, obj.schema) for obj in objects] == [
+            ("schema", "public", None),
+            ("table", "users", "public"),
+        ]
+
+    async def test_column_search_reads_pg_catalog(self, pg_connector, pg_conn):
+        """Test that column search filters by schema and maps catalog booleans."""
+        connector, conn = pg_connector, pg_conn
+        conn.fetch.return_value = [
+            {
+                "column_name": "id",
+                "data_type": "integer",
+                "is_nullable": False,
+                "is_primary_key": True,
+            },
+            {
+                "column_name": "email",
+                "data_type": "character varying",
+                "is_nullable": True,
+                "is_primary_key": False,
+            },
+        ]
+        objects = await connector.search_objects(
+            SchemaSearchOptions(object_type="column", schema="public", table="users")
+        )
+
+        conn.fetch.assert_awaited_once_with(
+            postgres._Q_COLUMNS_BY_SCHEMA, "users", None, "public"
+        )
+        assert [(obj.name, obj.nullable, obj.primary_key) for obj in objects] == [
+            ("id", False, True),
+            ("email", True, False),
+        ]
+
+    async def test_column_query_matches_information_schema(self):
+        """Test that the pg_catalog column query keeps information_schema's output rules."""
+        query = postgres._Q_COLUMNS
+        # Same relation kinds as information_schema.columns (no materialized views)
+        assert "c.relkind IN ('r', 'p', 'v', 'f')" in query
+        # Same privilege filtering: only columns the user may access are listed
+        assert "has_column_privilege(c.oid, a.attnum, 'SELECT, INSERT, UPDATE, REFERENCES')" in (
+            query
+        )
+        # Type names without modifiers, e.g. "character varying" not "...(255)"
+        assert "format_type(a.atttypid, NULL)" in query
+        assert "'USER-DEFINED'" in query and "'ARRAY'" in query
+
+    async def test_records_are_trimmed_then_converted(self, pg_connector, pg_conn):
+        """Test that only the returned records are converted to dicts."""
+
+        class Record(dict):
+            """dict subclass standing in for asyncpg.Record (iterates over values)."""
+
+            def __iter__(self):
+                return iter(self.values())
+
+        pg_conn.fetch.return_value = [Record(id=i, name=f"u{i}") for i in range(4)]
+
+        result = await pg_connector._execute_query("SELECT * FROM users", None, 3, None)
+
+        assert result.columns == ["id", "name"]
+        assert result.rows == [{"id": i, "name": f"u{i}"} for i in range(3)]
+        assert all(type(row) is dict for row in result.rows)
+        assert (result.row_count, result.truncated) == (4, True)
+
+    async def test_select_with_own_limit_reads_through_cursor(self, pg_connector, pg_conn):
+        """Test that a SELECT with its own LIMIT stops reading at max_rows + 1."""
+        connector, conn = pg_connector, pg_conn
+        cursor = conn.cursor.return_value
+
+        await connector._execute_query("SELECT * FROM t LIMIT 100000", None, 10, 5)
+
+        conn.cursor.assert_awaited_once_with("SELECT * FROM t LIMIT 100000", timeout=5)
+        cursor.fetch.assert_awaited_once_with(11, timeout=5)
+        conn.transaction.assert_called_once()
+
+    async def test_select_that_cannot_be_a_cursor_falls_back_to_fetch(
+        self, pg_connector, pg_conn
+    ):
+        """Test that SELECT ... INTO, which cannot open a cursor, still runs via fetch."""
+        connector, conn = pg_connector, pg_conn
+        conn.cursor.side_effect = Exception("SELECT ... INTO is not allowed here")
+
+        sql = "SELECT * INTO t2 FROM t LIMIT 5"
+        result = await connector._execute_query(sql, None, 10, 5)
+
+        conn.fetch.assert_awaited_once_with(sql, timeout=5)
+        assert result.row_count == 0
+
+    async def test_cursor_fetch_error_is_not_retried(self, pg_connector, pg_conn):
+        """Test that an error while reading an open cursor is raised, not re-run."""
+        connector, conn = pg_connector, pg_conn
+        conn.cursor.return_value.fetch.side_effect = Exception("division by zero")
+
+        with pytest.raises(QueryError, match="division by zero"):
+            await connector._execute_query("SELECT 1 / 0 LIMIT 5", None, 10, None)
+
+        conn.fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestBaseConnectorSchemaCache:
+    """Tests for schema search caching in BaseConnector.search_objects."""
+
+    def _connector(self, ttl=60.0):
+        connector = StubConnector(ConnectorOptions(schema_cache_ttl=ttl))
+        return connector, connector.searches
+
+    async def test_repeated_search_is_cached(self):
+        """Test that identical searches reach the database once."""
+        connector, calls = self._connector()
+
+        first = await connector.search_objects()
+        first.clear()
+        second = await connector.search_objects(SchemaSearchOptions())
+        await connector.search_objects(SchemaSearchOptions(pattern="pub"))
+
+        assert [obj.name for obj in second] == ["public"]
+        assert [(o.object_type, o.pattern) for o in calls] == [(None, None), (None, "pub")]
+
+    async def test_refresh_and_ttl(self):
+        """Test that refresh_schema and expiry force a new search."""
+        connector, calls = self._connector()
+
+        with patch("opendb_mcp.connectors.base.time.monotonic", return_value=100.0):
+            await connector.search_objects()
+            connector.refresh_schema()
+            await connector.search_objects()
+        with patch("opendb_mcp.connectors.base.time.monotonic", return_value=160.0):
+            await connector.search_objects()
+
+        assert len(calls) == 3
+
+    async def test_ddl_invalidates_cached_search(self):
+        """Test that a schema change run through execute is seen by the next search."""
+        connector, calls = self._connector()
+        connector._is_connected = True
+
+        await connector.search_objects()
+        await connector.execute("SELECT 1")
+        await connector.search_objects()
+        await connector.execute("CREATE TABLE t (id int)")
+        await connector.search_objects()
+
+        assert len(calls) == 2
+
+    async def test_search_overlapping_ddl_is_not_cached(self):
+        """Test that a search still running when DDL finishes does not cache its result."""
+        connector, _ = self._connector()
+        connector._is_connected = True
+        release = asyncio.Event()
+
+        async def slow_search(options=None):
+            await release.wait()
+            return [SchemaObject(type="schema", name="old")]
+
+        connector._search_objects = slow_search  # type: ignore[method-assign]
+        search = asyncio.create_task(connector.search_objects())
+        await asyncio.sleep(0)
+        await connector.execute("CREATE SCHEMA new_schema")
+        release.set()
+        await search
+
+        assert connector._search_cache == {}
+
+    async def test_zero_ttl_disables_cache(self):
+        """Test that schema_cache_ttl=0 always searches the database."""
+        connector, calls = self._connector(ttl=0)
+
+        await connector.search_objects()
+        await connector.search_objects()
 
+        assert len(calls) == 2
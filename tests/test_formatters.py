@@ -2,6 +2,7 @@
 
 import json
 import pytest
+from opendb_mcp.constants import CHARACTER_LIMIT
 from opendb_mcp.utils.formatters import (
     QueryResult,
     SchemaObject,
@@ -31,6 +32,50 @@ class TestQueryResultFormatting:
         assert "| 2 | Bob |" in output
         assert "_Showing 2 of 2 rows_" in output
 
+    def test_markdown_single_column_escapes_cells(self):
+        result = QueryResult(
+            columns=["note"],
+            rows=[{"note": "a|b\nc"}, {"note": None}],
+            row_count=2,
+            truncated=False,
+        )
+        output = format_query_results(result, "markdown")
+        assert "| a\\|b c |" in output
+        assert "| _null_ |" in output
+
+    def test_markdown_missing_column_renders_null(self):
+        result = QueryResult(
+            columns=["id", "name"],
+            rows=[{"id": 1, "name": "Alice"}, {"id": 2}],
+            row_count=2,
+            truncated=False,
+        )
+        output = format_query_results(result, "markdown")
+        assert "| 1 | Alice |" in output
+        assert "| 2 | _null_ |" in output
+
+    def test_markdown_stops_formatting_rows_past_character_limit(self):
+        rows = [{"id": i, "name": "x" * 100} for i in range(5000)]
+        result = QueryResult(columns=["id", "name"], rows=rows, row_count=5000, truncated=False)
+
+        output = format_query_results(result, "markdown")
+
+        assert len(output) <= CHARACTER_LIMIT
+        assert output.endswith("_Output truncated due to character limit_")
+        assert "| 0 | " in output
+        assert "| 4999 | " not in output
+
+    def test_markdown_formats_mixed_cell_types(self):
+        result = QueryResult(
+            columns=["v"],
+            rows=[{"v": 1}, {"v": 2.5}, {"v": True}, {"v": {"k": 1}}, {"v": [1]}, {"v": "x|y"}],
+            row_count=6,
+            truncated=False,
+        )
+        output = format_query_results(result, "markdown")
+        for cell in ("| 1 |", "| 2.5 |", "| True |", '| {"k": 1} |', "| [1] |", "| x\\|y |"):
+            assert cell in output
+
     def test_json_output(self):
         result = QueryResult(
             columns=["id", "name"],
@@ -44,6 +89,7 @@ class TestQueryResultFormatting:
         assert len(data["rows"]) == 1
         assert data["rowCount"] == 1
         assert data["truncated"] is False
+        assert output.startswith('{\n  "columns"')
 
     def test_empty_results(self):
         result = QueryResult(columns=[], rows=[], row_count=0, truncated=False)
@@ -100,10 +146,42 @@ class TestSchemaObjectFormatting:
         assert "| id | integer | No | Yes |" in output
         assert "| name | text | Yes | No |" in output
 
+    def test_json_output(self):
+        objects = [
+            SchemaObject(
+                type="column",
+                name="id",
+                schema="public",
+                table="users",
+                data_type="integer",
+                nullable=False,
+                primary_key=True,
+                extra={"ignored": object()},
+            ),
+        ]
+        output = format_schema_objects(objects, "json")
+        assert json.loads(output) == [
+            {
+                "type": "column",
+                "name": "id",
+                "schema": "public",
+                "table": "users",
+                "dataType": "integer",
+                "nullable": False,
+                "primaryKey": True,
+            }
+        ]
+
     def test_empty_objects(self):
         output = format_schema_objects([], "markdown")
         assert "_No objects found_" in output
 
+    def test_schema_object_is_slotted_and_frozen(self):
+        obj = SchemaObject(type="table", name="users")
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.name = "orders"  # type: ignore[misc]
+
 
 class TestSourcesListFormatting:
     """Tests for sources list formatting."""
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import sys
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,6 +12,50 @@ from opendb_mcp.services.kerberos import KerberosAuth, KerberosConfig
 from opendb_mcp.utils.errors import KerberosError
 
 
+def set_ticket_expiry(auth, expiry):
+    """Record a ticket expiry the way _kinit does after klist."""
+    auth._ticket_expiry = expiry
+    auth._refresh_deadline = None if expiry is None else auth._refresh_deadline_for(expiry)
+
+
+@pytest.fixture(scope="module")
+def keytab_file(tmp_path_factory):
+    """Write a placeholder keytab once for every test in this module (never modified)."""
+    path = tmp_path_factory.mktemp("keytab") / "test.keytab"
+    path.write_bytes(b"test keytab content")
+    return path
+
+
+@pytest.fixture
+def mock_subprocess(monkeypatch):
+    """Replace asyncio.create_subprocess_exec with a mock whose process exits cleanly."""
+    process = MagicMock()
+    process.returncode = 0
+    process.communicate = AsyncMock(return_value=(b"", b""))
+    process.wait = AsyncMock(return_value=0)
+    create = AsyncMock(return_value=process)
+    monkeypatch.setattr("asyncio.create_subprocess_exec", create)
+    return create
+
+
+@pytest.fixture
+def auth():
+    """Create a KerberosAuth without a custom krb5.conf."""
+    return KerberosAuth(KerberosConfig(keytab="/path/to/keytab", principal="user@REALM"))
+
+
+@pytest.fixture
+def auth_with_krb5_conf():
+    """Create a KerberosAuth pointing at a custom krb5.conf."""
+    return KerberosAuth(
+        KerberosConfig(
+            keytab="/path/to/keytab",
+            principal="user@REALM",
+            krb5_conf="/custom/krb5.conf",
+        )
+    )
+
+
 class TestKerberosConfig:
     """Tests for KerberosConfig dataclass."""
 
@@ -34,242 +79,200 @@ class TestKerberosConfig:
 class TestKerberosAuthEnv:
     """Tests for KerberosAuth environment variable handling."""
 
-    def test_get_env_with_krb5_config_returns_none_when_not_set(self):
+    def test_get_env_with_krb5_config_returns_none_when_not_set(self, auth):
         """Test that _get_env_with_krb5_config returns None when krb5_conf is not set."""
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
 
         result = auth._get_env_with_krb5_config()
 
         assert result is None
 
-    def test_get_env_with_krb5_config_returns_env_with_krb5_config(self):
+    def test_get_env_with_krb5_config_returns_env_with_krb5_config(self, auth_with_krb5_conf):
         """Test that _get_env_with_krb5_config returns env with KRB5_CONFIG set."""
-        config = KerberosConfig(
-            keytab="/path/to/keytab",
-            principal="user@REALM",
-            krb5_conf="/custom/krb5.conf",
-        )
-        auth = KerberosAuth(config)
 
-        result = auth._get_env_with_krb5_config()
+        result = auth_with_krb5_conf._get_env_with_krb5_config()
 
         assert result is not None
         assert result["KRB5_CONFIG"] == "/custom/krb5.conf"
         # Verify other env vars are preserved
         assert "PATH" in result
 
-    def test_get_env_with_krb5_config_does_not_modify_os_environ(self):
+    def test_get_env_with_krb5_config_does_not_modify_os_environ(self, auth_with_krb5_conf):
         """Test that _get_env_with_krb5_config does not modify os.environ."""
         original_krb5_config = os.environ.get("KRB5_CONFIG")
-        config = KerberosConfig(
-            keytab="/path/to/keytab",
-            principal="user@REALM",
-            krb5_conf="/custom/krb5.conf",
-        )
-        auth = KerberosAuth(config)
 
-        auth._get_env_with_krb5_config()
+        auth_with_krb5_conf._get_env_with_krb5_config()
 
         # Verify os.environ was not modified
         assert os.environ.get("KRB5_CONFIG") == original_krb5_config
 
+    def test_get_env_with_krb5_config_is_built_once(self, auth_with_krb5_conf):
+        """Test that the environment copy is reused across subprocess calls."""
+        first = auth_with_krb5_conf._get_env_with_krb5_config()
+
+        assert auth_with_krb5_conf._get_env_with_krb5_config() is first
+
 
 class TestKerberosAuthKinit:
     """Tests for KerberosAuth kinit with KRB5_CONFIG."""
 
     @pytest.mark.asyncio
-    async def test_kinit_passes_env_when_krb5_conf_set(self, tmp_path):
+    async def test_kinit_passes_env_when_krb5_conf_set(
+        self, auth_with_krb5_conf, keytab_file, mock_subprocess
+    ):
         """Test that kinit receives env with KRB5_CONFIG when krb5_conf is set."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
-        config = KerberosConfig(
-            keytab=str(keytab_file),
-            principal="user@REALM",
-            krb5_conf="/custom/krb5.conf",
-        )
-        auth = KerberosAuth(config)
-
-        captured_env = None
-
-        async def mock_subprocess(*args, **kwargs):
-            nonlocal captured_env
-            captured_env = kwargs.get("env")
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(return_value=(b"", b""))
-            return mock_process
-
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess):
-            await auth._kinit(str(keytab_file), "user@REALM")
+        await auth_with_krb5_conf._kinit(str(keytab_file), "user@REALM")
 
+        captured_env = mock_subprocess.await_args.kwargs["env"]
         assert captured_env is not None
         assert captured_env["KRB5_CONFIG"] == "/custom/krb5.conf"
 
     @pytest.mark.asyncio
-    async def test_kinit_passes_none_env_when_krb5_conf_not_set(self, tmp_path):
+    async def test_kinit_passes_none_env_when_krb5_conf_not_set(
+        self, auth, keytab_file, mock_subprocess
+    ):
         """Test that kinit receives env=None when krb5_conf is not set."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
-        config = KerberosConfig(
-            keytab=str(keytab_file),
-            principal="user@REALM",
-        )
-        auth = KerberosAuth(config)
+        await auth._kinit(str(keytab_file), "user@REALM")
 
-        captured_env = "not_called"
+        assert mock_subprocess.await_args.kwargs["env"] is None
 
-        async def mock_subprocess(*args, **kwargs):
-            nonlocal captured_env
-            captured_env = kwargs.get("env")
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(return_value=(b"", b""))
-            return mock_process
+    @pytest.mark.asyncio
+    async def test_kinit_sets_and_destroy_clears_refresh_deadline(
+        self, auth, keytab_file, mock_subprocess
+    ):
+        """Test that kinit records the refresh deadline and destroy drops it."""
+        expiry = datetime.now() + timedelta(hours=7)
+        auth._initialized = True
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess):
+        with patch.object(auth, "_get_ticket_expiry", AsyncMock(return_value=expiry)):
             await auth._kinit(str(keytab_file), "user@REALM")
 
-        assert captured_env is None
+        assert auth._ticket_expiry == expiry
+        assert auth._is_ticket_valid() is True
+
+        await auth.destroy()
+
+        assert auth._refresh_deadline is None
+        assert auth._is_ticket_valid() is False
 
 
 class TestKerberosAuthKdestroy:
     """Tests for KerberosAuth kdestroy with KRB5_CONFIG."""
 
     @pytest.mark.asyncio
-    async def test_kdestroy_passes_env_when_krb5_conf_set(self):
+    async def test_kdestroy_passes_env_when_krb5_conf_set(
+        self, auth_with_krb5_conf, mock_subprocess
+    ):
         """Test that kdestroy receives env with KRB5_CONFIG when krb5_conf is set."""
-        config = KerberosConfig(
-            keytab="/path/to/keytab",
-            principal="user@REALM",
-            krb5_conf="/custom/krb5.conf",
-        )
-        auth = KerberosAuth(config)
-
-        captured_env = None
-
-        async def mock_subprocess(*args, **kwargs):
-            nonlocal captured_env
-            captured_env = kwargs.get("env")
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(return_value=(b"", b""))
-            return mock_process
-
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess):
-            await auth._kdestroy()
+        await auth_with_krb5_conf._kdestroy()
 
+        captured_env = mock_subprocess.await_args.kwargs["env"]
         assert captured_env is not None
         assert captured_env["KRB5_CONFIG"] == "/custom/krb5.conf"
 
     @pytest.mark.asyncio
-    async def test_kdestroy_passes_none_env_when_krb5_conf_not_set(self):
+    async def test_kdestroy_passes_none_env_when_krb5_conf_not_set(self, auth, mock_subprocess):
         """Test that kdestroy receives env=None when krb5_conf is not set."""
-        config = KerberosConfig(
-            keytab="/path/to/keytab",
-            principal="user@REALM",
-        )
-        auth = KerberosAuth(config)
+        await auth._kdestroy()
 
-        captured_env = "not_called"
+        assert mock_subprocess.await_args.kwargs["env"] is None
 
-        async def mock_subprocess(*args, **kwargs):
-            nonlocal captured_env
-            captured_env = kwargs.get("env")
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(return_value=(b"", b""))
-            return mock_process
+    @pytest.mark.asyncio
+    async def test_kdestroy_discards_output_and_reports_failure(self, auth):
+        """Test that kdestroy output goes to DEVNULL and a nonzero exit raises."""
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess):
-            await auth._kdestroy()
+        mock_process = MagicMock()
+        mock_process.wait = AsyncMock(return_value=1)
+        create = AsyncMock(return_value=mock_process)
+
+        with patch("asyncio.create_subprocess_exec", create):
+            with pytest.raises(KerberosError, match="code 1"):
+                await auth._kdestroy()
 
-        assert captured_env is None
+        kwargs = create.await_args.kwargs
+        assert kwargs["stdout"] == kwargs["stderr"] == asyncio.subprocess.DEVNULL
 
 
 class TestKerberosAuthGetTicketExpiry:
     """Tests for KerberosAuth _get_ticket_expiry with KRB5_CONFIG."""
 
     @pytest.mark.asyncio
-    async def test_get_ticket_expiry_passes_env_when_krb5_conf_set(self):
+    async def test_get_ticket_expiry_passes_env_when_krb5_conf_set(
+        self, auth_with_krb5_conf, mock_subprocess
+    ):
         """Test that klist receives env with KRB5_CONFIG when krb5_conf is set."""
-        config = KerberosConfig(
-            keytab="/path/to/keytab",
-            principal="user@REALM",
-            krb5_conf="/custom/krb5.conf",
-        )
-        auth = KerberosAuth(config)
+        await auth_with_krb5_conf._get_ticket_expiry()
 
-        captured_env = None
+        captured_env = mock_subprocess.await_args.kwargs["env"]
+        assert captured_env is not None
+        assert captured_env["KRB5_CONFIG"] == "/custom/krb5.conf"
 
-        async def mock_subprocess(*args, **kwargs):
-            nonlocal captured_env
-            captured_env = kwargs.get("env")
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.communicate = AsyncMock(return_value=(b"", b""))
-            return mock_process
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "output, expected",
+        [
+            (b"krbtgt/REALM@REALM  01/02/2025 03:04:05", datetime(2025, 1, 2, 3, 4, 5)),
+            (b"Expires: 2025-01-02T03:04:05", datetime(2025, 1, 2, 3, 4, 5)),
+        ],
+    )
+    async def test_parses_klist_expiry_formats(self, auth, output, expected):
+        """Test that both MM/DD/YYYY and ISO klist dates are parsed."""
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_subprocess):
-            await auth._get_ticket_expiry()
+        mock_process = MagicMock()
+        mock_process.returncode = 0
+        mock_process.communicate = AsyncMock(return_value=(output, b""))
 
-        assert captured_env is not None
-        assert captured_env["KRB5_CONFIG"] == "/custom/krb5.conf"
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=mock_process)):
+            assert await auth._get_ticket_expiry() == expected
 
 
 class TestIsTicketValid:
     """Tests for KerberosAuth._is_ticket_valid()."""
 
-    def test_returns_false_when_not_initialized(self):
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
-
+    def test_returns_false_when_not_initialized(self, auth):
         assert auth._is_ticket_valid() is False
 
-    def test_returns_false_when_no_expiry(self):
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
+    def test_returns_false_when_no_expiry(self, auth):
         auth._initialized = True
-        auth._ticket_expiry = None
+        set_ticket_expiry(auth, None)
 
         assert auth._is_ticket_valid() is False
 
-    def test_returns_false_when_expired(self):
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
+    def test_returns_false_when_expired(self, auth):
         auth._initialized = True
-        auth._ticket_expiry = datetime.now() - timedelta(hours=1)
+        set_ticket_expiry(auth, datetime.now() - timedelta(hours=1))
 
         assert auth._is_ticket_valid() is False
 
-    def test_returns_false_when_within_buffer(self):
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
+    def test_returns_false_when_within_buffer(self, auth):
         auth._initialized = True
         # Expires in 3 minutes — within the 5-minute buffer
-        auth._ticket_expiry = datetime.now() + timedelta(minutes=3)
+        set_ticket_expiry(auth, datetime.now() + timedelta(minutes=3))
 
         assert auth._is_ticket_valid() is False
 
-    def test_returns_true_when_well_before_expiry(self):
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
+    def test_returns_true_when_well_before_expiry(self, auth):
         auth._initialized = True
-        auth._ticket_expiry = datetime.now() + timedelta(hours=7)
+        set_ticket_expiry(auth, datetime.now() + timedelta(hours=7))
 
         assert auth._is_ticket_valid() is True
 
-    def test_is_valid_delegates_to_is_ticket_valid(self):
-        config = KerberosConfig(keytab="/path/to/keytab", principal="user@REALM")
-        auth = KerberosAuth(config)
+    def test_validity_follows_monotonic_clock(self, auth):
         auth._initialized = True
-        auth._ticket_expiry = datetime.now() + timedelta(hours=7)
+        set_ticket_expiry(auth, datetime.now() + timedelta(hours=1))
+        deadline = auth._refresh_deadline
+
+        with patch("opendb_mcp.services.kerberos.time.monotonic", return_value=deadline - 1):
+            assert auth._is_ticket_valid() is True
+        with patch("opendb_mcp.services.kerberos.time.monotonic", return_value=deadline):
+            assert auth._is_ticket_valid() is False
+
+    def test_is_valid_delegates_to_is_ticket_valid(self, auth):
+        auth._initialized = True
+        set_ticket_expiry(auth, datetime.now() + timedelta(hours=7))
 
         assert auth.is_valid() is True
 
-        auth._ticket_expiry = datetime.now() - timedelta(hours=1)
+        set_ticket_expiry(auth, datetime.now() - timedelta(hours=1))
         assert auth.is_valid() is False
 
 
@@ -277,56 +280,64 @@ class TestEnsureValid:
     """Tests for KerberosAuth.ensure_valid()."""
 
     @pytest.mark.asyncio
-    async def test_skips_kinit_when_ticket_valid(self, tmp_path):
+    async def test_skips_kinit_when_ticket_valid(self, keytab_file):
         """ensure_valid() should not run kinit when ticket is still valid."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
         auth._initialized = True
-        auth._ticket_expiry = datetime.now() + timedelta(hours=7)
+        set_ticket_expiry(auth, datetime.now() + timedelta(hours=7))
 
         with patch.object(auth, "_kinit", new_callable=AsyncMock) as mock_kinit:
             await auth.ensure_valid()
             mock_kinit.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_runs_kinit_when_expired(self, tmp_path):
+    async def test_runs_kinit_when_expired(self, keytab_file):
         """ensure_valid() should run kinit when ticket is expired."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
         auth._initialized = True
-        auth._ticket_expiry = datetime.now() - timedelta(hours=1)
+        set_ticket_expiry(auth, datetime.now() - timedelta(hours=1))
 
         with patch.object(auth, "_kinit", new_callable=AsyncMock) as mock_kinit:
             await auth.ensure_valid()
             mock_kinit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_runs_kinit_when_near_expiry(self, tmp_path):
+    async def test_runs_kinit_when_near_expiry(self, keytab_file):
         """ensure_valid() should run kinit when ticket is within buffer."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
         auth._initialized = True
-        auth._ticket_expiry = datetime.now() + timedelta(minutes=3)
+        set_ticket_expiry(auth, datetime.now() + timedelta(minutes=3))
 
         with patch.object(auth, "_kinit", new_callable=AsyncMock) as mock_kinit:
             await auth.ensure_valid()
             mock_kinit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_runs_kinit_when_not_initialized(self, tmp_path):
-        """ensure_valid() should run kinit when not yet initialized."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
+    @pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need extra privileges on Windows")
+    async def test_follows_rotated_keytab_symlink(self, tmp_path):
+        """ensure_valid() should hand kinit the link, not a target resolved earlier."""
+        old_keytab = tmp_path / "old.keytab"
+        new_keytab = tmp_path / "new.keytab"
+        old_keytab.write_bytes(b"old")
+        new_keytab.write_bytes(b"new")
+        link = tmp_path / "current.keytab"
+        link.symlink_to(old_keytab)
+
+        auth = KerberosAuth(KerberosConfig(keytab=str(link), principal="user@REALM"))
+        link.unlink()
+        link.symlink_to(new_keytab)
 
+        with patch.object(auth, "_kinit", new_callable=AsyncMock) as mock_kinit:
+            await auth.ensure_valid()
+
+        assert mock_kinit.await_args.args[0] == str(link)
+
+    @pytest.mark.asyncio
+    async def test_runs_kinit_when_not_initialized(self, keytab_file):
+        """ensure_valid() should run kinit when not yet initialized."""
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
 
@@ -336,11 +347,8 @@ class TestEnsureValid:
             assert auth._initialized is True
 
     @pytest.mark.asyncio
-    async def test_raises_on_kinit_failure(self, tmp_path):
+    async def test_raises_on_kinit_failure(self, keytab_file):
         """ensure_valid() should raise KerberosError when kinit fails."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
 
@@ -351,11 +359,8 @@ class TestEnsureValid:
                 await auth.ensure_valid()
 
     @pytest.mark.asyncio
-    async def test_self_heals_on_retry_after_failure(self, tmp_path):
+    async def test_self_heals_on_retry_after_failure(self, keytab_file):
         """After a kinit failure, the next ensure_valid() call should retry."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
 
@@ -377,11 +382,8 @@ class TestInitializeWithoutGuard:
     """Tests that initialize() can be called multiple times."""
 
     @pytest.mark.asyncio
-    async def test_initialize_can_be_called_twice(self, tmp_path):
+    async def test_initialize_can_be_called_twice(self, keytab_file):
         """initialize() should run kinit even if already initialized."""
-        keytab_file = tmp_path / "test.keytab"
-        keytab_file.write_bytes(b"test keytab content")
-
         config = KerberosConfig(keytab=str(keytab_file), principal="user@REALM")
         auth = KerberosAuth(config)
 
@@ -4,6 +4,7 @@ import base64
 import os
 import stat
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +15,21 @@ from opendb_mcp.config.keytab import (
     write_keytab_file,
 )
 
+# Payloads shared across tests, encoded once at import
+HIVE_KEYTAB = b"hive keytab data"
+HIVE_KEYTAB_B64 = base64.b64encode(HIVE_KEYTAB).decode("ascii")
+ALL_BYTES = bytes(range(256))
+ALL_BYTES_B64 = base64.b64encode(ALL_BYTES).decode("ascii")
+
+# Keytab permission bits are POSIX mode bits; Windows does not honour them
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+
+
+@pytest.fixture(scope="class")
+def shared_base_dir(tmp_path_factory):
+    """Base directory shared by a class's tests that never write a keytab."""
+    return tmp_path_factory.mktemp("keytab-base")
+
 
 class TestDecodeKeytabContent:
     """Tests for decode_keytab_content function."""
@@ -21,7 +37,7 @@ class TestDecodeKeytabContent:
     def test_valid_base64(self):
         """Test decoding valid base64 content."""
         original = b"test keytab content"
-        encoded = base64.b64encode(original).decode("utf-8")
+        encoded = base64.b64encode(original).decode("ascii")
 
         result = decode_keytab_content(encoded, "test-source")
 
@@ -29,12 +45,9 @@ class TestDecodeKeytabContent:
 
     def test_valid_base64_binary_data(self):
         """Test decoding base64-encoded binary data."""
-        original = bytes(range(256))  # All byte values
-        encoded = base64.b64encode(original).decode("utf-8")
+        result = decode_keytab_content(ALL_BYTES_B64, "test-source")
 
-        result = decode_keytab_content(encoded, "test-source")
-
-        assert result == original
+        assert result == ALL_BYTES
 
     def test_invalid_base64_raises_error(self):
         """Test that invalid base64 raises KeytabError."""
@@ -48,7 +61,7 @@ class TestDecodeKeytabContent:
 
     def test_empty_content(self):
         """Test decoding empty base64 content."""
-        encoded = base64.b64encode(b"").decode("utf-8")
+        encoded = base64.b64encode(b"").decode("ascii")
 
         result = decode_keytab_content(encoded, "test-source")
 
@@ -69,6 +82,7 @@ class TestWriteKeytabFile:
         assert result.exists()
         assert result.read_bytes() == keytab_bytes
 
+    @posix_only
     def test_file_written_with_755_permissions(self, tmp_path):
         """Test keytab file has 755 permissions."""
         keytab_dir = tmp_path / "keytabs"
@@ -107,51 +121,43 @@ class TestWriteKeytabFile:
 
         assert result.read_bytes() == new_content
 
+    @posix_only
+    def test_overwrite_resets_permissions(self, tmp_path):
+        """Test that overwriting an existing keytab file restores 755 permissions."""
+        keytab_dir = tmp_path / "keytabs"
+        keytab_dir.mkdir(parents=True)
+        existing_path = keytab_dir / "test-source.keytab"
+        existing_path.write_bytes(b"old content")
+        existing_path.chmod(0o600)
 
-class TestProcessKeytabContents:
-    """Tests for process_keytab_contents function."""
-
-    def test_processes_hive_source_with_keytab_content(self, tmp_path):
-        """Test processing Hive source with keytab_content."""
-        original = b"hive keytab data"
-        encoded = base64.b64encode(original).decode("utf-8")
+        result = write_keytab_file(b"new keytab content", keytab_dir, "test-source")
 
-        sources_data = [
-            {
-                "id": "hive-source",
-                "type": "hive",
-                "host": "hive.example.com",
-                "keytab_content": encoded,
-            }
-        ]
+        assert result.stat().st_mode & 0o777 == 0o755
 
-        result = process_keytab_contents(sources_data, tmp_path)
 
-        assert result[0]["keytab"] == str(tmp_path / "keytabs" / "hive-source.keytab")
-        assert Path(result[0]["keytab"]).read_bytes() == original
-
-    def test_processes_impala_source_with_keytab_content(self, tmp_path):
-        """Test processing Impala source with keytab_content."""
-        original = b"impala keytab data"
-        encoded = base64.b64encode(original).decode("utf-8")
+class TestProcessKeytabContents:
+    """Tests for process_keytab_contents function."""
 
+    @pytest.mark.parametrize("source_type", ["hive", "impala"])
+    def test_processes_source_with_keytab_content(self, tmp_path, source_type):
+        """Test processing Hive and Impala sources with keytab_content."""
         sources_data = [
             {
-                "id": "impala-source",
-                "type": "impala",
-                "host": "impala.example.com",
-                "keytab_content": encoded,
+                "id": f"{source_type}-source",
+                "type": source_type,
+                "host": f"{source_type}.example.com",
+                "keytab_content": HIVE_KEYTAB_B64,
             }
         ]
 
         result = process_keytab_contents(sources_data, tmp_path)
 
-        assert result[0]["keytab"] == str(tmp_path / "keytabs" / "impala-source.keytab")
-        assert Path(result[0]["keytab"]).read_bytes() == original
+        assert result[0]["keytab"] == str(tmp_path / "keytabs" / f"{source_type}-source.keytab")
+        assert Path(result[0]["keytab"]).read_bytes() == HIVE_KEYTAB
 
-    def test_ignores_non_hive_impala_sources(self, tmp_path):
+    def test_ignores_non_hive_impala_sources(self, shared_base_dir):
         """Test that non-Hive/Impala sources are not processed."""
-        encoded = base64.b64encode(b"data").decode("utf-8")
+        encoded = base64.b64encode(b"data").decode("ascii")
 
         sources_data = [
             {
@@ -162,12 +168,12 @@ class TestProcessKeytabContents:
             }
         ]
 
-        result = process_keytab_contents(sources_data, tmp_path)
+        result = process_keytab_contents(sources_data, shared_base_dir)
 
         # keytab should not be set
         assert "keytab" not in result[0] or result[0].get("keytab") is None
 
-    def test_ignores_sources_without_keytab_content(self, tmp_path):
+    def test_ignores_sources_without_keytab_content(self, shared_base_dir):
         """Test that sources without keytab_content are not modified."""
         sources_data = [
             {
@@ -178,14 +184,14 @@ class TestProcessKeytabContents:
             }
         ]
 
-        result = process_keytab_contents(sources_data, tmp_path)
+        result = process_keytab_contents(sources_data, shared_base_dir)
 
         assert result[0]["keytab"] == "/existing/keytab.keytab"
 
     def test_keytab_content_takes_precedence_over_keytab(self, tmp_path):
         """Test that keytab_content takes precedence over existing keytab."""
         original = b"new keytab content"
-        encoded = base64.b64encode(original).decode("utf-8")
+        encoded = base64.b64encode(original).decode("ascii")
 
         sources_data = [
             {
@@ -203,7 +209,7 @@ class TestProcessKeytabContents:
         assert result[0]["keytab"] == str(tmp_path / "keytabs" / "hive-source.keytab")
         assert Path(result[0]["keytab"]).read_bytes() == original
 
-    def test_preserves_keytab_when_no_keytab_content(self, tmp_path):
+    def test_preserves_keytab_when_no_keytab_content(self, shared_base_dir):
         """Test that existing keytab is preserved when no keytab_content."""
         sources_data = [
             {
@@ -214,7 +220,7 @@ class TestProcessKeytabContents:
             }
         ]
 
-        result = process_keytab_contents(sources_data, tmp_path)
+        result = process_keytab_contents(sources_data, shared_base_dir)
 
         assert result[0]["keytab"] == "/etc/security/keytabs/user.keytab"
 
@@ -228,7 +234,7 @@ class TestProcessKeytabContents:
                 "id": "hive-source",
                 "type": "hive",
                 "host": "hive.example.com",
-                "keytab_content": base64.b64encode(hive_content).decode("utf-8"),
+                "keytab_content": base64.b64encode(hive_content).decode("ascii"),
             },
             {
                 "id": "postgres-source",
@@ -239,7 +245,7 @@ class TestProcessKeytabContents:
                 "id": "impala-source",
                 "type": "impala",
                 "host": "impala.example.com",
-                "keytab_content": base64.b64encode(impala_content).decode("utf-8"),
+                "keytab_content": base64.b64encode(impala_content).decode("ascii"),
             },
         ]
 
@@ -264,3 +270,56 @@ class TestProcessKeytabContents:
             process_keytab_contents(sources_data, tmp_path)
 
         assert "hive-source" in str(exc_info.value)
+
+    def test_skips_rewrite_when_content_unchanged(self, tmp_path):
+        """Test that an unchanged keytab is not decoded or rewritten."""
+        sources_data = [{"id": "hive-source", "type": "hive", "keytab_content": HIVE_KEYTAB_B64}]
+
+        process_keytab_contents(sources_data, tmp_path)
+        keytab_path = tmp_path / "keytabs" / "hive-source.keytab"
+        mtime = keytab_path.stat().st_mtime_ns
+
+        with patch("opendb_mcp.config.keytab.write_keytab_file") as mock_write:
+            result = process_keytab_contents(
+                [{"id": "hive-source", "type": "hive", "keytab_content": HIVE_KEYTAB_B64}], tmp_path
+            )
+
+        mock_write.assert_not_called()
+        assert result[0]["keytab"] == str(keytab_path)
+        assert keytab_path.stat().st_mtime_ns == mtime
+
+    def test_rewrites_when_content_changes(self, tmp_path):
+        """Test that a changed keytab_content is written again."""
+        old = base64.b64encode(b"old keytab").decode("ascii")
+        new = base64.b64encode(b"new keytab").decode("ascii")
+
+        process_keytab_contents([{"id": "hive-source", "type": "hive", "keytab_content": old}], tmp_path)
+        result = process_keytab_contents(
+            [{"id": "hive-source", "type": "hive", "keytab_content": new}], tmp_path
+        )
+
+        assert Path(result[0]["keytab"]).read_bytes() == b"new keytab"
+
+    def test_rewrites_when_keytab_file_missing(self, tmp_path):
+        """Test that a deleted keytab file is recreated even if the fingerprint matches."""
+        sources = [{"id": "hive-source", "type": "hive", "keytab_content": HIVE_KEYTAB_B64}]
+
+        process_keytab_contents(sources, tmp_path)
+        (tmp_path / "keytabs" / "hive-source.keytab").unlink()
+        result = process_keytab_contents(
+            [{"id": "hive-source", "type": "hive", "keytab_content": HIVE_KEYTAB_B64}], tmp_path
+        )
+
+        assert Path(result[0]["keytab"]).read_bytes() == HIVE_KEYTAB
+
+    def test_rewrites_when_keytab_file_modified(self, tmp_path):
+        """Test that a truncated keytab file is rewritten even if the fingerprint matches."""
+        sources = [{"id": "hive-source", "type": "hive", "keytab_content": HIVE_KEYTAB_B64}]
+
+        process_keytab_contents(sources, tmp_path)
+        (tmp_path / "keytabs" / "hive-source.keytab").write_bytes(HIVE_KEYTAB[:4])
+        result = process_keytab_contents(
+            [{"id": "hive-source", "type": "hive", "keytab_content": HIVE_KEYTAB_B64}], tmp_path
+        )
+
+        assert Path(result[0]["keytab"]).read_bytes() == HIVE_KEYTAB
@@ -0,0 +1,83 @@
+"""Tests for the stderr logger."""
+
+import logging
+
+import pytest
+
+from opendb_mcp.utils.logger import Logger
+
+
+@pytest.fixture
+def log():
+    """Create an info-level logger writing to stderr."""
+    return Logger(name="opendb-mcp-test", level="info")
+
+
+class TestLogger:
+    """Tests for Logger formatting."""
+
+    def test_percent_args_are_formatted(self, log, capsys):
+        """Test that %-style args are interpolated into the message."""
+        log.info("Loaded %d source(s) from %s", 2, "opendb.toml")
+
+        assert "Loaded 2 source(s) from opendb.toml" in capsys.readouterr().err
+
+    def test_meta_is_appended(self, log, capsys):
+        """Test that dict metadata is appended as JSON."""
+        log.warning("Query failed", meta={"sql": "SELECT '%'"})
+
+        assert 'Query failed {"sql": "SELECT \'%\'"}' in capsys.readouterr().err
+
+    def test_percent_in_message_without_args(self, log, capsys):
+        """Test that a literal % is left alone when no args are given."""
+        log.info("LIKE 'abc%'")
+
+        assert "LIKE 'abc%'" in capsys.readouterr().err
+
+    def test_meta_with_args_keeps_percent(self, log, capsys):
+        """Test that a % in metadata is not treated as a placeholder."""
+        log.warning("Query failed on %s", "pg", meta={"sql": "SELECT '%'"})
+
+        assert 'Query failed on pg {"sql": "SELECT \'%\'"}' in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "message,args",
+        [("Loaded 100% of %s", ("opendb.toml",)), ("progress 100%", ("done",))],
+    )
+    def test_bad_format_does_not_raise(self, log, monkeypatch, message, args):
+        """Test that a message/args mismatch is left to logging's handleError."""
+        # pytest's capture handlers re-raise emit errors while raiseExceptions is set
+        monkeypatch.setattr(logging, "raiseExceptions", False)
+
+        log.info(message, *args)
+
+    def test_disabled_level_skips_formatting(self, log, capsys):
+        """Test that args are not formatted when the level is disabled."""
+
+        class Unformattable:
+            def __str__(self):
+                raise AssertionError("should not be formatted")
+
+        log.debug("Value: %s", Unformattable(), meta=Unformattable())
+
+        assert capsys.readouterr().err == ""
+
+    def test_exception_meta_includes_traceback(self, log, capsys):
+        """Test that exception metadata is rendered with its traceback."""
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            log.error("Failed", meta=e)
+
+        err = capsys.readouterr().err
+        assert "Failed" in err
+        assert "ValueError: boom" in err
+
+    def test_is_enabled_for(self, log):
+        """Test level checks used to skip building debug-only log data."""
+        log.set_level("info")
+        assert log.is_enabled_for("info") is True
+        assert log.is_enabled_for("debug") is False
+
+        log.set_level("debug")
+        assert log.is_enabled_for("DEBUG") is True
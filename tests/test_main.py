@@ -0,0 +1,50 @@
+"""Tests for the command-line entry point."""
+
+import asyncio
+import signal
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+
+from opendb_mcp.__main__ import run_server
+
+
+@pytest.mark.asyncio
+class TestRunServer:
+    """Tests for run_server."""
+
+    async def test_stops_server_when_start_returns(self):
+        """Test that the server is stopped and no helper task is left running."""
+        server = AsyncMock()
+
+        await run_server(server)
+
+        server.start.assert_awaited_once()
+        server.stop.assert_awaited_once()
+        leftover = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert leftover == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="signal handlers are Unix-only")
+    async def test_shutdown_error_in_cancelled_server_is_not_raised(self, monkeypatch):
+        """Test that a stop signal still stops the server when start() fails on cancel."""
+        handlers = {}
+
+        def add_signal_handler(sig, callback):
+            handlers[sig] = callback
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "add_signal_handler", add_signal_handler)
+
+        async def start():
+            handlers[signal.SIGTERM]()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                raise RuntimeError("transport closed during shutdown")
+
+        server = AsyncMock()
+        server.start = start
+
+        await run_server(server)
+
+        server.stop.assert_awaited_once()
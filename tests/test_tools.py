@@ -1,6 +1,5 @@
 """Tests for MCP tools."""
 
-from unittest.mock import AsyncMock, MagicMock
 import pytest
 from opendb_mcp.connectors.base import ConnectorOptions, QueryResult
 from opendb_mcp.tools import (
@@ -14,39 +13,67 @@ from opendb_mcp.tools import (
 from opendb_mcp.utils.formatters import SchemaObject, SourceInfo
 
 
+QUERY_RESULT = QueryResult(
+    columns=["id", "name", "email"],
+    rows=[
+        {"id": 1, "name": "Alice", "email": "alice@example.com"},
+        {"id": 2, "name": "Bob", "email": "bob@example.com"},
+    ],
+    row_count=2,
+)
+
+SCHEMA_OBJECTS = (
+    SchemaObject(type="table", name="users", schema="public"),
+    SchemaObject(type="column", name="id", schema="public", table="users", data_type="integer"),
+    SchemaObject(type="column", name="name", schema="public", table="users", data_type="text"),
+    SchemaObject(type="column", name="email", schema="public", table="users", data_type="text"),
+)
+
+
+class StubConnector:
+    """Connector stand-in exposing only what the tools use."""
+
+    source_id = "test-db"
+    db_type = "postgres"
+    is_connected = True
+
+    def __init__(self):
+        self.options = ConnectorOptions(readonly=False, max_rows=100)
+        self.objects = SCHEMA_OBJECTS
+
+    async def execute(self, sql, options=None):
+        return QUERY_RESULT
+
+    async def search_objects(self, options=None):
+        return list(self.objects)
+
+
+class StubManager:
+    """Connector manager stand-in serving a single connector."""
+
+    def __init__(self, connector):
+        self.connector = connector
+
+    def resolve(self, source_id=None):
+        return self.connector
+
+    async def resolve_connected(self, source_id=None):
+        return self.connector
+
+    def list_sources(self):
+        return [SourceInfo(id="test-db", type="postgres", readonly=False, connected=True)]
+
+
 @pytest.fixture
-def mock_connector():
-    """Create a mock connector for testing."""
-    connector = MagicMock()
-    connector.db_type = "postgres"
-    connector.is_connected = True
-    connector.options = ConnectorOptions(readonly=False, max_rows=100)
-    connector.execute = AsyncMock(return_value=QueryResult(
-        columns=["id", "name", "email"],
-        rows=[
-            {"id": 1, "name": "Alice", "email": "alice@example.com"},
-            {"id": 2, "name": "Bob", "email": "bob@example.com"},
-        ],
-        row_count=2,
-    ))
-    connector.search_objects = AsyncMock(return_value=[
-        SchemaObject(type="table", name="users", schema="public"),
-        SchemaObject(type="column", name="id", schema="public", table="users", data_type="integer"),
-        SchemaObject(type="column", name="name", schema="public", table="users", data_type="text"),
-        SchemaObject(type="column", name="email", schema="public", table="users", data_type="text"),
-    ])
-    return connector
+def connector():
+    """Create a stub connector for testing."""
+    return StubConnector()
 
 
 @pytest.fixture
-def manager(mock_connector):
-    """Create a mock connector manager for testing."""
-    mgr = MagicMock()
-    mgr.resolve = MagicMock(return_value=mock_connector)
-    mgr.list_sources = MagicMock(return_value=[
-        SourceInfo(id="test-db", type="postgres", readonly=False, connected=True)
-    ])
-    return mgr
+def manager(connector):
+    """Create a stub connector manager for testing."""
+    return StubManager(connector)
 
 
 @pytest.mark.asyncio
@@ -60,8 +87,8 @@ class TestExecuteSql:
             ExecuteSqlInput(sql="SELECT * FROM users ORDER BY id")
         )
         assert result.is_error is False
-        assert "Alice" in result.content[0]["text"]
-        assert "Bob" in result.content[0]["text"]
+        assert "Alice" in result.content[0].text
+        assert "Bob" in result.content[0].text
 
     async def test_empty_sql(self, manager):
         """Test error on empty SQL."""
@@ -70,7 +97,7 @@ class TestExecuteSql:
             ExecuteSqlInput(sql="")
         )
         assert result.is_error is True
-        assert "required" in result.content[0]["text"].lower()
+        assert "required" in result.content[0].text.lower()
 
     async def test_json_format(self, manager):
         """Test JSON response format."""
@@ -79,8 +106,8 @@ class TestExecuteSql:
             ExecuteSqlInput(sql="SELECT * FROM users WHERE id = 1", response_format="json")
         )
         assert result.is_error is False
-        assert '"columns"' in result.content[0]["text"]
-        assert '"rows"' in result.content[0]["text"]
+        assert '"columns"' in result.content[0].text
+        assert '"rows"' in result.content[0].text
 
 
 @pytest.mark.asyncio
@@ -94,23 +121,19 @@ class TestSearchObjects:
             SearchObjectsInput()
         )
         assert result.is_error is False
-        assert "users" in result.content[0]["text"]
+        assert "users" in result.content[0].text
 
-    async def test_search_columns(self, manager, mock_connector):
+    async def test_search_columns(self, manager, connector):
         """Test searching columns."""
-        mock_connector.search_objects = AsyncMock(return_value=[
-            SchemaObject(type="column", name="id", schema="public", table="users", data_type="integer"),
-            SchemaObject(type="column", name="name", schema="public", table="users", data_type="text"),
-            SchemaObject(type="column", name="email", schema="public", table="users", data_type="text"),
-        ])
+        connector.objects = tuple(obj for obj in SCHEMA_OBJECTS if obj.type == "column")
         result = await search_objects(
             manager,
             SearchObjectsInput(object_type="column", table="users")
         )
         assert result.is_error is False
-        assert "id" in result.content[0]["text"]
-        assert "name" in result.content[0]["text"]
-        assert "email" in result.content[0]["text"]
+        assert "id" in result.content[0].text
+        assert "name" in result.content[0].text
+        assert "email" in result.content[0].text
 
     async def test_column_without_table(self, manager):
         """Test error when searching columns without table."""
@@ -119,7 +142,7 @@ class TestSearchObjects:
             SearchObjectsInput(object_type="column")
         )
         assert result.is_error is True
-        assert "table" in result.content[0]["text"].lower()
+        assert "table" in result.content[0].text.lower()
 
 
 @pytest.mark.asyncio
@@ -133,8 +156,8 @@ class TestListSources:
             ListSourcesInput()
         )
         assert result.is_error is False
-        assert "test-db" in result.content[0]["text"]
-        assert "postgres" in result.content[0]["text"]
+        assert "test-db" in result.content[0].text
+        assert "postgres" in result.content[0].text
 
     async def test_json_format(self, manager):
         """Test JSON response format."""
@@ -143,5 +166,5 @@ class TestListSources:
             ListSourcesInput(response_format="json")
         )
         assert result.is_error is False
-        assert '"id"' in result.content[0]["text"]
-        assert '"type"' in result.content[0]["text"]
+        assert '"id"' in result.content[0].text
+        assert '"type"' in result.content[0].text